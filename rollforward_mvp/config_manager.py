@@ -10,16 +10,110 @@
 - 로그 보안 (민감한 정보 마스킹)
 """
 
+import copy
 import json
 import os
 import logging
+import operator
+import re
 import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
-from dataclasses import dataclass, asdict
+from typing import Dict, FrozenSet, List, Any, Optional, Pattern, Union
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
+from types import MappingProxyType
 import hashlib
-from jsonschema import validate, ValidationError, Draft7Validator
+
+# 선택 의존성: 설치되어 있으면 스키마를 코드로 컴파일하는 fastjsonschema 사용
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# 선택 의존성: 설치되어 있으면 C 구현 JSON 파서/직렬화기 orjson 사용
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 선택 의존성: security.regex_engine을 "re2"로 설정하면 선형 시간 정규식 엔진 RE2로 사용자 패턴 매칭
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+# 선택 의존성: 설치되어 있으면 화이트리스트 전체를 하나의 다중 패턴 DB로 컴파일
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+# jsonschema 지연 로드 캐시 (검증이 필요할 때만 import)
+_jsonschema = None
+
+
+def _lazy():
+    """jsonschema 모듈을 최초 사용 시 한 번만 import하여 반환"""
+    global _jsonschema
+    if _jsonschema is None:
+        import jsonschema
+        _jsonschema = jsonschema
+    return _jsonschema
+
+
+def _freeze(value):
+    """스키마를 읽기 전용 구조로 변환 (dict -> MappingProxyType, list -> tuple)"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value):
+    """읽기 전용 스키마를 검증 라이브러리가 요구하는 dict/list 구조로 복원"""
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+# 프로세스 전역 검증기 레지스트리: id(schema) -> (schema, 검증 함수, 검증 예외 클래스)
+# 스키마 객체를 값에 함께 보관하여 id가 재사용되지 않도록 함
+_VALIDATORS: Dict[int, tuple] = {}
+
+
+def _get_validator(schema: Dict):
+    """
+    스키마에 대응하는 (검증 함수, 검증 예외 클래스) 반환
+    
+    fastjsonschema가 있으면 스키마를 파이썬 함수로 컴파일하고,
+    없으면 스키마의 draft에 맞는 jsonschema 검증기(기본 Draft7)로 대체합니다.
+    컴파일 결과는 모든 ConfigManager 인스턴스가 공유합니다.
+    """
+    entry = _VALIDATORS.get(id(schema))
+    if entry is None:
+        # 읽기 전용 스키마는 컴파일 시 한 번만 일반 dict로 복원
+        plain_schema = _thaw(schema)
+        if fastjsonschema is not None:
+            entry = (schema, fastjsonschema.compile(plain_schema), fastjsonschema.JsonSchemaException)
+        else:
+            # 스키마의 draft 판별과 메타스키마 검사는 여기서 한 번만 수행
+            jsonschema = _lazy()
+            validator_cls = jsonschema.validators.validator_for(plain_schema, default=jsonschema.Draft7Validator)
+            validator_cls.check_schema(plain_schema)
+            entry = (schema, validator_cls(plain_schema).validate, jsonschema.ValidationError)
+        entry = _VALIDATORS.setdefault(id(schema), entry)
+    return entry[1], entry[2]
 
 
 @dataclass
@@ -30,13 +124,19 @@ class WorksheetProcessingRule:
     confidence_threshold: float
     auto_approve: bool
     comment: str = ""
+    compiled: Optional[Pattern] = field(default=None, compare=False, repr=False)  # 로드 시 1회 컴파일된 패턴
+
+
+# WorksheetProcessingRule -> 화이트리스트 저장 항목 변환용 (필드와 키 순서 대응)
+_RULE_ITEM_KEYS = ('pattern', 'strategy', 'auto_approve', 'comment')
+_rule_fields = operator.attrgetter('worksheet_pattern', 'processing_strategy', 'auto_approve', 'comment')
 
 
 @dataclass
 class SecurityConfig:
     """보안 설정 구조"""
     max_file_size_mb: int = 100
-    allowed_extensions: List[str] = None
+    allowed_extensions: FrozenSet[str] = None  # 소문자 확장자 집합 (O(1) 멤버십 검사)
     backup_enabled: bool = True
     log_sensitive_data: bool = False
     config_encryption: bool = False
@@ -44,6 +144,7 @@ class SecurityConfig:
     def __post_init__(self):
         if self.allowed_extensions is None:
             self.allowed_extensions = ['.xlsx', '.xlsm', '.xls']
+        self.allowed_extensions = frozenset(ext.lower() for ext in self.allowed_extensions)
 
 
 class ConfigurationError(Exception):
@@ -59,8 +160,8 @@ class SecurityValidationError(Exception):
 class ConfigManager:
     """보안 강화된 설정 관리 클래스"""
     
-    # 설정 파일 스키마 정의 (보안 검증용)
-    CONFIG_SCHEMA = {
+    # 설정 파일 스키마 정의 (보안 검증용, 읽기 전용 - 검증기 레지스트리가 id로 캐시하므로 변경 불가)
+    CONFIG_SCHEMA = _freeze({
         "type": "object",
         "properties": {
             "version": {"type": "string"},
@@ -87,15 +188,16 @@ class ConfigManager:
                     "max_file_size_mb": {"type": "integer", "minimum": 1, "maximum": 1000},
                     "allowed_extensions": {"type": "array", "items": {"type": "string"}},
                     "backup_enabled": {"type": "boolean"},
-                    "log_sensitive_data": {"type": "boolean"}
+                    "log_sensitive_data": {"type": "boolean"},
+                    "regex_engine": {"type": "string", "enum": ["re", "re2"]}
                 }
             }
         },
         "required": ["version", "general", "processing", "security"],
         "additionalProperties": False
-    }
+    })
     
-    WHITELIST_SCHEMA = {
+    WHITELIST_SCHEMA = _freeze({
         "type": "object",
         "properties": {
             "version": {"type": "string"},
@@ -116,9 +218,9 @@ class ConfigManager:
         },
         "required": ["version", "worksheet_patterns"],
         "additionalProperties": False
-    }
+    })
     
-    BLACKLIST_SCHEMA = {
+    BLACKLIST_SCHEMA = _freeze({
         "type": "object",
         "properties": {
             "version": {"type": "string"},
@@ -138,7 +240,7 @@ class ConfigManager:
         },
         "required": ["version", "excluded_patterns"],
         "additionalProperties": False
-    }
+    })
     
     def __init__(self, config_dir: Optional[str] = None):
         """
@@ -164,6 +266,18 @@ class ConfigManager:
         self._config_cache = {}
         self._cache_timestamp = {}
         
+        # 화이트리스트 다중 패턴 매처: (컴파일 대상 규칙 리스트, hyperscan DB 또는 None)
+        self._whitelist_matcher = (None, None)
+        
+        # os.stat 결과 단기 캐시: 경로 -> (조회 시각, stat 결과)
+        self._stat_cache = {}
+        
+        # batch_save 중 지연된 저장: 설정 파일 경로 -> (임시 파일, 데이터, 스키마, 내용 해시)
+        self._pending_saves = None
+        
+        # 저장 시 이미 검증된 파일 내용 (id(schema), SHA-256) - 동일 내용 재로드 시 검증 생략
+        self._validated_hashes = set()
+        
         # 보안 설정
         self.security_config = SecurityConfig()
         
@@ -231,7 +345,8 @@ class ConfigManager:
                 "max_file_size_mb": 100,
                 "allowed_extensions": [".xlsx", ".xlsm", ".xls"],
                 "backup_enabled": True,
-                "log_sensitive_data": False
+                "log_sensitive_data": False,
+                "regex_engine": "re"
             }
         }
         
@@ -293,57 +408,160 @@ class ConfigManager:
         self._save_config_secure(self.blacklist_file, default_blacklist, self.BLACKLIST_SCHEMA)
         self.logger.info("기본 블랙리스트가 생성되었습니다")
     
+    def _validate(self, data: Dict, schema: Dict):
+        """컴파일된 검증기로 스키마 유효성 검사"""
+        validate, error_cls = _get_validator(schema)
+        try:
+            validate(data)
+        except error_cls as e:
+            raise ConfigurationError(f"설정 유효성 검사 실패: {e.message}")
+    
     def _save_config_secure(self, file_path: Path, data: Dict, schema: Dict):
         """보안을 고려한 설정 파일 저장"""
+        temp_file = None
         try:
             # 스키마 유효성 검사
-            validate(instance=data, schema=schema)
-            
-            # 임시 파일로 안전한 저장
-            temp_file = file_path.with_suffix('.tmp')
-            
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            # 원자적 이동 (atomic move)
-            shutil.move(str(temp_file), str(file_path))
-            
-            # 윈도우가 아닌 경우 파일 권한 설정
-            if os.name != 'nt':
-                os.chmod(file_path, 0o600)  # 소유자만 읽기/쓰기
-            
-        except ValidationError as e:
-            raise ConfigurationError(f"설정 유효성 검사 실패: {e.message}")
+            self._validate(data, schema)
+            
+            # 직렬화는 메모리에서 한 번에 수행 (orjson은 C 구현으로 bytes 직접 반환)
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+            else:
+                payload = (json.dumps(data, ensure_ascii=False, indent=2) + '\n').encode('utf-8')
+            
+            # 같은 디렉토리의 임시 파일로 안전한 저장 (교체가 항상 같은 파일시스템 내 rename이 되도록)
+            with tempfile.NamedTemporaryFile('wb', dir=file_path.parent, prefix=f'{file_path.stem}.',
+                                             suffix='.tmp', delete=False) as f:
+                temp_file = Path(f.name)
+                f.write(payload)
+            
+            # 검증을 통과한 내용의 해시 (이후 로드 시 재검증 생략용)
+            digest = hashlib.sha256(payload).hexdigest()
+            
+            # batch_save 중에는 교체를 종료 시점으로 미룸
+            if self._pending_saves is not None:
+                previous = self._pending_saves.pop(file_path, None)
+                if previous is not None:
+                    previous[0].unlink()
+                self._pending_saves[file_path] = (temp_file, copy.deepcopy(data), schema, digest)
+                return
+            
+            self._commit_temp_file(temp_file, file_path, schema, digest)
+            
+        except ConfigurationError:
+            raise
         except Exception as e:
             # 임시 파일 정리
-            if temp_file.exists():
+            if temp_file is not None and temp_file.exists():
                 temp_file.unlink()
             raise ConfigurationError(f"설정 저장 실패: {e}")
     
+    def _commit_temp_file(self, temp_file: Path, file_path: Path, schema: Dict, digest: str):
+        """검증·기록이 끝난 임시 파일을 실제 설정 파일로 교체"""
+        # 원자적 교체 (atomic replace)
+        os.replace(temp_file, file_path)
+        self._stat_cache.pop(str(file_path), None)
+        
+        # 검증을 통과한 내용으로 기록 (이후 로드 시 재검증 생략)
+        self._validated_hashes.add((id(schema), digest))
+        
+        # 윈도우가 아닌 경우 파일 권한 설정
+        if os.name != 'nt':
+            os.chmod(file_path, 0o600)  # 소유자만 읽기/쓰기
+    
+    @contextmanager
+    def batch_save(self):
+        """
+        여러 설정 변경을 모아 종료 시 한 번에 반영하는 컨텍스트 매니저
+        
+        블록 안의 저장은 임시 파일까지만 기록되고, 블록이 정상 종료되면 일괄 교체됩니다.
+        security.backup_enabled이면 교체 전 각 파일과 디렉토리를 한 번씩만 fsync 합니다.
+        블록 안에서 예외가 발생하면 모든 변경을 버립니다.
+        
+        사용 예:
+            with config_mgr.batch_save():
+                config_mgr.update_config_value('general', 'log_level', 'DEBUG')
+                config_mgr.add_whitelist_rule(rule)
+        """
+        if self._pending_saves is not None:
+            # 중첩 호출은 바깥 배치에 합류
+            yield self
+            return
+        
+        self._pending_saves = {}
+        try:
+            yield self
+        except BaseException:
+            pending, self._pending_saves = self._pending_saves, None
+            for temp_file, *_ in pending.values():
+                if temp_file.exists():
+                    temp_file.unlink()
+            for cache_key in ('main_config', 'whitelist', 'blacklist'):
+                self._invalidate_cache(cache_key)
+            raise
+        
+        pending, self._pending_saves = self._pending_saves, None
+        if not pending:
+            return
+        
+        try:
+            if self.security_config.backup_enabled:
+                for temp_file, *_ in pending.values():
+                    with open(temp_file, 'rb+') as f:
+                        os.fsync(f.fileno())
+            
+            for file_path, (temp_file, _, schema, digest) in pending.items():
+                self._commit_temp_file(temp_file, file_path, schema, digest)
+            
+            if self.security_config.backup_enabled and os.name != 'nt':
+                dir_fd = os.open(self.config_dir, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+        except Exception as e:
+            for temp_file, *_ in pending.values():
+                if temp_file.exists():
+                    temp_file.unlink()
+            raise ConfigurationError(f"설정 일괄 저장 실패: {e}")
+        finally:
+            for cache_key in ('main_config', 'whitelist', 'blacklist'):
+                self._invalidate_cache(cache_key)
+    
     def _load_config_secure(self, file_path: Path, schema: Dict) -> Dict:
         """보안을 고려한 설정 파일 로드"""
+        # batch_save 중 아직 반영되지 않은 저장 내용이 있으면 그 내용을 반환 (이미 검증됨)
+        if self._pending_saves is not None and file_path in self._pending_saves:
+            return copy.deepcopy(self._pending_saves[file_path][1])
+        
         try:
-            # 파일 존재 및 권한 확인
-            if not file_path.exists():
+            # 파일 크기 제한 (보안) - 별도 stat 없이 한도+1 바이트까지만 읽어 초과 여부 판단
+            max_size = 1024 * 1024  # 1MB 제한
+            try:
+                with open(file_path, 'rb') as f:
+                    raw = f.read(max_size + 1)
+            except FileNotFoundError:
                 raise ConfigurationError(f"설정 파일이 존재하지 않습니다: {file_path}")
             
-            # 파일 크기 제한 (보안)
-            file_size = file_path.stat().st_size
-            if file_size > 1024 * 1024:  # 1MB 제한
-                raise SecurityValidationError(f"설정 파일이 너무 큽니다: {file_size} bytes")
+            if len(raw) > max_size:
+                raise SecurityValidationError(f"설정 파일이 너무 큽니다: {max_size} bytes 초과")
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스
+            if orjson is not None:
+                data = orjson.loads(raw)
+            else:
+                data = json.loads(raw.decode('utf-8'))
             
-            # 스키마 유효성 검사
-            validate(instance=data, schema=schema)
+            # 스키마 유효성 검사 (직접 저장하며 검증한 내용과 같으면 생략)
+            if (id(schema), hashlib.sha256(raw).hexdigest()) not in self._validated_hashes:
+                self._validate(data, schema)
             
             return data
             
         except json.JSONDecodeError as e:
             raise ConfigurationError(f"JSON 파싱 오류: {e}")
-        except ValidationError as e:
-            raise ConfigurationError(f"설정 유효성 검사 실패: {e.message}")
+        except ConfigurationError:
+            raise
         except Exception as e:
             raise ConfigurationError(f"설정 로드 실패: {e}")
     
@@ -368,6 +586,7 @@ class ConfigManager:
             return self._config_cache[cache_key]
         
         whitelist_data = self._load_config_secure(self.whitelist_file, self.WHITELIST_SCHEMA)
+        regex_engine = self._get_regex_engine()
         
         # 데이터 구조 변환
         rules = []
@@ -377,7 +596,8 @@ class ConfigManager:
                 processing_strategy=item['strategy'],
                 confidence_threshold=70.0,  # 기본값
                 auto_approve=item.get('auto_approve', False),
-                comment=item.get('comment', '')
+                comment=item.get('comment', ''),
+                compiled=self._compile_pattern(item['pattern'], regex_engine)
             )
             rules.append(rule)
         
@@ -385,6 +605,56 @@ class ConfigManager:
         self.logger.info(f"화이트리스트 로드 완료: {len(rules)}개 규칙")
         return rules
     
+    def _build_whitelist_db(self, rules: List[WorksheetProcessingRule]):
+        """화이트리스트 패턴 전체를 hyperscan DB 하나로 컴파일 (불가 시 None)"""
+        if hyperscan is None or not rules:
+            return None
+        
+        try:
+            # HS_FLAG_UCP: 없으면 \w, \d, \b가 ASCII만 인식하여 한글 시트명 패턴이 표준 re와 다르게 매칭됨
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[r.worksheet_pattern.encode('utf-8') for r in rules],
+                ids=list(range(len(rules))),
+                elements=len(rules),
+                flags=[
+                    hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+                    | hyperscan.HS_FLAG_SINGLEMATCH
+                ] * len(rules)
+            )
+            return db
+        except Exception as e:
+            self.logger.info(f"hyperscan 컴파일 불가, 개별 정규식 매칭으로 대체: {e}")
+            return None
+    
+    def match_whitelist(self, worksheet_name: str) -> Optional[WorksheetProcessingRule]:
+        """
+        워크시트 이름과 일치하는 첫 번째 화이트리스트 규칙 반환
+        
+        hyperscan 사용 가능 시 모든 패턴을 한 번의 스캔으로 검사하고,
+        아니면 미리 컴파일된 정규식을 순서대로 검사합니다.
+        """
+        rules = self.get_whitelist()
+        
+        matcher_rules, db = self._whitelist_matcher
+        if matcher_rules is not rules:
+            db = self._build_whitelist_db(rules)
+            self._whitelist_matcher = (rules, db)
+        
+        if db is not None:
+            matched_ids = []
+            
+            def on_match(rule_id, start, end, flags, context):
+                matched_ids.append(rule_id)
+            
+            db.scan(worksheet_name.encode('utf-8'), match_event_handler=on_match)
+            return rules[min(matched_ids)] if matched_ids else None
+        
+        for rule in rules:
+            if rule.compiled is not None and rule.compiled.search(worksheet_name):
+                return rule
+        return None
+    
     def get_blacklist(self, force_reload: bool = False) -> List[Dict]:
         """블랙리스트 로드"""
         cache_key = 'blacklist'
@@ -393,38 +663,58 @@ class ConfigManager:
             return self._config_cache[cache_key]
         
         blacklist_data = self._load_config_secure(self.blacklist_file, self.BLACKLIST_SCHEMA)
-        patterns = blacklist_data['excluded_patterns']
+        regex_engine = self._get_regex_engine()
+        patterns = [
+            {**item, 'compiled': self._compile_pattern(item['pattern'], regex_engine)}
+            for item in blacklist_data['excluded_patterns']
+        ]
         
         self._update_cache(cache_key, patterns, self.blacklist_file)
         self.logger.info(f"블랙리스트 로드 완료: {len(patterns)}개 패턴")
         return patterns
     
+    def _get_regex_engine(self) -> str:
+        """사용자 패턴 매칭에 사용할 정규식 엔진 (security.regex_engine, 기본값 're')"""
+        try:
+            return self.get_config()['security'].get('regex_engine', 're')
+        except Exception:
+            return 're'
+    
+    def _compile_pattern(self, pattern: str, regex_engine: str = 're') -> Optional[Pattern]:
+        """
+        워크시트 이름 매칭용 정규식 컴파일 (대소문자 무시, 잘못된 패턴은 None)
+        
+        regex_engine이 're2'이고 RE2 사용 가능 시 백트래킹 없는 선형 시간 매칭으로 컴파일하고,
+        RE2가 지원하지 않는 문법(역참조 등)은 표준 re로 대체합니다.
+        
+        Why 기본값이 표준 re인가?
+        RE2의 \\w, \\d, \\b는 ASCII만 인식하므로 '매출\\w+' 같은 한글 시트명 패턴이
+        조용히 매칭되지 않음. 패턴이 ASCII 범위만 쓴다고 확인된 경우에만 're2'로 켜야 함
+        """
+        if regex_engine == 're2' and re2 is not None:
+            try:
+                return re2.compile('(?i)' + pattern)
+            except Exception as e:
+                self.logger.info(f"RE2 컴파일 불가, 표준 re로 대체: {pattern} ({e})")
+        
+        try:
+            return re.compile(pattern, re.IGNORECASE)
+        except re.error as e:
+            self.logger.warning(f"잘못된 정규식 패턴 무시: {pattern} ({e})")
+            return None
+    
     def add_whitelist_rule(self, rule: WorksheetProcessingRule):
         """화이트리스트에 새 규칙 추가"""
         try:
-            current_rules = self.get_whitelist(force_reload=True)
+            whitelist_data = self._load_config_secure(self.whitelist_file, self.WHITELIST_SCHEMA)
             
             # 중복 패턴 확인
-            for existing_rule in current_rules:
-                if existing_rule.worksheet_pattern == rule.worksheet_pattern:
+            for existing_pattern in whitelist_data['worksheet_patterns']:
+                if existing_pattern['pattern'] == rule.worksheet_pattern:
                     raise ConfigurationError(f"이미 존재하는 패턴입니다: {rule.worksheet_pattern}")
             
             # 새 규칙 추가
-            current_rules.append(rule)
-            
-            # 저장용 데이터 구조 변환
-            whitelist_data = {
-                "version": "1.0.0",
-                "worksheet_patterns": [
-                    {
-                        "pattern": r.worksheet_pattern,
-                        "strategy": r.processing_strategy,
-                        "auto_approve": r.auto_approve,
-                        "comment": r.comment
-                    }
-                    for r in current_rules
-                ]
-            }
+            whitelist_data['worksheet_patterns'].append(dict(zip(_RULE_ITEM_KEYS, _rule_fields(rule))))
             
             self._save_config_secure(self.whitelist_file, whitelist_data, self.WHITELIST_SCHEMA)
             
@@ -469,7 +759,8 @@ class ConfigManager:
     def update_config_value(self, section: str, key: str, value: Any):
         """설정값 업데이트"""
         try:
-            config = self.get_config(force_reload=True)
+            # 캐시된 설정을 직접 수정하지 않고 변경 섹션만 복사 (저장 실패 시 캐시 보존)
+            config = copy.copy(self.get_config())
             
             if section not in config:
                 raise ConfigurationError(f"존재하지 않는 설정 섹션: {section}")
@@ -479,12 +770,12 @@ class ConfigManager:
                 if not self._validate_security_value(key, value):
                     raise SecurityValidationError(f"보안상 허용되지 않는 값: {key}={value}")
             
-            config[section][key] = value
+            config[section] = {**config[section], key: value}
             
             self._save_config_secure(self.config_file, config, self.CONFIG_SCHEMA)
             
-            # 캐시 무효화
-            self._invalidate_cache('main_config')
+            # 저장한 내용으로 캐시 갱신 (다음 조회 시 재로드 불필요)
+            self._update_cache('main_config', config, self.config_file)
             
             self.logger.info(f"설정 업데이트: {section}.{key} = {self._mask_sensitive_value(key, value)}")
             
@@ -508,8 +799,25 @@ class ConfigManager:
             return '*' * 8
         return str(value)
     
+    def _stat_cached(self, file_path: Path, ttl: float = 0.1) -> os.stat_result:
+        """os.stat 결과를 ttl(초) 동안 재사용 (연속된 캐시 확인 시 stat 호출 절약)"""
+        key = str(file_path)
+        now = time.monotonic()
+        cached = self._stat_cache.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        
+        st = os.stat(key)
+        self._stat_cache[key] = (now, st)
+        return st
+    
     def _is_cache_valid(self, cache_key: str, file_path: Path) -> bool:
-        """캐시 유효성 검사"""
+        """
+        캐시 유효성 검사
+        
+        (수정 시각 ns, 파일 크기)가 같으면 바로 유효로 판단하고,
+        수정 시각만 바뀐 경우에는 내용 해시를 비교하여 동일 내용 재저장이면 캐시를 유지합니다.
+        """
         if cache_key not in self._config_cache:
             return False
         
@@ -517,18 +825,28 @@ class ConfigManager:
             return False
         
         try:
-            file_mtime = file_path.stat().st_mtime
-            return file_mtime <= self._cache_timestamp[cache_key]
+            mtime_ns, size, digest = self._cache_timestamp[cache_key]
+            st = self._stat_cached(file_path)
+            if st.st_mtime_ns == mtime_ns and st.st_size == size:
+                return True
+            
+            if st.st_size == size and hashlib.sha1(file_path.read_bytes()).digest() == digest:
+                self._cache_timestamp[cache_key] = (st.st_mtime_ns, size, digest)
+                return True
+            
+            return False
         except:
             return False
     
     def _update_cache(self, cache_key: str, data: Any, file_path: Path):
-        """캐시 업데이트"""
+        """캐시 업데이트 (파일 서명: 수정 시각 ns, 크기, SHA-1)"""
         self._config_cache[cache_key] = data
         try:
-            self._cache_timestamp[cache_key] = file_path.stat().st_mtime
+            st = self._stat_cached(file_path)
+            digest = hashlib.sha1(file_path.read_bytes()).digest()
+            self._cache_timestamp[cache_key] = (st.st_mtime_ns, st.st_size, digest)
         except:
-            self._cache_timestamp[cache_key] = datetime.now().timestamp()
+            self._cache_timestamp.pop(cache_key, None)
     
     def _invalidate_cache(self, cache_key: str):
         """캐시 무효화"""
@@ -578,6 +896,7 @@ class ConfigManager:
                 # 캐시 모두 무효화
                 self._config_cache.clear()
                 self._cache_timestamp.clear()
+                self._stat_cache.clear()
                 
                 self.logger.info(f"설정 복원 완료: {backup_path}")
                 
@@ -592,32 +911,25 @@ class ConfigManager:
             raise ConfigurationError(f"복원 실패: {e}")
     
     def validate_all_configs(self) -> Dict[str, bool]:
-        """모든 설정 파일 유효성 검사"""
-        results = {}
-        
-        # 메인 설정
-        try:
-            self._load_config_secure(self.config_file, self.CONFIG_SCHEMA)
-            results['main_config'] = True
-        except Exception as e:
-            results['main_config'] = False
-            self.logger.error(f"메인 설정 유효성 검사 실패: {e}")
-        
-        # 화이트리스트
-        try:
-            self._load_config_secure(self.whitelist_file, self.WHITELIST_SCHEMA)
-            results['whitelist'] = True
-        except Exception as e:
-            results['whitelist'] = False
-            self.logger.error(f"화이트리스트 유효성 검사 실패: {e}")
+        """모든 설정 파일 유효성 검사 (세 파일을 스레드로 동시에 읽어 검사)"""
+        targets = [
+            ('main_config', self.config_file, self.CONFIG_SCHEMA, "메인 설정"),
+            ('whitelist', self.whitelist_file, self.WHITELIST_SCHEMA, "화이트리스트"),
+            ('blacklist', self.blacklist_file, self.BLACKLIST_SCHEMA, "블랙리스트"),
+        ]
+        
+        with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+            futures = {
+                name: executor.submit(self._load_config_secure, file_path, schema)
+                for name, file_path, schema, _ in targets
+            }
         
-        # 블랙리스트
-        try:
-            self._load_config_secure(self.blacklist_file, self.BLACKLIST_SCHEMA)
-            results['blacklist'] = True
-        except Exception as e:
-            results['blacklist'] = False
-            self.logger.error(f"블랙리스트 유효성 검사 실패: {e}")
+        results = {}
+        for name, _, _, label in targets:
+            error = futures[name].exception()
+            results[name] = error is None
+            if error is not None:
+                self.logger.error(f"{label} 유효성 검사 실패: {error}")
         
         return results
     
@@ -645,13 +957,19 @@ class ConfigManager:
 
 # 전역 설정 관리자 인스턴스
 _config_manager = None
+_config_manager_lock = threading.Lock()
 
 def get_config_manager() -> ConfigManager:
-    """싱글톤 설정 관리자 반환"""
+    """싱글톤 설정 관리자 반환 (이중 확인 잠금으로 스레드 안전, 생성 후에는 잠금 없음)"""
     global _config_manager
-    if _config_manager is None:
-        _config_manager = ConfigManager()
-    return _config_manager
+    config_manager = _config_manager
+    if config_manager is not None:
+        return config_manager
+    
+    with _config_manager_lock:
+        if _config_manager is None:
+            _config_manager = ConfigManager()
+        return _config_manager
 
 
 if __name__ == "__main__":
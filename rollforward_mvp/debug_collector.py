@@ -9,162 +9,337 @@ import sys        # Python 시스템 정보를 가져오기 위한 라이브러
 import traceback  # 오류 발생 시 상세한 오류 정보를 가져오기 위한 라이브러리
 from datetime import datetime  # 현재 날짜와 시간을 기록하기 위한 라이브러리
 import platform   # 운영체제 정보를 가져오기 위한 라이브러리 (Windows, Mac, Linux)
+import itertools  # 저장 실패 시 필요한 만큼만 줄을 꺼내기 위한 라이브러리
+import mmap       # 큰 소스 파일을 통째로 읽지 않고 메모리에 매핑해서 앞뒤만 보기 위한 라이브러리
+import importlib  # 모듈을 실행하지 않고 찾기만 하거나, 실제로 import하기 위한 라이브러리
+import importlib.util
 
-def collect_all_info():
-    """프로젝트 모든 정보를 ChatGPT 업로드용으로 수집"""
+# 프로젝트 구조에 표시할 확장자 (파일마다 튜플을 만들지 않도록 한 번만 생성)
+_LISTED_EXTS = frozenset(("py", "xlsx", "txt", "md"))
+
+# 탐색하지 않을 폴더 (버전 관리, 캐시, 가상환경, 빌드 결과물)
+# 이런 폴더는 파일 수가 매우 많지만 디버깅에 필요한 정보가 없으므로 아예 들어가지 않음
+_SKIP_DIRS = frozenset((
+    ".git", "__pycache__", ".venv", "venv", "node_modules",
+    ".mypy_cache", ".pytest_cache", "dist", "build", ".tox",
+))
+
+def _skip_dir(name):
+    """탐색에서 제외할 폴더인지 확인 (위 목록 또는 .으로 시작하는 숨김 폴더)"""
+    return name in _SKIP_DIRS or name.startswith(".")
+
+class _FwalkEntry:
+    """
+    os.fwalk 결과를 DirEntry처럼 쓰기 위한 가벼운 파일 항목 (name, path, stat())
     
-    print("🔍 디버깅 정보 수집 중...")
+    stat()은 폴더 fd 기준 상대 경로로 조회하므로(fstatat) 커널이 전체 경로를 다시 해석하지 않음
+    폴더 fd는 해당 폴더를 순회하는 동안에만 열려 있으므로 stat()도 그 안에서만 호출해야 함
+    """
+    __slots__ = ("name", "path", "_dir_fd")
     
-    info = []
-    info.append("=" * 80)
-    info.append("🐛 롤포워딩 프로젝트 디버깅 정보")
-    info.append(f"📅 수집 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    info.append("=" * 80)
+    def __init__(self, name, path, dir_fd):
+        self.name = name
+        self.path = path
+        self._dir_fd = dir_fd
+    
+    def stat(self):
+        return os.stat(self.name, dir_fd=self._dir_fd)
+
+def _walk(top):
+    """
+    os.walk와 같은 순서로 (폴더 경로, 하위 폴더 목록, 파일 목록)을 돌려주는 탐색기
+    
+    _SKIP_DIRS에 있거나 숨김(.으로 시작) 폴더는 목록에서 빼고 들어가지도 않음
+    파일 목록의 항목은 name, path, stat()을 가지며 stat()은 링크를 따라간 결과를 돌려줌
+    
+    왜 os.fwalk를 먼저 쓰는가?
+    POSIX에서는 폴더마다 열어둔 fd 기준으로 파일 정보를 조회하므로
+    깊은 폴더에서도 경로 전체를 매번 다시 찾아가지 않아도 되기 때문
+    (os.fwalk가 없는 Windows에서는 os.scandir 기반 탐색 사용)
+    """
+    if hasattr(os, "fwalk"):
+        for root, dirnames, filenames, root_fd in os.fwalk(top):
+            # 목록을 제자리에서 바꾸면 os.fwalk가 제외된 폴더로 내려가지 않음
+            dirnames[:] = [name for name in dirnames if not _skip_dir(name)]
+            yield root, dirnames, [
+                _FwalkEntry(name, os.path.join(root, name), root_fd) for name in filenames
+            ]
+    else:
+        yield from _scandir_walk(top)
+
+def _scandir_walk(top):
+    """
+    os.fwalk가 없을 때 쓰는 os.scandir 기반 탐색기 (os.walk와 같은 순서)
+    
+    왜 os.walk 대신 직접 만드는가?
+    os.scandir가 폴더를 읽을 때 함께 받아오는 DirEntry를 그대로 돌려주면
+    파일 종류 확인과 크기 조회(entry.stat())에 추가 시스템 호출이 거의 필요 없기 때문
+    """
+    dirs, files = [], []
+    try:
+        with os.scandir(top) as it:
+            for entry in it:
+                if entry.is_dir():
+                    if not _skip_dir(entry.name):
+                        dirs.append(entry)
+                else:
+                    files.append(entry)
+    except OSError:
+        return
+    
+    yield top, dirs, files
+    
+    # 심볼릭 링크 폴더는 os.walk 기본 동작처럼 따라가지 않음
+    for entry in dirs:
+        if not entry.is_symlink():
+            yield from _scandir_walk(entry.path)
+
+def _read_head_tail(file_path, head_count=50, tail_count=50):
+    """
+    소스 파일의 앞부분과 뒷부분만 읽어 (전체 줄 수, 앞부분 줄 목록, 뒷부분 줄 목록) 반환
+    
+    왜 파일 전체를 읽지 않는가?
+    수만 줄짜리 파일도 앞뒤 50줄만 보여주므로, 전체를 문자열과 줄 목록으로 만들면
+    대부분을 버리기 위해 메모리를 쓰게 되기 때문
+    
+    왜 mmap을 쓰는가?
+    파일을 메모리에 매핑하면 운영체제 페이지 캐시를 그대로 바이트로 볼 수 있어서
+    줄바꿈 위치만 찾아 필요한 앞뒤 조각만 잘라 디코딩할 수 있기 때문
+    (중간 부분은 문자열로 만들지 않고 줄바꿈 개수만 셈)
+    
+    파일이 (head_count + tail_count)줄 이하이면 전체 줄을 앞부분 목록으로 돌려주고
+    뒷부분 목록은 None 입니다. 줄 나누기는 content.split('\\n')과 같은 기준입니다.
+    """
+    limit = head_count + tail_count
+    with open(file_path, 'rb') as f:
+        # 빈 파일은 mmap으로 매핑할 수 없음
+        if os.fstat(f.fileno()).st_size == 0:
+            return None, [''], None
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # 앞에서부터 limit번째 줄바꿈까지 찾기 (못 찾으면 전체를 보여주는 작은 파일)
+            head_end = pos = -1
+            for i in range(limit):
+                pos = mm.find(b'\n', pos + 1)
+                if pos < 0:
+                    return None, _decode_lines(mm[:]), None
+                if i == head_count - 1:
+                    head_end = pos
+            
+            # 마지막 줄바꿈까지 포함해서 잘라야 \r\n의 \r이 줄 끝에 남지 않음
+            head_lines = _decode_lines(mm[:head_end + 1])[:-1]
+            
+            # 전체 줄 수는 고정 크기 블록 단위로 줄바꿈만 세어 계산
+            size = len(mm)
+            block = 1 << 20
+            newline_count = sum(mm[i:i + block].count(b'\n') for i in range(0, size, block))
+            
+            # 뒤에서부터 tail_count번째 줄바꿈 다음부터가 마지막 tail_count줄
+            start = size
+            for _ in range(tail_count):
+                start = mm.rfind(b'\n', 0, start)
+            tail_lines = _decode_lines(mm[start + 1:], errors='replace')
+    
+    return newline_count + 1, head_lines, tail_lines
+
+def _decode_lines(data, errors='strict'):
+    """UTF-8 바이트를 디코딩해서 줄 목록으로 나눔 (Windows 줄바꿈 \\r\\n도 \\n으로 취급)"""
+    return data.decode('utf-8', errors).replace('\r\n', '\n').split('\n')
+
+def _numbered(lines, start):
+    """
+    줄 번호를 붙인 여러 줄을 하나의 문자열로 합쳐 반환 (예: '  1: import os')
+    
+    왜 한 줄씩 내보내지 않고 한 덩어리로 만드는가?
+    줄마다 f-string 포맷, yield, 파일 write를 반복하는 대신
+    C로 구현된 % 포맷과 join으로 한 번에 만들어 한 번에 쓰기 위해
+    """
+    return "\n".join(map("%3d: %s".__mod__, zip(itertools.count(start), lines)))
+
+def _generate_debug_info(output_file=None):
+    """
+    디버깅 정보를 한 줄씩 생성 (소스 코드 덤프는 여러 줄을 한 덩어리로 생성)
+    
+    왜 리스트에 모으지 않고 한 줄씩 내보내는가?
+    큰 프로젝트에서는 전체 내용을 리스트와 합친 문자열로 두 번 들고 있게 되므로,
+    생성하는 즉시 파일에 쓰면 메모리 사용량이 크게 줄어들기 때문
+    
+    output_file은 지금 기록 중인 결과 파일 이름으로, 프로젝트 구조 목록에서 제외됨
+    """
+    yield "=" * 80
+    yield "🐛 롤포워딩 프로젝트 디버깅 정보"
+    yield f"📅 수집 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    yield "=" * 80
     
     # 1. 시스템 정보
-    info.append("\n📊 1. 시스템 정보")
-    info.append("-" * 40)
-    info.append(f"Python 버전: {sys.version}")
-    info.append(f"운영체제: {platform.system()} {platform.release()}")
-    info.append(f"프로세서: {platform.processor()}")
-    info.append(f"현재 작업 디렉토리: {os.getcwd()}")
+    yield "\n📊 1. 시스템 정보"
+    yield "-" * 40
+    yield f"Python 버전: {sys.version}"
+    yield f"운영체제: {platform.system()} {platform.release()}"
+    yield f"프로세서: {platform.processor()}"
+    yield f"현재 작업 디렉토리: {os.getcwd()}"
     
     # 2. 프로젝트 구조
-    info.append("\n📁 2. 프로젝트 구조")
-    info.append("-" * 40)
-    for root, dirs, files in os.walk("."):
-        level = root.replace(".", "").count(os.sep)
+    yield "\n📁 2. 프로젝트 구조"
+    yield "-" * 40
+    
+    # 왜 구조 출력과 Python 파일 목록을 한 번의 탐색으로 만드는가?
+    # 프로젝트 폴더를 두 번 훑으면 폴더 읽기/파일 정보 조회 비용도 두 배가 되기 때문
+    python_files = []  # 3번 항목에서 내용을 보여줄 Python 파일 경로
+    
+    # 반복문 안에서 매번 모듈 속성을 찾지 않도록 자주 쓰는 함수/값을 지역 변수로 묶어둠
+    basename = os.path.basename
+    sep = os.sep
+    add_python_file = python_files.append
+    listed_exts = _LISTED_EXTS
+    
+    for root, dirs, files in _walk("."):
+        level = root.replace(".", "").count(sep)
         indent = " " * 2 * level
-        info.append(f"{indent}{os.path.basename(root)}/")
+        yield f"{indent}{basename(root)}/"
         subindent = " " * 2 * (level + 1)
-        for file in files:
-            if file.endswith(('.py', '.xlsx', '.txt', '.md')):
+        for entry in files:
+            name = entry.name
+            # 지금 기록 중인 결과 파일 자신은 목록에서 제외
+            if root == "." and name == output_file:
+                continue
+            if name.endswith('.py') and not name.startswith('__'):
+                add_python_file(entry.path)
+            _, dot, ext = name.rpartition('.')
+            if dot and ext.lower() in listed_exts:
                 try:
-                    file_size = os.path.getsize(os.path.join(root, file))
-                    info.append(f"{subindent}{file} ({file_size} bytes)")
+                    file_size = entry.stat().st_size
+                    yield f"{subindent}{name} ({file_size} bytes)"
                 except:
-                    info.append(f"{subindent}{file} (크기 불명)")
+                    yield f"{subindent}{name} (크기 불명)"
     
     # 3. Python 파일 내용
-    info.append("\n📄 3. Python 파일 내용")
-    info.append("-" * 40)
-    
-    python_files = []
-    for root, dirs, files in os.walk("."):
-        for file in files:
-            if file.endswith('.py') and not file.startswith('__'):
-                python_files.append(os.path.join(root, file))
+    yield "\n📄 3. Python 파일 내용"
+    yield "-" * 40
     
     # 파일 우선순위 (중요한 것부터)
     priority_order = ['main.py', 'table_finder.py', 'header_matcher.py', 'file_updater.py']
-    sorted_files = []
+    
+    # 왜 파일명 → 경로 딕셔너리를 쓰는가?
+    # 우선순위마다 전체 목록을 훑고 다시 리스트에서 포함 여부를 찾으면 O(N²)이 되므로
+    # 파일명마다 처음 발견된 경로를 한 번에 기록해두고 해시 조회로 찾음
+    by_name = {}
+    for file_path in python_files:
+        by_name.setdefault(os.path.basename(file_path), file_path)
     
     # 우선순위 파일들 먼저
-    for priority in priority_order:
-        for file_path in python_files:
-            if priority in file_path:
-                sorted_files.append(file_path)
-                break
+    sorted_files = [by_name[name] for name in priority_order if name in by_name]
     
-    # 나머지 파일들
-    for file_path in python_files:
-        if file_path not in sorted_files:
-            sorted_files.append(file_path)
+    # 나머지 파일들 (같은 이름의 파일이 여러 폴더에 있어도 빠짐없이 발견 순서대로)
+    prioritized = set(sorted_files)
+    sorted_files.extend(file_path for file_path in python_files if file_path not in prioritized)
     
     for file_path in sorted_files:
         try:
-            info.append(f"\n📝 === {file_path} ===")
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
-                
-                # 토큰 제한 고려: 파일이 너무 크면 일부만
-                if len(lines) > 100:
-                    info.append("⚠️ 파일이 큼: 처음 50줄과 마지막 50줄만 표시")
-                    info.extend([f"{i+1:3d}: {line}" for i, line in enumerate(lines[:50])])
-                    info.append("... (중간 생략) ...")
-                    info.extend([f"{i+len(lines)-50+1:3d}: {line}" for i, line in enumerate(lines[-50:])])
-                else:
-                    info.extend([f"{i+1:3d}: {line}" for i, line in enumerate(lines)])
+            yield f"\n📝 === {file_path} ==="
+            total_lines, head_lines, tail_lines = _read_head_tail(file_path)
+            
+            # 토큰 제한 고려: 파일이 너무 크면 일부만
+            if tail_lines is not None:
+                yield "⚠️ 파일이 큼: 처음 50줄과 마지막 50줄만 표시"
+                yield _numbered(head_lines, 1)
+                yield "... (중간 생략) ..."
+                yield _numbered(tail_lines, total_lines - len(tail_lines) + 1)
+            else:
+                yield _numbered(head_lines, 1)
                     
         except Exception as e:
-            info.append(f"❌ 파일 읽기 실패: {e}")
+            yield f"❌ 파일 읽기 실패: {e}"
     
     # 4. 최근 에러 로그 (있다면)
-    info.append("\n🚨 4. 최근 에러 정보")
-    info.append("-" * 40)
+    yield "\n🚨 4. 최근 에러 정보"
+    yield "-" * 40
     
     try:
         # 가장 최근에 발생한 에러 정보 수집
         if hasattr(sys, 'last_traceback') and sys.last_traceback:
-            info.append("마지막 에러 트레이스백:")
-            info.extend(traceback.format_tb(sys.last_traceback))
+            yield "마지막 에러 트레이스백:"
+            yield from traceback.format_tb(sys.last_traceback)
         else:
-            info.append("현재 활성 에러 없음")
+            yield "현재 활성 에러 없음"
     except:
-        info.append("에러 정보 수집 실패")
+        yield "에러 정보 수집 실패"
     
     # 5. 설치된 패키지 (requirements.txt나 import 에러 체크용)
-    info.append("\n📦 5. 필요 패키지 상태")  
-    info.append("-" * 40)
+    yield "\n📦 5. 필요 패키지 상태"
+    yield "-" * 40
     
     required_packages = ['openpyxl', 'pandas', 'tkinter']
     for package in required_packages:
         try:
             if package == 'tkinter':
                 import tkinter
-                info.append(f"✅ {package}: 설치됨")
+                yield f"✅ {package}: 설치됨"
             else:
                 __import__(package)
-                info.append(f"✅ {package}: 설치됨")
+                yield f"✅ {package}: 설치됨"
         except ImportError:
             if package == 'tkinter':
-                info.append(f"❌ {package}: 설치 필요 (Python 재설치 시 tkinter 포함 선택)")
+                yield f"❌ {package}: 설치 필요 (Python 재설치 시 tkinter 포함 선택)"
             else:
-                info.append(f"❌ {package}: 설치 필요 (pip install {package})")
+                yield f"❌ {package}: 설치 필요 (pip install {package})"
     
     # 6. 샘플 데이터 구조 (있다면)
-    info.append("\n📊 6. 테스트 파일 정보")
-    info.append("-" * 40)
+    yield "\n📊 6. 테스트 파일 정보"
+    yield "-" * 40
     
     if os.path.exists("test_files"):
-        for root, dirs, files in os.walk("test_files"):
-            for file in files:
-                if file.endswith('.xlsx'):
-                    file_path = os.path.join(root, file)
+        # 폴더를 읽을 때 받은 DirEntry로 크기를 조회해서 파일마다 stat을 다시 하지 않음
+        for root, dirs, files in _walk("test_files"):
+            for entry in files:
+                if entry.name.endswith('.xlsx'):
                     try:
-                        file_size = os.path.getsize(file_path)
-                        info.append(f"📄 {file_path} ({file_size} bytes)")
-                    except:
-                        info.append(f"📄 {file_path} (크기 불명)")
+                        yield f"📄 {entry.path} ({entry.stat().st_size} bytes)"
+                    except OSError:
+                        yield f"📄 {entry.path} (크기 불명)"
     else:
-        info.append("⚠️ test_files 폴더가 없습니다")
+        yield "⚠️ test_files 폴더가 없습니다"
     
     # 7. 환경 변수 (일부만)
-    info.append("\n🔧 7. 환경 정보")
-    info.append("-" * 40)
+    yield "\n🔧 7. 환경 정보"
+    yield "-" * 40
     env_vars = ['PATH', 'PYTHONPATH', 'HOME', 'USER']
     for var in env_vars:
         value = os.environ.get(var, '없음')
         if len(value) > 100:
             value = value[:100] + "...(생략)"
-        info.append(f"{var}: {value}")
+        yield f"{var}: {value}"
+
+def collect_all_info():
+    """프로젝트 모든 정보를 ChatGPT 업로드용으로 수집"""
+    
+    print("🔍 디버깅 정보 수집 중...")
     
-    # 결과 저장
+    # 결과 저장 (생성되는 줄을 바로 파일에 기록)
     output_file = f"debug_info_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+    lines = _generate_debug_info(output_file)
+    line_count = 0
+    preview = []  # 파일 저장 실패 시 콘솔에 보여줄 처음 50줄
     
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(info))
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            for chunk in lines:
+                if line_count:
+                    f.write("\n")
+                f.write(chunk)
+                if line_count < 50:
+                    preview.extend(chunk.split("\n")[:50 - line_count])
+                line_count += chunk.count("\n") + 1
         
         print(f"✅ 디버깅 정보 수집 완료!")
         print(f"📁 파일 생성: {output_file}")
-        print(f"📊 총 {len(info)}줄의 정보가 수집되었습니다")
+        print(f"📊 총 {line_count}줄의 정보가 수집되었습니다")
         
     except Exception as e:
         print(f"❌ 파일 저장 실패: {e}")
         print("📋 콘솔 출력으로 대신 표시:")
-        print("\n".join(info[:50]))  # 처음 50줄만 표시
+        preview.extend(itertools.islice(lines, 50 - len(preview)))
+        print("\n".join("\n".join(preview).split("\n")[:50]))  # 처음 50줄만 표시
         return None
     
     print("\n🤖 ChatGPT 사용 방법:")
@@ -175,16 +350,31 @@ def collect_all_info():
     
     return output_file
 
+def _find_module(name):
+    """
+    모듈을 실행하지 않고 찾을 수 있는지만 확인 (없으면 ModuleNotFoundError)
+    
+    왜 __import__ 대신 find_spec을 쓰는가?
+    __import__는 모듈의 최상위 코드를 실제로 실행하므로 느리고 부작용(창 생성, 파일 열기 등)이 있음
+    find_spec은 모듈 파일 위치만 찾으므로 빠르고 안전함 (이미 import된 모듈은 sys.modules에서 바로 확인)
+    """
+    if name in sys.modules:
+        return
+    if importlib.util.find_spec(name) is None:
+        raise ModuleNotFoundError(f"No module named '{name}'")
+
 def quick_test():
     """빠른 테스트 - 각 모듈이 제대로 import되는지 확인"""
     print("🧪 빠른 테스트 시작...")
     
+    # openpyxl은 실제로 사용 가능한지가 중요하므로 진짜로 import하고
+    # 프로젝트 모듈은 존재 여부만 확인
     tests = [
-        ("openpyxl 패키지", lambda: __import__('openpyxl')),
-        ("main.py 모듈", lambda: __import__('main')),
-        ("table_finder.py", lambda: __import__('table_finder')),
-        ("header_matcher.py", lambda: __import__('header_matcher')),
-        ("file_updater.py", lambda: __import__('file_updater')),
+        ("openpyxl 패키지", lambda: importlib.import_module('openpyxl')),
+        ("main.py 모듈", lambda: _find_module('main')),
+        ("table_finder.py", lambda: _find_module('table_finder')),
+        ("header_matcher.py", lambda: _find_module('header_matcher')),
+        ("file_updater.py", lambda: _find_module('file_updater')),
     ]
     
     success_count = 0
@@ -15,29 +15,98 @@ try:
     from tkinter import messagebox         # 메시지 박스 (알림창)
     from tkinter import ttk                # 더 예쁜 GUI 컴포넌트들
     TKINTER_AVAILABLE = True
-    
-    # 새로운 승인 UI import (선택적)
-    try:
-        from .user_confirmation import show_worksheet_confirmation
-        NEW_UI_AVAILABLE = True
-    except ImportError:
-        try:
-            from user_confirmation import show_worksheet_confirmation
-            NEW_UI_AVAILABLE = True
-        except ImportError:
-            NEW_UI_AVAILABLE = False
-            print("⚠️ 새로운 승인 UI를 사용할 수 없습니다. 기본 UI를 사용합니다.")
 except ImportError:
     # 왜 try-except로 감싸는가?
     # tkinter가 설치되지 않은 환경에서도 프로그램이 멈추지 않게 하기 위해
     print("⚠️ tkinter를 사용할 수 없습니다. 콘솔 모드로 실행됩니다.")
     TKINTER_AVAILABLE = False
-    NEW_UI_AVAILABLE = False
 
 import os
+import importlib
+import importlib.util
+import stat
+import atexit
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import xml.etree.ElementTree as ET
 import openpyxl
 
 
+def _resolve_confirm():
+    """
+    새로운 승인 UI 함수(show_worksheet_confirmation)를 찾아서 반환, 없으면 None
+    
+    왜 import를 try-except로 연달아 시도하지 않는가?
+    패키지 내부 모듈과 단독 실행 모듈 두 경로를 find_spec으로 먼저 찾아보면
+    없는 경로에 대해 ImportError(전체 traceback 포함)를 만들 필요가 없기 때문
+    """
+    candidates = (f"{__package__}.user_confirmation",) if __package__ else ()
+    for name in candidates + ("user_confirmation",):
+        if importlib.util.find_spec(name) is None:
+            continue
+        try:
+            return importlib.import_module(name).show_worksheet_confirmation
+        except (ImportError, AttributeError) as e:
+            # 모듈은 있지만 내부 의존성 문제로 불러올 수 없는 경우
+            print(f"[file_selector._resolve_confirm] ⚠️ {name} 로드 실패: {e}")
+    return None
+
+# 새로운 승인 UI (선택적, 모듈 로드 시 한 번만 찾아둠)
+show_worksheet_confirmation = _resolve_confirm() if TKINTER_AVAILABLE else None
+NEW_UI_AVAILABLE = show_worksheet_confirmation is not None
+if TKINTER_AVAILABLE and not NEW_UI_AVAILABLE:
+    print("⚠️ 새로운 승인 UI를 사용할 수 없습니다. 기본 UI를 사용합니다.")
+
+# 왜 확장자 집합을 모듈 상단에 한 번만 만드는가?
+# 폴더 스캔 시 파일마다 튜플/소문자 문자열을 새로 만들지 않고 집합 조회 한 번으로 판단하기 위해
+_EXCEL_EXT = frozenset(("xlsx", "xls"))
+
+# 왜 os.path.exists/isdir 대신 stat 한 번으로 확인하는가?
+# exists와 isdir을 이어서 부르면 같은 경로를 두 번 조회하게 되어
+# 네트워크 드라이브나 클라우드 동기화 폴더에서는 왕복 시간이 두 배가 되기 때문
+def _is_dir(path):
+    """경로가 존재하는 폴더인지 확인"""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
+def _is_file(path):
+    """경로가 존재하는 일반 파일인지 확인"""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+# 왜 숨겨진 Tk 창 하나를 모듈 전체에서 재사용하는가?
+# tk.Tk()는 만들 때마다 Tcl 인터프리터와 폰트 캐시를 새로 로드해서 느림
+# 대화상자마다 새로 만들고 지우는 대신 처음 한 번만 만들고 프로그램 종료 시 정리
+_ROOT = None
+
+
+def _get_root():
+    """숨겨진 공용 Tk 루트 창 반환 (처음 호출 시 생성)"""
+    global _ROOT
+    if _ROOT is None:
+        _ROOT = tk.Tk()
+        _ROOT.withdraw()  # 메인 창 숨기기
+        atexit.register(_destroy_root)
+    return _ROOT
+
+
+def _destroy_root():
+    """프로그램 종료 시 공용 Tk 루트 창 제거"""
+    global _ROOT
+    if _ROOT is not None:
+        try:
+            _ROOT.destroy()
+        except tk.TclError:
+            pass
+        _ROOT = None
+
+
 def select_previous_file():
     """
     전기 조서 파일 선택
@@ -62,18 +131,17 @@ def select_previous_file():
             return None
         
         # 파일 존재 확인
-        if os.path.exists(file_path):
+        if _is_file(file_path):
             return file_path
         else:
             print(f"⚠️ 파일을 찾을 수 없습니다: {file_path}")
             return None
     
     # GUI 모드: tkinter 파일 선택 대화상자
-    # 왜 Tk()를 만들고 withdraw()하는가?
+    # 왜 숨겨진 루트 창을 가져오는가?
     # tkinter는 메인 창이 있어야 대화상자를 열 수 있음
     # 하지만 메인 창은 보이지 않게 숨김
-    root = tk.Tk()
-    root.withdraw()  # 메인 창 숨기기
+    root = _get_root()
     
     # 왜 이런 옵션들을 설정하는가?
     file_path = filedialog.askopenfilename(
@@ -82,10 +150,11 @@ def select_previous_file():
             ("Excel 파일", "*.xlsx *.xls"),          # Excel 파일만 보이게
             ("모든 파일", "*.*")                     # 필요시 모든 파일도 볼 수 있게
         ],
-        initialdir="."                               # 현재 폴더에서 시작
+        initialdir=".",                              # 현재 폴더에서 시작
+        parent=root
     )
     
-    root.destroy()  # 숨겨진 메인 창 완전히 제거 (메모리 정리)
+    root.update()  # 닫힌 대화상자의 남은 이벤트 처리
     
     # 사용자가 취소를 눌렀으면 빈 문자열이 반환됨
     if not file_path:
@@ -117,36 +186,29 @@ def select_current_folder():
             return None
         
         # 폴더 존재 확인
-        if os.path.exists(folder_path) and os.path.isdir(folder_path):
-            # 왜 끝에 /를 추가하는가?
-            # 나중에 파일 경로를 만들 때 일관성을 위해
-            if not folder_path.endswith('/'):
-                folder_path += '/'
+        if _is_dir(folder_path):
             return folder_path
         else:
             print(f"⚠️ 폴더를 찾을 수 없습니다: {folder_path}")
             return None
     
     # GUI 모드: tkinter 폴더 선택 대화상자
-    root = tk.Tk()
-    root.withdraw()  # 메인 창 숨기기
+    root = _get_root()
     
     folder_path = filedialog.askdirectory(
         title="당기 PBC 폴더를 선택하세요",
-        initialdir="."
+        initialdir=".",
+        parent=root
     )
     
-    root.destroy()  # 메인 창 제거
+    root.update()  # 닫힌 대화상자의 남은 이벤트 처리
     
     if not folder_path:
         return None
     
-    # 왜 끝에 /를 추가하는가?
-    # 나중에 folder_path + file_name으로 경로를 만들 때
-    # 일관된 형태를 유지하기 위해
-    if not folder_path.endswith('/'):
-        folder_path += '/'
-    
+    # 왜 끝에 /를 붙이지 않는가?
+    # 폴더 안의 파일 경로는 get_excel_files_in_folder가 전체 경로로 돌려주므로
+    # 폴더 경로에 문자열을 이어붙일 일이 없음
     return folder_path
 
 def get_excel_files_in_folder(folder_path):
@@ -166,28 +228,36 @@ def get_excel_files_in_folder(folder_path):
     """
     
     # 폴더 존재 확인
-    if not os.path.exists(folder_path):
+    if not _is_dir(folder_path):
         print(f"⚠️ 폴더를 찾을 수 없습니다: {folder_path}")
         return []
     
     excel_files = []  # 찾은 Excel 파일들을 저장할 리스트
     
     try:
-        # 왜 os.listdir을 사용하는가?
-        # 폴더 내의 모든 파일과 하위폴더 목록을 가져오기 위해
-        for item in os.listdir(folder_path):
-            # 왜 lower()를 사용하는가?
-            # 파일 확장자가 .XLSX, .XLS 등 대문자일 수도 있기 때문
-            # 소문자로 변환해서 비교하면 더 안전함
-            
-            # 왜 ~$로 시작하는 파일을 제외하는가?
-            # Excel을 열면 ~$로 시작하는 임시 파일이 자동 생성됨 (예: ~$workbook1.xlsx)
-            # 이런 임시 파일들은 실제 데이터 파일이 아니므로 처리에서 제외해야 함
-            # "File is not a zip file" 오류의 주요 원인이기도 함
-            if item.lower().endswith(('.xlsx', '.xls')) and not item.startswith('~$'):
-                # 전체 경로로 저장 (파일명만이 아님)
-                full_path = os.path.join(folder_path, item)
-                excel_files.append(full_path)
+        # 왜 os.scandir을 사용하는가?
+        # 폴더 내의 모든 파일과 하위폴더 목록을 가져오면서
+        # 전체 경로(entry.path)도 함께 받아 os.path.join을 따로 호출하지 않기 위해
+        # 파일이 많은 폴더에서 반복마다 속성 조회를 하지 않도록 지역 변수로 묶어둠
+        add_excel_file = excel_files.append
+        excel_ext = _EXCEL_EXT
+        
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                item = entry.name
+                
+                # 왜 확장자만 lower()하는가?
+                # 파일 확장자가 .XLSX, .XLS 등 대문자일 수도 있기 때문
+                # 파일명 전체가 아니라 확장자 부분만 소문자로 바꿔 비교하면 충분함
+                _, dot, ext = item.rpartition('.')
+                
+                # 왜 ~$로 시작하는 파일을 제외하는가?
+                # Excel을 열면 ~$로 시작하는 임시 파일이 자동 생성됨 (예: ~$workbook1.xlsx)
+                # 이런 임시 파일들은 실제 데이터 파일이 아니므로 처리에서 제외해야 함
+                # "File is not a zip file" 오류의 주요 원인이기도 함
+                if dot and ext.lower() in excel_ext and item[:2] != '~$':
+                    # 전체 경로로 저장 (파일명만이 아님)
+                    add_excel_file(entry.path)
         
         # 왜 정렬하는가?
         # 파일 목록을 알파벳 순으로 정리해서 사용자가 찾기 쉽게 하기 위해
@@ -244,17 +314,17 @@ def confirm_selection():
                 print("y 또는 n으로 답해주세요.")
     
     # GUI 모드: 메시지박스 사용
-    root = tk.Tk()
-    root.withdraw()
+    root = _get_root()
     
     # askquestion은 'yes' 또는 'no' 문자열을 반환
     result = messagebox.askquestion(
         "확인", 
         "선택한 파일들로 롤포워딩을 시작하시겠습니까?",
-        icon='question'
+        icon='question',
+        parent=root
     )
     
-    root.destroy()
+    root.update()
     
     return result == 'yes'
 
@@ -306,12 +376,19 @@ def test_file_selector():
 
 def get_worksheet_names(file_path):
     """
-    Excel 파일에서 모든 워크시트 이름 추출
+    Excel 파일에서 모든 워크시트 이름 추출 (차트 시트는 제외)
     
     이 함수가 하는 일:
     1. Excel 파일을 열어서 모든 워크시트 이름을 가져오기
     2. 사용자가 본 조서를 선택할 수 있도록 목록 제공
     
+    왜 결과를 캐시하는가?
+    자동 감지, 확인 UI, fallback 경로에서 같은 파일을 여러 번 조회하기 때문
+    (파일 경로, 수정 시각, 크기)를 키로 쓰므로 파일이 바뀌면 자동으로 다시 읽음
+    읽기에 실패한 결과는 캐시하지 않으므로 (예: Excel에서 열려 있어 잠긴 파일)
+    파일을 닫은 뒤 다시 호출하면 새로 읽음
+    캐시를 비우려면 get_worksheet_names.cache_clear()를 호출
+    
     Parameters:
         file_path (str): Excel 파일 경로
         
@@ -319,14 +396,84 @@ def get_worksheet_names(file_path):
         list: 워크시트 이름 리스트
     """
     try:
-        wb = openpyxl.load_workbook(file_path, read_only=True)
-        worksheet_names = wb.sheetnames
-        wb.close()
-        return worksheet_names
+        st = os.stat(file_path)
+    except OSError as e:
+        print(f"[file_selector.get_worksheet_names] ❌ 워크시트 목록 추출 실패: {e}")
+        return []
+    
+    try:
+        return list(_worksheet_names_cached(file_path, st.st_mtime_ns, st.st_size))
     except Exception as e:
         print(f"[file_selector.get_worksheet_names] ❌ 워크시트 목록 추출 실패: {e}")
         return []
 
+@lru_cache(maxsize=256)
+def _worksheet_names_cached(file_path, mtime_ns, size):
+    """get_worksheet_names의 실제 추출 로직 (실패하면 예외를 그대로 올려서 캐시되지 않게 함)"""
+    # 왜 openpyxl로 열기 전에 zip을 직접 읽는가?
+    # .xlsx는 zip 파일이고 시트 목록은 xl/workbook.xml 하나에만 들어있음
+    # 읽기 전용 모드라도 openpyxl은 스타일, 공유 문자열 등을 함께 읽으므로
+    # 목록만 필요할 때는 이 작은 XML 하나만 읽는 것이 훨씬 빠름
+    #
+    # 왜 workbook.xml.rels도 함께 읽는가?
+    # workbook.xml의 <sheet>에는 차트 시트도 섞여 있고, 종류는 관계(rels)의 Type에만 적혀 있음
+    # 호출하는 쪽은 모두 셀이 있는 워크시트를 기대하므로 (openpyxl의 wb.worksheets와 같게)
+    # Type이 .../worksheet인 시트만 남김
+    try:
+        with zipfile.ZipFile(file_path) as zf:
+            workbook_xml = zf.read('xl/workbook.xml')
+            rels_xml = zf.read('xl/_rels/workbook.xml.rels')
+        worksheet_rel_ids = {
+            element.get('Id')
+            for element in ET.fromstring(rels_xml).iter()
+            if element.tag.rpartition('}')[2] == 'Relationship'
+            and (element.get('Type') or '').endswith('/worksheet')
+        }
+        return tuple(
+            element.get('name')
+            for element in ET.fromstring(workbook_xml).iter()
+            if element.tag.rpartition('}')[2] == 'sheet'
+            and any(
+                key.rpartition('}')[2] == 'id' and value in worksheet_rel_ids
+                for key, value in element.attrib.items()
+            )
+        )
+    except (KeyError, zipfile.BadZipFile, ET.ParseError):
+        # 표준 구조가 아니거나 zip이 아닌 파일(.xls 등)은 openpyxl로 처리
+        pass
+    
+    wb = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        return tuple(ws.title for ws in wb.worksheets)
+    finally:
+        wb.close()
+
+get_worksheet_names.cache_clear = _worksheet_names_cached.cache_clear
+
+def get_worksheet_names_batch(file_paths):
+    """
+    여러 Excel 파일의 워크시트 이름을 한 번에 추출
+    
+    왜 스레드로 동시에 읽는가?
+    시트 목록 추출은 대부분 디스크/네트워크에서 zip 헤더를 읽는 대기 시간이고
+    파일을 읽는 동안에는 GIL이 풀리므로 여러 파일을 겹쳐서 읽으면 훨씬 빠름
+    (클라우드 동기화 폴더나 네트워크 드라이브에서 특히 효과가 큼)
+    결과는 get_worksheet_names 캐시에도 남으므로 이후 호출은 바로 반환됨
+    
+    Parameters:
+        file_paths (list): Excel 파일 경로 리스트
+        
+    Returns:
+        dict: {파일 경로: 워크시트 이름 리스트}
+    """
+    file_paths = list(file_paths)
+    if not file_paths:
+        return {}
+    
+    max_workers = min(16, (os.cpu_count() or 4) * 4, len(file_paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(file_paths, executor.map(get_worksheet_names, file_paths)))
+
 def select_main_worksheets(file_path):
     """
     본 조서에 해당하는 워크시트들을 다중 선택 (지능형 감지 시스템)
@@ -344,7 +491,7 @@ def select_main_worksheets(file_path):
         tuple: (선택된 본 조서 워크시트 리스트, 백데이터 워크시트 리스트)
     """
     
-    if not file_path or not os.path.exists(file_path):
+    if not file_path or not _is_file(file_path):
         print(f"[file_selector.select_main_worksheets] ❌ 파일이 존재하지 않습니다: {file_path}")
         return [], []
     
@@ -388,7 +535,9 @@ def select_main_worksheets(file_path):
 def _select_worksheets_gui(worksheet_names):
     """GUI 모드로 워크시트 선택"""
     
-    root = tk.Tk()
+    # 왜 Tk() 대신 Toplevel을 쓰는가?
+    # 공용 숨김 루트 창을 재사용하고 이 선택 창만 따로 띄우기 위해
+    root = tk.Toplevel(_get_root())
     root.title("본 조서 워크시트 선택")
     root.geometry("500x400")
     
@@ -420,7 +569,7 @@ def _select_worksheets_gui(worksheet_names):
     checkbox_vars = []
     
     for name in worksheet_names:
-        var = tk.BooleanVar()
+        var = tk.BooleanVar(root)
         checkbox_vars.append(var)
         
         checkbox = tk.Checkbutton(scrollable_frame, text=name, variable=var, 
@@ -437,12 +586,12 @@ def _select_worksheets_gui(worksheet_names):
     def on_confirm():
         nonlocal selected_worksheets
         selected_worksheets = [name for name, var in zip(worksheet_names, checkbox_vars) if var.get()]
-        root.quit()
+        root.destroy()
     
     def on_cancel():
         nonlocal selected_worksheets
         selected_worksheets = None
-        root.quit()
+        root.destroy()
     
     confirm_btn = tk.Button(button_frame, text="확인", command=on_confirm, 
                           font=("맑은 고딕", 10), bg="#4CAF50", fg="white")
@@ -458,8 +607,9 @@ def _select_worksheets_gui(worksheet_names):
     y = (root.winfo_screenheight() // 2) - (root.winfo_height() // 2)
     root.geometry(f"+{x}+{y}")
     
-    root.mainloop()
-    root.destroy()
+    # 창 닫기(X) 버튼은 취소와 동일하게 처리
+    root.protocol("WM_DELETE_WINDOW", on_cancel)
+    root.wait_window()
     
     if selected_worksheets is None:  # 취소된 경우
         return [], []
@@ -496,7 +646,9 @@ def _select_worksheets_console(worksheet_names):
             # 유효한 범위 확인
             if all(0 <= i < len(worksheet_names) for i in selected_indices):
                 main_worksheets = [worksheet_names[i] for i in selected_indices]
-                back_data_worksheets = [name for i, name in enumerate(worksheet_names) if i not in selected_indices]
+                # 선택 번호는 집합으로 바꿔서 워크시트마다 리스트를 다시 훑지 않음
+                selected_set = set(selected_indices)
+                back_data_worksheets = [name for i, name in enumerate(worksheet_names) if i not in selected_set]
                 
                 print(f"\n✅ 본 조서 워크시트 ({len(main_worksheets)}개):")
                 for name in main_worksheets:
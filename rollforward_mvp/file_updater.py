@@ -4,17 +4,54 @@
 """
 
 import openpyxl
+import logging
+from openpyxl.xml import LXML
 from openpyxl.styles import PatternFill
-from openpyxl.comments import Comment
 import shutil
 import os
 from datetime import datetime
+from copy import copy
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_right
+import posixpath
+import stat
+import atexit
+import tempfile
+import zipfile
+from lxml import etree
+from openpyxl.xml.constants import SHEET_MAIN_NS, REL_NS, PKG_REL_NS
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import coordinate_from_string, column_index_from_string, range_boundaries
+from openpyxl.utils.exceptions import IllegalCharacterError
+from openpyxl.cell.cell import MergedCell
+
+# Why lxml을 필수로 요구하는가?
+# openpyxl은 lxml이 설치되어 있으면 자동으로 lxml 기반 XML 읽기/쓰기를 사용함
+# 없으면 표준 ElementTree로 동작해서 load_workbook/save가 2배 이상 느려지므로
+# 조용히 느려지는 대신 시작할 때 바로 알려줌
+if not LXML:
+    raise ImportError("lxml이 설치되어 있지 않습니다. Excel 처리 성능을 위해 'pip install lxml'로 설치해주세요.")
+
+# 선택 의존성: 설치되어 있으면 Rust 기반 calamine으로 소스(당기 PBC) 파일을 읽음
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
 
 # 색상 정의
+# Why 모듈 상수로 한 번만 만드는가?
+# 모든 셀에 같은 채우기 객체를 그대로 넣으면 openpyxl 스타일 표에 하나로 합쳐지고
+# 셀마다 PatternFill을 새로 만드는 비용도 들지 않음 (색상은 8자리 ARGB로 지정)
 RED_FILL = PatternFill(start_color="FFFF0000", end_color="FFFF0000", fill_type="solid")    # 빨간색 (롤포워딩 대상)
 GREEN_FILL = PatternFill(start_color="FF00FF00", end_color="FF00FF00", fill_type="solid")  # 초록색 (완료됨)
 YELLOW_FILL = PatternFill(start_color="FFFFFF00", end_color="FFFFFF00", fill_type="solid") # 노란색 (진행중)
 
+# Why 셀 단위 오류는 print 대신 logger.debug로 남기는가?
+# 깨진 시트에서는 셀마다 오류가 나서 수천 줄이 화면에 찍히고 그만큼 느려지므로
+# 화면에는 개수만 한 번 요약해서 보여주고, 셀 위치는 DEBUG 로그로만 남김
+logger = logging.getLogger(__name__)
+
 def update_file(matches, current_pbc_path, previous_ledger_path):
     """
     파일 업데이트 - 올바른 데이터 흐름 구현
@@ -44,96 +81,142 @@ def update_file(matches, current_pbc_path, previous_ledger_path):
             return False
         
         # 📂 1. 두 파일 열기
+        # Why 두 파일을 동시에 여는가?
+        # 소스와 대상 로드는 서로 독립적이고, 압축 해제(zlib)와 lxml 파싱 구간은 GIL을 놓으므로
+        # 스레드 두 개로 겹쳐서 읽으면 로드 대기 시간이 줄어듦
+        # (한 워크북의 시트들은 openpyxl 객체 하나로 묶여 있어 프로세스별로 나눠 저장할 수 없음)
         print(f"[file_updater.update_file] 📂 소스 파일 로드: {current_pbc_path}")
-        current_wb = openpyxl.load_workbook(current_pbc_path)  # 소스: 당기 PBC
-        
         print(f"[file_updater.update_file] 📂 대상 파일 로드: {previous_ledger_path}")
-        target_wb = openpyxl.load_workbook(previous_ledger_path)  # 대상: 전기 조서 (백데이터)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            current_future = executor.submit(_load_source_workbook, current_pbc_path)  # 소스: 당기 PBC (읽기만 함)
+            target_future = executor.submit(openpyxl.load_workbook, previous_ledger_path)  # 대상: 전기 조서 (백데이터)
+            current_wb = current_future.result()
+            target_wb = target_future.result()
         
         # ✏️ 2. 매칭된 데이터 업데이트 (실제 데이터 복사 구현)
         update_count = 0
         copied_rows_count = 0
         
+        # Why 바로 쓰지 않고 모아두는가?
+        # 1차로 모든 매칭의 쓰기 값을 {(시트명, 행, 열): 값}으로 모은 뒤
+        # 2차로 시트/행/열 순서대로 한 번에 쓰면 시트 조회와 셀 생성이 정렬된 순서로 일어남
+        # (같은 셀에 여러 번 쓰는 경우 마지막 값만 남는 것은 기존과 동일)
+        pending_writes = {}
+        
+        # Why 테이블별 결과를 미리 담아두는가?
+        # 같은 소스 테이블/대상 테이블이 여러 매칭에 반복해서 등장하므로
+        # 소스 데이터 추출과 {헤더: 인덱스} 사전 생성을 테이블당 한 번만 하기 위해
+        # (헤더마다 list.index로 처음부터 찾으면 매칭 수 × 헤더 수만큼 비교하게 됨)
+        source_data_by_table = {}
+        header_index_by_table = {}
+        # 시트 이름 → 시트 객체 (workbook[이름]은 매번 시트 목록을 처음부터 훑으므로 한 번만 찾아둠)
+        target_sheets = {name: target_wb[name] for name in target_wb.sheetnames}
+        
+        def header_index(table):
+            index = header_index_by_table.get(id(table))
+            if index is None:
+                index = {}
+                for idx, header in enumerate(table['headers']):
+                    index.setdefault(header, idx)  # 같은 헤더가 여러 개면 list.index처럼 첫 번째
+                header_index_by_table[id(table)] = index
+            return index
+        
         for match in matches:
             try:
-                print(f"[file_updater.update_file] ✏️ 데이터 복사 시작: {match['from_header']} (당기 PBC) → {match['to_header']} (백데이터)")
+                from_header = match['from_header']
+                to_header = match['to_header']
+                print(f"[file_updater.update_file] ✏️ 데이터 복사 시작: {from_header} (당기 PBC) → {to_header} (백데이터)")
                 
                 # 올바른 데이터 흐름: Current PBC → 백데이터
                 source_table = match['from_table']  # 당기 PBC 테이블 (소스)
                 target_table = match['to_table']    # 백데이터 시트 (대상)
                 
-                # 1단계: 당기 PBC에서 실제 데이터 추출
-                source_data = get_actual_data_from_workbook(source_table, current_wb)
+                # 1단계: 당기 PBC에서 실제 데이터 추출 (같은 테이블은 한 번만)
+                source_data = source_data_by_table.get(id(source_table))
+                if source_data is None:
+                    source_data = get_actual_data_from_workbook(source_table, current_wb)
+                    source_data_by_table[id(source_table)] = source_data
                 
                 if not source_data:
-                    print(f"[file_updater.update_file] ⚠️ 당기 PBC 데이터가 없습니다: {match['from_header']}")
+                    print(f"[file_updater.update_file] ⚠️ 당기 PBC 데이터가 없습니다: {from_header}")
                     continue
                 
                 # 2단계: 백데이터 시트에서 해당 컬럼 찾기
-                if target_table['sheet'] in target_wb.sheetnames:
-                    target_sheet = target_wb[target_table['sheet']]
-                    print(f"[file_updater.update_file] 📊 백데이터 시트 접근: {target_table['sheet']}")
+                target_sheet_name = target_table['sheet']
+                if target_sheet_name in target_sheets:
+                    print(f"[file_updater.update_file] 📊 백데이터 시트 접근: {target_sheet_name}")
                     
                     # 컬럼 인덱스 찾기 (에러 처리 강화)
+                    target_headers = target_table['headers']
+                    target_index = header_index(target_table)
                     try:
-                        if match['to_header'] in target_table['headers']:
-                            source_col_idx = source_table['headers'].index(match['from_header'])  # 당기 PBC 컬럼
-                            target_col_idx = target_table['headers'].index(match['to_header'])    # 백데이터 컬럼
+                        if to_header in target_index:
+                            source_col_idx = header_index(source_table)[from_header]  # 당기 PBC 컬럼
+                            target_col_idx = target_index[to_header]                   # 백데이터 컬럼
                         else:
                             # 향상된 디버깅: 사용 가능한 헤더 목록 표시
-                            print(f"[file_updater.update_file] ❌ 백데이터 헤더 '{match['to_header']}'를 찾을 수 없습니다")
-                            print(f"[file_updater.update_file] 🔎 백데이터 사용 가능한 헤더: {target_table['headers'][:5]}{'...' if len(target_table['headers']) > 5 else ''}")
-                            print(f"[file_updater.update_file] 💡 매칭: '{match['from_header']}' (당기 PBC) → '{match['to_header']}' (백데이터) (신뢰도: {match.get('confidence', 'N/A')})")
+                            print(f"[file_updater.update_file] ❌ 백데이터 헤더 '{to_header}'를 찾을 수 없습니다")
+                            print(f"[file_updater.update_file] 🔎 백데이터 사용 가능한 헤더: {target_headers[:5]}{'...' if len(target_headers) > 5 else ''}")
+                            print(f"[file_updater.update_file] 💡 매칭: '{from_header}' (당기 PBC) → '{to_header}' (백데이터) (신뢰도: {match.get('confidence', 'N/A')})")
                             continue
-                    except (ValueError, IndexError) as idx_error:
+                    except (KeyError, IndexError) as idx_error:
                         print(f"[file_updater.update_file] ❌ 헤더 인덱스 오류: {idx_error}")
-                        print(f"[file_updater.update_file] 🔎 문제 상세: from='{match['from_header']}' (당기 PBC), to='{match['to_header']}' (백데이터)")
+                        print(f"[file_updater.update_file] 🔎 문제 상세: from='{from_header}' (당기 PBC), to='{to_header}' (백데이터)")
                         print(f"[file_updater.update_file] 🔎 당기 PBC 헤더: {source_table['headers'][:3]}...")
-                        print(f"[file_updater.update_file] 🔎 백데이터 헤더: {target_table['headers'][:3]}...")
+                        print(f"[file_updater.update_file] 🔎 백데이터 헤더: {target_headers[:3]}...")
                         continue
                         
                     # 3단계: 실제 데이터 복사 - 당기 PBC → 백데이터 시트
                     target_start_row = target_table['start_row'] + 1  # 헤더 다음 행부터
                     
-                    try:
-                        for row_idx, source_row in enumerate(source_data):
-                            if source_col_idx < len(source_row):
-                                target_row = target_start_row + row_idx
-                                target_col = target_col_idx + 1  # openpyxl은 1부터 시작
-                                
-                                # 실제 데이터 복사: 당기 PBC → 백데이터
-                                source_value = source_row[source_col_idx]
-                                if source_value is not None and str(source_value).strip():
-                                    try:
-                                        target_sheet.cell(target_row, target_col, source_value)
-                                        copied_rows_count += 1
-                                    except Exception as cell_error:
-                                        print(f"[file_updater.update_file] ⚠️ 백데이터 셀 복사 오류 ({target_row}, {target_col}): {cell_error}")
-                    except Exception as copy_error:
-                        print(f"[file_updater.update_file] ❌ 백데이터 복사 중 오류: {copy_error}")
-                    
-                    # 4단계: 백데이터 헤더에 빨간색 표시 (업데이트 완료 표시)
-                    header_row = target_table['start_row']
-                    header_col = target_col_idx + 1
+                    # 값만 모으는 단계라 예외가 날 곳이 없음 (문제가 생기면 바깥 매칭 단위 except에서 처리)
+                    target_col = target_col_idx + 1  # openpyxl은 1부터 시작
+                    for row_idx, source_row in enumerate(source_data):
+                        if source_col_idx < len(source_row):
+                            # 실제 데이터 복사: 당기 PBC → 백데이터 (쓰기는 아래에서 한 번에)
+                            source_value = source_row[source_col_idx]
+                            if source_value is not None and (not isinstance(source_value, str) or source_value.strip()):
+                                pending_writes[(target_sheet_name, target_start_row + row_idx, target_col)] = source_value
                     
-                    header_cell = target_sheet.cell(header_row, header_col)
                     # ✅ 백데이터 업데이트 완료 - 헤더는 빨간색 칠하지 않음 (요구사항 반영)
-                    # header_cell.fill = RED_FILL  # 주석 처리: 헤더는 색상 표시 안 함
+                    # target_sheets[target_sheet_name].cell(target_table['start_row'], target_col).fill = RED_FILL  # 주석 처리: 헤더는 색상 표시 안 함
                     
-                    print(f"[file_updater.update_file] ✅ 백데이터 업데이트 완료: {len(source_data)}행 → {match['to_header']} (백데이터)")
+                    print(f"[file_updater.update_file] ✅ 백데이터 업데이트 완료: {len(source_data)}행 → {to_header} (백데이터)")
                     update_count += 1
                 else:
-                    print(f"[file_updater.update_file] ❌ 백데이터 시트를 찾을 수 없습니다: {target_table['sheet']}")
+                    print(f"[file_updater.update_file] ❌ 백데이터 시트를 찾을 수 없습니다: {target_sheet_name}")
                     
             except Exception as e:
                 print(f"[file_updater.update_file] ❌ 개별 백데이터 업데이트 실패: {e}")
                 continue
         
+        # ✏️ 3. 모아둔 값을 시트/행/열 순서로 한 번에 쓰기
+        # Why 셀마다 try를 두지 않는가?
+        # try/except를 반복문 바깥에 한 번만 두고, 쓰기에 실패하면(병합 셀, 쓸 수 없는 문자 등)
+        # 그 셀만 건너뛰고 같은 반복자에서 이어서 쓰면 셀별 try 없이도 결과가 같음
+        # (IllegalCharacterError는 ValueError가 아닌 Exception 하위 클래스라서 따로 잡아야 함)
+        applied_writes = {}  # 실제로 써진 셀만 (병합 셀 등 쓰기 실패한 셀은 제외)
+        write_error_count = 0
+        write_keys = iter(sorted(pending_writes))
+        while True:
+            try:
+                for key in write_keys:
+                    sheet_name, target_row, target_col = key
+                    target_sheets[sheet_name].cell(row=target_row, column=target_col).value = pending_writes[key]
+                    applied_writes[key] = pending_writes[key]
+                    copied_rows_count += 1
+                break
+            except (AttributeError, ValueError, TypeError, IllegalCharacterError) as cell_error:
+                write_error_count += 1
+                logger.debug("[file_updater.update_file] 백데이터 셀 복사 오류 (%s, %s, %s): %s",
+                             sheet_name, target_row, target_col, cell_error)
+        if write_error_count:
+            print(f"[file_updater.update_file] ⚠️ 백데이터 셀 복사 오류: {write_error_count}개 셀 건너뜀")
+        
         # 💾 4. 대상 파일(백데이터) 저장 및 결과 리포트
         try:
             if update_count > 0:
                 # 파일 저장 전 권한 체크 및 자동 수정
-                import stat
                 try:
                     # 파일 쓰기 권한 확인
                     file_stat = os.stat(previous_ledger_path)
@@ -154,20 +237,21 @@ def update_file(matches, current_pbc_path, previous_ledger_path):
                 
                 print(f"[file_updater.update_file] 💾 백데이터 파일 저장 중...")
                 
-                # 파일이 다른 프로세스에서 사용 중인지 확인
-                def is_file_locked(file_path):
-                    try:
-                        # 파일을 쓰기 모드로 열어보기
-                        with open(file_path, 'a'):
-                            return False
-                    except IOError:
-                        return True
-                
-                if is_file_locked(previous_ledger_path):
-                    print(f"[file_updater.update_file] ⚠️ 파일이 다른 프로그램에서 사용 중입니다")
-                    print(f"[file_updater.update_file] 💡 Excel이나 다른 프로그램에서 파일을 닫고 다시 시도해주세요")
-                
-                target_wb.save(previous_ledger_path)
+                # Why 저장 전에 파일 잠금을 미리 확인하지 않는가?
+                # 확인과 저장 사이에 다른 프로그램이 파일을 열 수 있어서 미리 확인해도 보장이 안 되고
+                # xlsx(zip) 파일을 추가 모드로 여는 것 자체가 위험하므로
+                # 다른 프로그램이 사용 중이면 save()에서 발생하는 PermissionError를 아래에서 안내함
+                # Why 바뀐 셀만 패치하는가?
+                # target_wb.save()는 손대지 않은 시트와 스타일까지 전부 다시 직렬화하므로
+                # 바뀐 셀이 적으면 해당 시트 XML만 고쳐서 zip에 바꿔 넣는 편이 훨씬 빠름
+                # (패치할 수 없는 경우에는 기존처럼 전체 저장)
+                touched_cell_count = sum(len(target_sheets[name]._cells)
+                                         for name in {key[0] for key in applied_writes})
+                if (applied_writes and len(applied_writes) <= touched_cell_count * _PATCH_MAX_CHANGE_RATIO
+                        and _patch_xlsx_cells(previous_ledger_path, applied_writes)):
+                    print(f"[file_updater.update_file] ⚡ 변경된 셀만 시트 XML에 반영")
+                else:
+                    target_wb.save(previous_ledger_path)
                 print(f"[file_updater.update_file] ✅ 백데이터 파일 저장 성공!")
                 
                 print(f"\n[file_updater.update_file] 🎉 백데이터 업데이트 완료!")
@@ -234,6 +318,324 @@ def update_file(matches, current_pbc_path, previous_ledger_path):
         
         return False
 
+# 바뀐 셀 비율이 이보다 크면 시트 XML 패치 대신 openpyxl로 전체 저장
+_PATCH_MAX_CHANGE_RATIO = 0.2
+
+_MAIN = '{%s}' % SHEET_MAIN_NS
+_XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+
+
+class _PatchNotApplicable(Exception):
+    """시트 XML 패치로 처리할 수 없는 경우 (전체 저장으로 돌아감)"""
+
+
+def _set_xml_cell_value(cell_el, value):
+    """<c> 요소의 값을 교체 (스타일 s 속성은 유지)"""
+    if isinstance(value, bool):
+        cell_type, text = 'b', '1' if value else '0'
+    elif isinstance(value, (int, float)):
+        if value != value or value in (float('inf'), float('-inf')):
+            raise _PatchNotApplicable("NaN/무한대 값")
+        cell_type, text = None, repr(value)
+    elif isinstance(value, str):
+        # Why '='로 시작하는 문자열은 제외하는가? openpyxl은 수식으로 저장하므로 같은 결과를 보장할 수 없음
+        if value.startswith('='):
+            raise _PatchNotApplicable("수식 문자열")
+        cell_type, text = 'inlineStr', value
+    else:
+        # 날짜 등은 표시 형식(스타일)까지 바꿔야 하므로 openpyxl 저장에 맡김
+        raise _PatchNotApplicable(f"지원하지 않는 값 형식: {type(value).__name__}")
+    
+    for child in list(cell_el):
+        cell_el.remove(child)
+    cell_el.attrib.pop('t', None)
+    if cell_type == 'inlineStr':
+        cell_el.set('t', cell_type)
+        text_el = etree.SubElement(etree.SubElement(cell_el, _MAIN + 'is'), _MAIN + 't')
+        if value != value.strip():
+            text_el.set(_XML_SPACE, 'preserve')
+        text_el.text = text  # XML에 쓸 수 없는 제어 문자면 ValueError
+    else:
+        if cell_type:
+            cell_el.set('t', cell_type)
+        etree.SubElement(cell_el, _MAIN + 'v').text = text
+
+
+def _child_inserter(parent, children, key_of):
+    """정렬된 위치에 새 자식 요소를 끼워 넣는 함수 생성 (기존 자식은 key 순으로 정렬되어 있음)"""
+    keys = [key_of(child) for child in children]
+    
+    def insert(key, element):
+        pos = bisect_right(keys, key)
+        if pos < len(keys):
+            children[pos].addprevious(element)
+        else:
+            parent.append(element)
+    return insert
+
+
+def _patch_sheet_xml(xml_bytes, cell_writes):
+    """
+    시트 XML에 {(행, 열): 값}을 반영한 새 XML 반환
+    
+    Why 새 셀에 inlineStr을 쓰는가?
+    공유 문자열(sharedStrings.xml)을 건드리지 않으면 시트 파일 하나만 바꾸면 되기 때문
+    """
+    root = etree.fromstring(xml_bytes)
+    sheet_data = root.find(_MAIN + 'sheetData')
+    if sheet_data is None:
+        raise _PatchNotApplicable("sheetData 없음")
+    
+    row_els = sheet_data.findall(_MAIN + 'row')
+    if any(row_el.get('r') is None for row_el in row_els):
+        raise _PatchNotApplicable("행 번호가 없는 행")
+    rows = {int(row_el.get('r')): row_el for row_el in row_els}
+    insert_row = _child_inserter(sheet_data, row_els, lambda el: int(el.get('r')))
+    
+    writes_by_row = {}
+    for (row_num, col_num), value in cell_writes.items():
+        writes_by_row.setdefault(row_num, []).append((col_num, value))
+    
+    for row_num in sorted(writes_by_row):
+        row_el = rows.get(row_num)
+        if row_el is None:
+            row_el = etree.Element(_MAIN + 'row', r=str(row_num))
+            insert_row(row_num, row_el)
+        # spans는 열 범위 힌트라서 새 셀이 범위를 벗어나면 틀려지므로 제거
+        row_el.attrib.pop('spans', None)
+        
+        cell_els = row_el.findall(_MAIN + 'c')
+        if any(cell_el.get('r') is None for cell_el in cell_els):
+            raise _PatchNotApplicable("좌표가 없는 셀")
+        column_of = lambda el: column_index_from_string(coordinate_from_string(el.get('r'))[0])
+        cells = {column_of(cell_el): cell_el for cell_el in cell_els}
+        insert_cell = _child_inserter(row_el, cell_els, column_of)
+        
+        for col_num, value in sorted(writes_by_row[row_num], key=lambda item: item[0]):
+            cell_el = cells.get(col_num)
+            if cell_el is None:
+                cell_el = etree.Element(_MAIN + 'c', r=f"{get_column_letter(col_num)}{row_num}")
+                insert_cell(col_num, cell_el)
+            elif cell_el.find(_MAIN + 'f') is not None:
+                # 수식을 값으로 덮으면 calcChain/공유 수식이 깨질 수 있으므로 전체 저장에 맡김
+                raise _PatchNotApplicable("수식 셀 덮어쓰기")
+            _set_xml_cell_value(cell_el, value)
+    
+    # 사용 범위(dimension)가 새 셀까지 포함하도록 넓힘
+    dimension = root.find(_MAIN + 'dimension')
+    if dimension is not None and dimension.get('ref'):
+        min_col, min_row, max_col, max_row = range_boundaries(dimension.get('ref'))
+        write_rows = [row_num for row_num, _ in cell_writes]
+        write_cols = [col_num for _, col_num in cell_writes]
+        min_row, max_row = min([min_row or 1] + write_rows), max([max_row or 1] + write_rows)
+        min_col, max_col = min([min_col or 1] + write_cols), max([max_col or 1] + write_cols)
+        dimension.set('ref', f"{get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{max_row}")
+    
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+def _sheet_part_paths(zin):
+    """시트 이름 → zip 안의 시트 XML 경로 (xl/workbook.xml과 관계 파일에서 찾음)"""
+    workbook = etree.fromstring(zin.read('xl/workbook.xml'))
+    rels = etree.fromstring(zin.read('xl/_rels/workbook.xml.rels'))
+    targets = {rel.get('Id'): rel.get('Target') for rel in rels.iter('{%s}Relationship' % PKG_REL_NS)}
+    
+    part_paths = {}
+    for sheet in workbook.iter(_MAIN + 'sheet'):
+        target = targets.get(sheet.get('{%s}id' % REL_NS))
+        if target:
+            part_paths[sheet.get('name')] = target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join('xl', target))
+    return workbook, part_paths
+
+
+def _request_full_calc(workbook):
+    """값이 바뀐 셀을 참조하는 수식이 Excel에서 다시 계산되도록 fullCalcOnLoad 설정"""
+    calc_pr = workbook.find(_MAIN + 'calcPr')
+    if calc_pr is None:
+        calc_pr = etree.Element(_MAIN + 'calcPr')
+        # 스키마 순서: sheets, functionGroups, externalReferences, definedNames 다음에 calcPr
+        anchor = None
+        for tag in ('sheets', 'functionGroups', 'externalReferences', 'definedNames'):
+            found = workbook.find(_MAIN + tag)
+            if found is not None:
+                anchor = found
+        if anchor is None:
+            raise _PatchNotApplicable("workbook.xml에 sheets 없음")
+        anchor.addnext(calc_pr)
+    calc_pr.set('fullCalcOnLoad', '1')
+    return etree.tostring(workbook, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+def _patch_xlsx_cells(path, cell_writes):
+    """
+    xlsx(zip) 안에서 바뀐 시트 XML만 교체해서 저장
+    
+    Parameters:
+        path (str): 대상 xlsx 파일 경로 (같은 경로에 덮어씀)
+        cell_writes (dict): {(시트명, 행, 열): 값}
+    
+    Returns:
+        bool: 패치 저장 성공 여부 (False이면 파일은 그대로이고 호출하는 쪽에서 전체 저장)
+    
+    Why 손대지 않은 부분은 그대로 복사하는가?
+    openpyxl 전체 저장은 모든 시트/스타일을 다시 만들고, 차트·이미지처럼 openpyxl이
+    읽지 못하는 부분은 빠뜨리기도 하므로 바뀐 시트만 바꾸면 빠르고 원본도 더 잘 보존됨
+    """
+    writes_by_sheet = {}
+    for (sheet_name, row_num, col_num), value in cell_writes.items():
+        writes_by_sheet.setdefault(sheet_name, {})[(row_num, col_num)] = value
+    
+    try:
+        with zipfile.ZipFile(path) as zin:
+            workbook, part_paths = _sheet_part_paths(zin)
+            patched_parts = {'xl/workbook.xml': _request_full_calc(workbook)}
+            for sheet_name, sheet_writes in writes_by_sheet.items():
+                part_path = part_paths.get(sheet_name)
+                if part_path is None:
+                    raise _PatchNotApplicable(f"시트 파일을 찾을 수 없음: {sheet_name}")
+                patched_parts[part_path] = _patch_sheet_xml(zin.read(part_path), sheet_writes)
+            
+            # 같은 폴더에 임시 파일로 만든 뒤 교체 (중간에 실패해도 원본은 그대로)
+            fd, temp_path = tempfile.mkstemp(suffix='.xlsx', dir=os.path.dirname(os.path.abspath(path)))
+            os.close(fd)
+            try:
+                with zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_DEFLATED) as zout:
+                    for item in zin.infolist():
+                        data = patched_parts.get(item.filename)
+                        zout.writestr(item, data if data is not None else zin.read(item.filename))
+            except BaseException:
+                os.remove(temp_path)
+                raise
+    except (_PatchNotApplicable, KeyError, ValueError, zipfile.BadZipFile, etree.XMLSyntaxError) as e:
+        print(f"[file_updater._patch_xlsx_cells] ℹ️ 셀 패치 대신 전체 저장: {e}")
+        return False
+    
+    try:
+        os.chmod(temp_path, stat.S_IMODE(os.stat(path).st_mode))
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return True
+
+
+class _CalamineSheet:
+    """
+    calamine으로 읽은 시트 값을 openpyxl 읽기 전용 시트처럼 iter_rows로 꺼내 쓰게 해주는 래퍼
+    
+    Why 래퍼를 두는가?
+    calculate_table_dimension/get_actual_data_from_workbook이 openpyxl 시트의
+    iter_rows(values_only=True)와 parent.read_only만 사용하므로, 그 부분만 맞춰주면
+    경계 계산과 데이터 추출 로직을 그대로 재사용할 수 있음
+    """
+    
+    def __init__(self, parent, rows):
+        self.parent = parent
+        self._rows = rows
+        self.max_row = len(rows)
+    
+    def iter_rows(self, min_row=1, max_row=None, min_col=1, max_col=None, values_only=True):
+        max_row = self.max_row if max_row is None else min(max_row, self.max_row)
+        width = max_col - min_col + 1 if max_col else None
+        for row in self._rows[min_row - 1:max_row]:
+            values = row[min_col - 1:max_col] if max_col else row[min_col - 1:]
+            if width is not None and len(values) < width:
+                values = values + [None] * (width - len(values))
+            yield tuple(values)
+
+
+class _CalamineSourceWorkbook:
+    """calamine 워크북을 update_file의 소스 워크북 자리에 쓸 수 있게 감싼 읽기 전용 워크북"""
+    
+    read_only = True
+    
+    def __init__(self, path):
+        self._wb = CalamineWorkbook.from_path(path)
+        self.sheetnames = list(self._wb.sheet_names)
+        self._sheets = {}
+    
+    def __getitem__(self, sheet_name):
+        sheet = self._sheets.get(sheet_name)
+        if sheet is None:
+            if sheet_name not in self.sheetnames:
+                raise KeyError(sheet_name)
+            # Why skip_empty_area=False인가? 앞쪽 빈 행/열을 건너뛰면 행 번호(start_row)가 어긋남
+            raw_rows = self._wb.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+            # calamine은 빈 셀을 ""로, 정수를 10.0 같은 실수로 돌려주므로 openpyxl과 같은 값으로 맞춤
+            rows = [[None if value == "" else int(value) if isinstance(value, float) and value.is_integer() else value
+                     for value in row]
+                    for row in raw_rows]
+            sheet = self._sheets[sheet_name] = _CalamineSheet(self, rows)
+        return sheet
+    
+    def close(self):
+        self._sheets.clear()
+        self._wb.close()
+
+
+def _load_source_workbook(path):
+    """
+    update_file의 소스(당기 PBC) 워크북 열기
+    
+    Why 소스만 calamine으로 여는가?
+    소스는 값만 읽으므로 XML 해석을 Rust로 처리하는 calamine이 openpyxl보다 훨씬 빠름
+    대상(전기 조서)은 서식/병합을 보존한 채 저장해야 하므로 계속 openpyxl을 사용
+    calamine은 수식 대신 저장된 계산 결과값을 돌려줌 (data_only=True와 같음)
+    calamine이 없거나 읽지 못하는 파일이면 openpyxl(data_only=True)로 엶
+    """
+    if CalamineWorkbook is not None:
+        try:
+            return _CalamineSourceWorkbook(path)
+        except Exception as e:
+            print(f"[file_updater._load_source_workbook] ⚠️ calamine 로드 실패, openpyxl로 다시 시도: {e}")
+    # Why fallback도 data_only=True인가?
+    # calamine 유무에 따라 같은 소스에서 수식 문자열/계산값이 다르게 복사되지 않도록 맞춤
+    return openpyxl.load_workbook(path, data_only=True)
+
+# 경로 → (수정 시각, 읽기 전용 워크북), 가장 오래 안 쓴 항목이 앞에 옴
+_RO_CACHE_SIZE = 8
+_ro_cache = OrderedDict()
+
+def _load_ro(path, mtime_ns):
+    """
+    읽기 전용 워크북을 열어서 캐시 (같은 파일의 여러 테이블을 읽을 때 한 번만 열기)
+    
+    Why 수정 시각(mtime_ns)을 함께 저장하는가?
+    파일이 바뀌면 이전 워크북을 닫고 자동으로 새로 열게 하기 위해
+    캐시된 워크북은 여러 호출이 공유하므로 호출하는 쪽에서 close()하면 안 됨
+    
+    Why lru_cache 대신 직접 관리하는가?
+    읽기 전용 워크북은 close() 전까지 파일 핸들을 잡고 있는데, lru_cache는 밀려난 항목을
+    닫지 않아 핸들이 남고 Windows에서는 파일이 잠긴 채로 남음
+    여기서는 밀려나거나 파일이 바뀐 워크북을 바로 닫음 (전부 닫으려면 _load_ro.cache_clear())
+    """
+    cached = _ro_cache.get(path)
+    if cached is not None:
+        if cached[0] == mtime_ns:
+            _ro_cache.move_to_end(path)
+            return cached[1]
+        del _ro_cache[path]
+        cached[1].close()
+    
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    _ro_cache[path] = (mtime_ns, wb)
+    while len(_ro_cache) > _RO_CACHE_SIZE:
+        _, (_, evicted_wb) = _ro_cache.popitem(last=False)
+        evicted_wb.close()
+    return wb
+
+def _clear_ro_cache():
+    """캐시된 읽기 전용 워크북을 모두 닫고 캐시 비우기 (프로그램 종료 시에도 호출됨)"""
+    while _ro_cache:
+        _, (_, wb) = _ro_cache.popitem()
+        try:
+            wb.close()
+        except Exception as e:
+            print(f"[file_updater._clear_ro_cache] ⚠️ 워크북 닫기 실패: {e}")
+
+_load_ro.cache_clear = _clear_ro_cache
+atexit.register(_clear_ro_cache)
+
 def get_actual_data_from_table(table_info, source_file, empty_streak_limit=2):
     """
     🎯 1순위+2순위 개선 적용: 테이블 경계 기준으로 데이터 추출
@@ -243,7 +645,7 @@ def get_actual_data_from_table(table_info, source_file, empty_streak_limit=2):
     - 개선: 매개변수화된 빈 행 감지 + 테이블 경계 기준 처리
     
     What 이 함수가 하는 일?
-    1. Excel 파일을 열기 (data_only=True로 수식 결과값만 가져오기)
+    1. Excel 파일을 읽기 전용으로 열기 (data_only=True로 수식 결과값만 가져오기, 같은 파일은 한 번만 열기)
     2. 테이블 경계를 정확히 계산해서 성능 최적화
     3. 매개변수화된 연속 빈 행 감지로 정확한 데이터 끝 판단
     4. 추출한 데이터를 리스트로 반환
@@ -264,53 +666,65 @@ def get_actual_data_from_table(table_info, source_file, empty_streak_limit=2):
     try:
         # Why data_only=True를 사용하는가?
         # 수식이 아닌 계산된 결과값만 가져오기 위해 (예: =SUM(A1:A10) → 100)
-        wb = openpyxl.load_workbook(source_file, data_only=True)
+        # Why read_only=True를 사용하는가?
+        # 값만 읽으면 되므로 셀 객체를 전부 메모리에 만들지 않고 시트 XML을 흘려 읽기 위해
+        # (일반 모드는 파일 크기의 수십 배 메모리를 사용함)
+        # Why _load_ro를 거치는가?
+        # 같은 파일의 테이블을 여러 번 읽을 때 매번 워크북을 새로 열지 않기 위해
+        wb = _load_ro(os.path.abspath(source_file), os.stat(source_file).st_mtime_ns)
         
         # 3순위 개선: 안전 장치 - 시트 존재 확인
         if table_info['sheet'] not in wb.sheetnames:
             print(f"[get_actual_data_from_table] ❌ 시트를 찾을 수 없음: {table_info['sheet']}")
-            wb.close()
             return []
         
         sheet = wb[table_info['sheet']]
         
-        # 🎯 1순위 개선: 테이블 경계 기준으로 범위 계산
-        print(f"[get_actual_data_from_table] 🔍 테이블 경계 기준 범위 계산 중...")
-        actual_max_row, table_col_count = calculate_table_dimension(sheet, table_info, empty_streak_limit)
+        # 3순위 개선: 안전 장치 - 잘못된 매개변수 보정 (calculate_table_dimension과 같은 기준)
+        if not (1 <= empty_streak_limit <= 10):
+            print(f"[get_actual_data_from_table] ⚠️ empty_streak_limit 값이 잘못됨 ({empty_streak_limit}), 기본값 2로 설정")
+            empty_streak_limit = 2
         
         # 헤더 다음 행부터 데이터 추출
         # Why +1? 헤더는 제외하고 실제 데이터만 가져오기 위해
         start_row = table_info['start_row'] + 1
-        data_rows = []  # 추출한 데이터를 저장할 리스트
+        table_col_count = len(table_info['headers'])  # 헤더 개수만큼만! 다른 컬럼은 무시
+        half_headers = len(table_info['headers']) / 2
+        max_scan_rows = 1000
+        
+        # 🎯 1순위 개선: 테이블 경계 기준으로 범위 계산 + 데이터 추출을 한 번에
+        # Why calculate_table_dimension을 따로 부르지 않는가?
+        # 읽기 전용 시트에서 sheet.cell()은 호출할 때마다 시트 XML을 처음부터 다시 읽으므로
+        # 행을 한 번만 흘려 읽으면서 연속 빈 행으로 끝을 판단하고 데이터도 같이 모음
+        print(f"[get_actual_data_from_table] 🔍 테이블 경계 기준 범위 계산 중...")
+        scanned_rows = []
+        data_row_count = 0  # 마지막 데이터 행까지의 행 수
+        empty_streak = 0
+        
+        for row_values in sheet.iter_rows(min_row=start_row, max_row=start_row + max_scan_rows - 1,
+                                          min_col=1, max_col=table_col_count, values_only=True):
+            # 빈 셀은 빈 문자열로 바꾸고 빈 셀 수를 셈
+            row_data = ["" if value is None or (isinstance(value, str) and not value.strip()) else value
+                        for value in row_values]
+            scanned_rows.append(row_data)
+            
+            if row_data.count("") < table_col_count:
+                # 데이터가 있는 행을 발견! 마지막 데이터 행 업데이트
+                data_row_count = len(scanned_rows)
+                empty_streak = 0
+            else:
+                empty_streak += 1
+                if empty_streak >= empty_streak_limit:
+                    print(f"[get_actual_data_from_table] 📍 연속 {empty_streak}개 빈 행 감지 → 데이터 끝으로 판단")
+                    break
         
+        actual_max_row = start_row + data_row_count - 1
         print(f"[get_actual_data_from_table] 📊 최적화된 범위로 데이터 추출: {start_row}~{actual_max_row}행")
         
-        # 🎯 개선된 방식: 계산된 범위만 처리
-        for row in range(start_row, actual_max_row + 1):
-            row_data = []
-            empty_count = 0
-            
-            # 각 컬럼의 값을 하나씩 확인 (테이블 컬럼 범위만)
-            for col in range(1, table_col_count + 1):
-                try:
-                    cell_value = sheet.cell(row, col).value
-                    if cell_value is not None and str(cell_value).strip():
-                        # 실제 값이 있으면 그대로 저장
-                        row_data.append(cell_value)
-                    else:
-                        # 빈 셀이면 빈 문자열로 저장
-                        row_data.append("")
-                        empty_count += 1
-                except Exception:
-                    # 셀 접근 오류는 빈 셀로 처리
-                    row_data.append("")
-                    empty_count += 1
-            
-            # 행의 절반 이상이 비어있으면 의미 없는 행으로 판단
-            if empty_count < len(table_info['headers']) / 2:
-                data_rows.append(row_data)  # 의미있는 데이터가 있는 행만 추가
+        # 행의 절반 이상이 비어있으면 의미 없는 행으로 판단
+        data_rows = [row_data for row_data in scanned_rows[:data_row_count]
+                     if row_data.count("") < half_headers]
         
-        wb.close()
         print(f"[get_actual_data_from_table] ✅ 테이블 경계 기준 데이터 추출 완료: {len(data_rows)}행")
         print(f"[get_actual_data_from_table] 🚀 성능 향상: 테이블 영역만 정확히 처리")
         return data_rows
@@ -319,10 +733,62 @@ def get_actual_data_from_table(table_info, source_file, empty_streak_limit=2):
         print(f"[get_actual_data_from_table] ❌ 데이터 추출 실패: {e}")
         return []
 
-def write_data_to_table(table_info, target_file, data_rows, header_mapping):
-    """테이블에 데이터 쓰기 (Phase 1에서 구현 예정)"""
+def write_data_to_table(table_info, target_file, data_rows, header_mapping, use_write_only=False):
+    """
+    테이블에 데이터 쓰기 (Phase 1에서 구현 예정)
+    
+    Why use_write_only 옵션이 있는가?
+    테이블 전체를 다시 쓰는 대용량 결과는 쓰기 전용 워크북이 행을 바로 XML로 흘려 쓰므로
+    셀 객체를 메모리에 쌓지 않아 메모리 사용량이 거의 일정하게 유지됨
+    쓰기 전용 워크북은 load_workbook으로 연 파일에 이어 쓸 수 없어서
+    기존 파일을 읽기 전용으로 열고 시트를 한 행씩 새 워크북에 옮겨 담는 방식으로 복제함
+    - 다른 시트: 값(수식 포함)을 그대로 복사
+    - 대상 시트: 헤더 위쪽 행은 그대로, 헤더와 데이터는 새 내용으로, 테이블 아래쪽 행은 버림
+    주의: 서식/병합/열 너비는 복사되지 않으므로 서식이 중요한 조서에는 기본 모드를 사용
+    """
     
     try:
+        if use_write_only:
+            target_sheet_name = table_info['sheet']
+            header_row = table_info['start_row']
+            
+            source_wb = None
+            if os.path.exists(target_file):
+                source_wb = openpyxl.load_workbook(target_file, read_only=True)
+            sheet_names = list(source_wb.sheetnames) if source_wb is not None else []
+            if target_sheet_name not in sheet_names:
+                sheet_names.append(target_sheet_name)
+            
+            wb = openpyxl.Workbook(write_only=True)
+            try:
+                for sheet_name in sheet_names:
+                    sheet = wb.create_sheet(sheet_name)
+                    original = source_wb[sheet_name] if source_wb is not None and sheet_name in source_wb.sheetnames else None
+                    
+                    if sheet_name != target_sheet_name:
+                        for row in original.iter_rows(values_only=True):
+                            sheet.append(row)
+                        continue
+                    
+                    # 기존과 같은 위치(start_row)에 헤더가 오도록 위쪽 행을 먼저 채움
+                    kept_rows = 0
+                    if original is not None and header_row > 1:
+                        for row in original.iter_rows(max_row=header_row - 1, values_only=True):
+                            sheet.append(row)
+                            kept_rows += 1
+                    for _ in range(header_row - 1 - kept_rows):
+                        sheet.append([])
+                    sheet.append(table_info['headers'])
+                    for data_row in data_rows:
+                        sheet.append(data_row)
+            finally:
+                # 같은 경로에 저장하기 전에 원본 zip 핸들을 닫음
+                if source_wb is not None:
+                    source_wb.close()
+            
+            wb.save(target_file)
+            return True
+        
         wb = openpyxl.load_workbook(target_file)
         sheet = wb[table_info['sheet']]
         
@@ -394,22 +860,30 @@ def calculate_table_dimension(sheet, table_info, empty_streak_limit=2):
     # Why 1000으로 제한? 너무 큰 파일을 무한정 스캔하면 시간이 오래 걸리므로
     max_scan_rows = 1000
     
+    scan_end_row = data_start_row + max_scan_rows - 1
+    
+    # Why 일반 시트는 sheet.max_row까지만 스캔하는가?
+    # 일반 모드의 iter_rows는 없는 셀을 빈 셀로 새로 만들어서 시트 크기(max_row)를 늘려버림
+    # max_row 아래는 어차피 모두 빈 행이므로 거기까지만 읽어도 결과는 같음
+    # (읽기 전용 시트는 셀을 만들지 않고, 파일에 기록된 max_row가 부정확할 수 있어 그대로 둠)
+    if not sheet.parent.read_only:
+        scan_end_row = min(scan_end_row, sheet.max_row)
+    
     print(f"[calculate_table_dimension] 🔍 테이블 범위 계산: {len(headers)}개 컬럼 × 최대 {max_scan_rows}행 스캔")
     
-    for row_num in range(data_start_row, data_start_row + max_scan_rows):
+    # Why iter_rows(values_only=True)를 사용하는가?
+    # 셀마다 sheet.cell()로 좌표를 찾는 대신 행 단위로 값 튜플만 받아서 확인하기 위해
+    # (읽기 전용 시트에서는 시트 XML을 한 번만 흘려 읽게 됨)
+    # 헤더가 없으면(max_col=0) openpyxl이 시트 전체 열로 해석하므로 스캔하지 않음
+    rows = sheet.iter_rows(min_row=data_start_row, max_row=scan_end_row,
+                           min_col=min_col, max_col=max_col, values_only=True) if max_col else ()
+    
+    for row_num, row_values in enumerate(rows, data_start_row):
         # 🎯 핵심: 해당 테이블의 컬럼 범위에서만 데이터 확인
-        row_has_data = False
-        
-        for col_num in range(min_col, max_col + 1):
-            try:
-                cell_value = sheet.cell(row_num, col_num).value
-                # What: 실제 데이터가 있는지 확인 (None이 아니고 빈 문자열도 아님)
-                if cell_value is not None and str(cell_value).strip():
-                    row_has_data = True
-                    break  # 하나라도 데이터가 있으면 이 행은 유효한 데이터 행
-            except Exception:
-                # 셀 접근 오류는 무시하고 계속
-                continue
+        # What: 실제 데이터가 있는지 확인 (None이 아니고 빈 문자열도 아님)
+        # Why 문자열일 때만 strip()하는가? 숫자/날짜는 항상 값이 있으므로 str()로 바꿀 필요가 없음
+        row_has_data = any(value is not None and (not isinstance(value, str) or value.strip())
+                           for value in row_values)
         
         if row_has_data:
             # 데이터가 있는 행을 발견! 최대 행 업데이트
@@ -436,7 +910,7 @@ def calculate_table_dimension(sheet, table_info, empty_streak_limit=2):
     
     return actual_max_row, max_col
 
-def get_actual_data_from_workbook(table_info, workbook, empty_streak_limit=2):
+def get_actual_data_from_workbook(table_info, workbook, empty_streak_limit=2, dimension=None, as_array=False):
     """
     🎯 1순위 개선 적용: 테이블 경계 기준으로 데이터 추출
     
@@ -454,17 +928,26 @@ def get_actual_data_from_workbook(table_info, workbook, empty_streak_limit=2):
         table_info (dict): 테이블 정보
         workbook: 이미 로드된 openpyxl 워크북 객체  
         empty_streak_limit (int): 연속 빈 행 기준 (2순위 개선)
+        dimension (tuple): 이미 계산한 (max_row, max_col), 있으면 경계 계산을 건너뜀
+        as_array (bool): True이면 (행 수, 컬럼 수) 모양의 numpy object 배열로 반환
         
     Returns:
-        list: 추출한 데이터 (행별 리스트)
+        list: 추출한 데이터 (행별 리스트), as_array=True이면 numpy.ndarray
+    
+    Why as_array 옵션이 있는가?
+    열 단위로 값을 다루는 쪽(예: arr[:, 열]로 한 컬럼씩 쓰기, 숫자 컬럼 dtype 변환)에서
+    행 튜플 목록을 다시 열로 뒤집지 않고 바로 쓸 수 있게 하기 위해
+    numpy는 pandas와 함께 설치되므로 이 옵션을 쓸 때만 불러옴
     """
     try:
         sheet_name = table_info['sheet']
-        if sheet_name not in workbook.sheetnames:
+        # 이름 확인과 시트 조회를 따로 하면 시트 목록을 두 번 훑으므로 한 번에 조회
+        try:
+            sheet = workbook[sheet_name]
+        except KeyError:
             print(f"[get_actual_data_from_workbook] ❌ 시트를 찾을 수 없습니다: {sheet_name}")
             return []
         
-        sheet = workbook[sheet_name]
         start_row = table_info.get('start_row', 1)
         
         # 3순위 개선: 안전 장치 - 헤더 정보 검증
@@ -474,8 +957,10 @@ def get_actual_data_from_workbook(table_info, workbook, empty_streak_limit=2):
             return []
         
         # 🎯 1순위 핵심 개선: 테이블 경계만 정확히 계산
-        print(f"[get_actual_data_from_workbook] 🔍 기존 방식 대신 테이블 경계 기준으로 범위 계산 중...")
-        actual_max_row, table_col_count = calculate_table_dimension(sheet, table_info, empty_streak_limit)
+        if dimension is None:
+            print(f"[get_actual_data_from_workbook] 🔍 기존 방식 대신 테이블 경계 기준으로 범위 계산 중...")
+            dimension = calculate_table_dimension(sheet, table_info, empty_streak_limit)
+        actual_max_row, table_col_count = dimension
         
         # 데이터 추출 (헤더 제외하고 실제 데이터만)
         all_data = []
@@ -487,18 +972,30 @@ def get_actual_data_from_workbook(table_info, workbook, empty_streak_limit=2):
         for row in sheet.iter_rows(min_row=data_start_row, max_row=actual_max_row, 
                                  min_col=1, max_col=table_col_count, values_only=True):
             # What: 완전히 빈 행은 건너뛰기 (모든 셀이 None이거나 빈 문자열)
-            if any(cell is not None and str(cell).strip() for cell in row):
+            if any(cell is not None and (not isinstance(cell, str) or cell.strip()) for cell in row):
                 all_data.append(row)
         
         print(f"[get_actual_data_from_workbook] ✅ 테이블 경계 기준 데이터 추출 완료: {len(all_data)}행")
         print(f"[get_actual_data_from_workbook] 🚀 성능 개선: 시트 전체 대신 테이블 영역만 처리")
+        
+        if as_array:
+            try:
+                import numpy as np
+            except ImportError:
+                print(f"[get_actual_data_from_workbook] ⚠️ numpy가 없어 리스트로 반환합니다")
+                return all_data
+            # 모든 행이 table_col_count 길이이므로 2차원 배열이 됨 (빈 결과도 열 수는 유지)
+            data_array = np.empty((len(all_data), table_col_count), dtype=object)
+            if all_data:
+                data_array[:] = all_data
+            return data_array
         return all_data
         
     except Exception as e:
         print(f"[get_actual_data_from_workbook] ❌ 데이터 추출 실패: {e}")
         return []
 
-def clear_table_data_area_dynamic(sheet, table_info, empty_streak_limit=2):
+def clear_table_data_area_dynamic(sheet, table_info, empty_streak_limit=2, dimension=None):
     """
     🎯 1순위 개선: 테이블 경계 기준으로 기존 데이터 영역을 동적으로 정리
     
@@ -520,6 +1017,7 @@ def clear_table_data_area_dynamic(sheet, table_info, empty_streak_limit=2):
         sheet: openpyxl 워크시트 객체
         table_info (dict): 테이블 정보
         empty_streak_limit (int): 연속 빈 행 기준 (2순위 개선)
+        dimension (tuple): 이미 계산한 (max_row, max_col), 있으면 경계 계산을 건너뜀
     
     Returns:
         bool: 정리 성공 여부
@@ -527,8 +1025,10 @@ def clear_table_data_area_dynamic(sheet, table_info, empty_streak_limit=2):
     
     try:
         # 🎯 핵심: 테이블의 실제 경계 계산
-        print(f"[clear_table_data_area_dynamic] 🔍 동적 범위 계산 중...")
-        actual_max_row, table_col_count = calculate_table_dimension(sheet, table_info, empty_streak_limit)
+        if dimension is None:
+            print(f"[clear_table_data_area_dynamic] 🔍 동적 범위 계산 중...")
+            dimension = calculate_table_dimension(sheet, table_info, empty_streak_limit)
+        actual_max_row, table_col_count = dimension
         
         header_row = table_info['start_row']
         data_start_row = header_row + 1  # Why +1? 헤더는 보존하고 데이터만 정리
@@ -545,15 +1045,30 @@ def clear_table_data_area_dynamic(sheet, table_info, empty_streak_limit=2):
         
         # 🎯 개선된 정리: 계산된 범위만 정확히 정리
         cleared_count = 0
-        for row_num in range(data_start_row, actual_max_row + 1):
-            for col_num in range(1, table_col_count + 1):
-                try:
+        existing_cells = getattr(sheet, '_cells', None)
+        if existing_cells is not None:
+            # Why 셀 저장소를 직접 다루는가?
+            # sheet.cell()은 없는 셀까지 새로 만들어서 저장 파일에 빈 셀이 잔뜩 남음
+            # 서식이 없는 셀은 통째로 지우고, 서식이 있는 셀은 값만 비워서 테두리/표시형식을 보존
+            for row_num in range(data_start_row, actual_max_row + 1):
+                for col_num in range(1, table_col_count + 1):
+                    cell = existing_cells.get((row_num, col_num))
+                    # 병합 범위 안의 셀(MergedCell)은 값을 바꿀 수 없고 병합 정보가 참조하므로 그대로 둠
+                    if cell is None or isinstance(cell, MergedCell):
+                        continue
+                    if cell.has_style:
+                        cell.value = None
+                    else:
+                        del existing_cells[(row_num, col_num)]
+                    cleared_count += 1
+        else:
+            # 셀 저장소가 없는 시트(읽기 전용 등)는 셀 하나가 실패하면 나머지도 모두 실패하므로
+            # 셀마다 오류를 찍지 않고 바깥 except에서 한 번에 실패로 처리
+            for row_num in range(data_start_row, actual_max_row + 1):
+                for col_num in range(1, table_col_count + 1):
                     # What: 셀 값을 None으로 설정해서 정리
                     sheet.cell(row_num, col_num).value = None
                     cleared_count += 1
-                except Exception as cell_error:
-                    print(f"[clear_table_data_area_dynamic] ⚠️ 셀 정리 오류 ({row_num}, {col_num}): {cell_error}")
-                    continue
         
         print(f"[clear_table_data_area_dynamic] ✅ 동적 데이터 정리 완료: {cleared_count}개 셀 정리됨")
         print(f"[clear_table_data_area_dynamic] 🚀 성능 향상: 불필요한 영역 정리 하지 않음")
@@ -597,11 +1112,21 @@ def synchronize_entire_table(source_table, source_wb, target_sheet, target_start
         
         # Why 기존 헤더를 지우는가? 완전히 새로운 구조로 만들기 위해
         # 충분한 범위(100열)로 기존 헤더 완전 삭제
-        for col_idx in range(1, 101):
-            target_sheet.cell(target_start_row, col_idx).value = None
+        # Why 셀을 직접 조회하는가?
+        # sheet.cell()은 없는 셀도 새로 만들기 때문에, 이미 존재하고 값이 있는 셀만 골라서 지움
+        # 새 헤더가 들어갈 열은 바로 아래에서 덮어쓰므로 그 뒤 열만 확인
+        # 서식 없는 셀은 저장 파일에 남지 않도록 통째로 삭제
+        source_headers = source_table['headers']
+        existing_cells = target_sheet._cells
+        for col_idx in range(len(source_headers) + 1, 101):
+            cell = existing_cells.get((target_start_row, col_idx))
+            if cell is not None and cell.value is not None:
+                if cell.has_style:
+                    cell.value = None
+                else:
+                    del existing_cells[(target_start_row, col_idx)]
         
         # 새 헤더 입력
-        source_headers = source_table['headers']
         for col_idx, header in enumerate(source_headers):
             target_sheet.cell(target_start_row, col_idx + 1).value = header
         
@@ -616,8 +1141,13 @@ def synchronize_entire_table(source_table, source_wb, target_sheet, target_start
             'headers': source_headers  # 새로 설정된 헤더 사용
         }
         
+        # Why 경계를 여기서 한 번만 계산하는가?
+        # 경계 계산은 최대 1000행을 훑는 작업이라, 하위 함수마다 다시 계산하지 않고 결과를 넘겨줌
+        target_dimension = calculate_table_dimension(target_sheet, target_table_info, empty_streak_limit)
+        
         # 동적 범위 기준 데이터 정리
-        clear_success = clear_table_data_area_dynamic(target_sheet, target_table_info, empty_streak_limit)
+        clear_success = clear_table_data_area_dynamic(target_sheet, target_table_info, empty_streak_limit,
+                                                      dimension=target_dimension)
         if not clear_success:
             print(f"[synchronize_entire_table] ⚠️ 데이터 정리에 문제가 있었지만 계속 진행...")
         
@@ -633,20 +1163,26 @@ def synchronize_entire_table(source_table, source_wb, target_sheet, target_start
         
         # 데이터 복사 (헤더 다음 행부터)
         target_data_start = target_start_row + 1
-        copied_rows = 0
         
-        for row_idx, row_data in enumerate(source_data):
-            target_row = target_data_start + row_idx
-            
-            # Why min 사용? 소스 데이터가 헤더보다 적을 수 있으므로
-            for col_idx in range(min(len(row_data), len(source_headers))):
-                try:
-                    target_sheet.cell(target_row, col_idx + 1).value = row_data[col_idx]
-                except Exception as cell_error:
-                    print(f"[synchronize_entire_table] ⚠️ 셀 복사 오류 ({target_row}, {col_idx+1}): {cell_error}")
-                    continue
-            
-            copied_rows += 1
+        # Why min 사용? 소스 데이터가 헤더보다 적을 수 있으므로
+        cell_writes = ((target_data_start + row_idx, col_idx + 1, row_data[col_idx])
+                       for row_idx, row_data in enumerate(source_data)
+                       for col_idx in range(min(len(row_data), len(source_headers))))
+        
+        # update_file과 같은 방식: 바깥에서 한 번만 잡고, 실패한 셀만 건너뛰고 이어서 씀
+        write_error_count = 0
+        while True:
+            try:
+                for target_row, target_col, value in cell_writes:
+                    target_sheet.cell(target_row, target_col).value = value
+                break
+            except (AttributeError, ValueError, TypeError, IllegalCharacterError) as cell_error:
+                write_error_count += 1
+                logger.debug("[synchronize_entire_table] 셀 복사 오류 (%s, %s): %s", target_row, target_col, cell_error)
+        if write_error_count:
+            print(f"[synchronize_entire_table] ⚠️ 셀 복사 오류: {write_error_count}개 셀 건너뜀")
+        
+        copied_rows = len(source_data)
         
         # 4단계: 완료 표시  
         print(f"[synchronize_entire_table] ✅ 4단계: 완료 표시 중...")
@@ -718,7 +1254,140 @@ def test_file_updater():
         print(f"[file_updater.test_file_updater] ❌ 테스트 실패")
         print("[file_updater.test_file_updater] 💡 디버깅을 위해 debug_collector.py를 실행해보세요")
 
-def mark_back_data_red(file_path, back_data_worksheets, tables_info):
+def ensure_writable(file_path):
+    """
+    전기 조서 파일의 읽기 전용 속성을 해제 (워크플로우 시작 시 한 번만 호출)
+    
+    Returns:
+        bool: 쓰기 가능한 상태이면 True
+    
+    Why 각 단계 함수가 아니라 한 곳에서만 확인하는가?
+    mark_back_data_red → update_rollforward_status → 리포트가 같은 파일을 차례로 다루므로
+    단계마다 stat/chmod를 반복할 필요 없이 처음 한 번 확인하면 충분함
+    """
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return False  # 파일 상태 확인 실패는 저장 단계에서 드러나도록 그대로 둠
+    
+    if file_stat.st_mode & stat.S_IWRITE:
+        return True
+    
+    print(f"[file_updater.ensure_writable] 🔓 읽기 전용 파일 권한 해제: {file_path}")
+    try:
+        os.chmod(file_path, stat.S_IWRITE | stat.S_IREAD)
+        return True
+    except OSError as chmod_error:
+        print(f"[file_updater.ensure_writable] ❌ 읽기 전용 해제 실패: {chmod_error}")
+        return False
+
+def _fill_cell(cell, fill, painted_styles):
+    """
+    셀에 채우기 색을 지정 (같은 기존 서식 + 같은 색 조합은 처음 한 번만 스타일 표를 조회)
+    
+    Why 칠한 결과 스타일을 캐시하는가?
+    cell.fill = ...은 셀마다 PatternFill을 해시해서 스타일 표에서 번호를 찾으므로,
+    기존 서식이 같은 셀이면 처음 칠한 셀의 스타일 번호 묶음(_style)을 그대로 복사해서 씀
+    """
+    key = (id(fill), tuple(cell._style))
+    painted_style = painted_styles.get(key)
+    if painted_style is None:
+        cell.fill = fill
+        painted_styles[key] = copy(cell._style)
+    else:
+        cell._style = copy(painted_style)
+
+def _find_back_data_cells(workbook, back_data_worksheets, tables_info):
+    """
+    백데이터 테이블에서 값이 있는 셀을 찾아 {시트명: [셀 정보, ...]}로 반환 (색칠/저장은 하지 않음)
+    
+    workbook은 읽기 전용이든 일반 모드든 상관없음 (값만 읽음)
+    """
+    red_cells_info = {}  # 빨간색으로 표시된 셀들의 정보
+    
+    print(f"[file_updater.mark_back_data_red] 🔴 백데이터 표시 시작: {len(back_data_worksheets)}개 워크시트")
+    
+    for sheet_name in back_data_worksheets:
+        if sheet_name not in workbook.sheetnames:
+            print(f"[file_updater.mark_back_data_red] ⚠️ 워크시트를 찾을 수 없습니다: {sheet_name}")
+            continue
+        
+        sheet = workbook[sheet_name]
+        red_cells_info[sheet_name] = []
+        # 시트의 마지막 행은 테이블마다 다시 계산하지 않도록 한 번만 구함
+        # (읽기 전용 시트는 셀을 만들지 않고, 파일에 기록된 max_row가 부정확할 수 있어 제한하지 않음
+        #  - calculate_table_dimension과 같은 기준)
+        sheet_max_row = None if workbook.read_only else sheet.max_row
+        
+        # 해당 워크시트의 테이블 찾기
+        sheet_tables = [table for table in tables_info if table['sheet'] == sheet_name]
+        
+        if not sheet_tables:
+            print(f"[file_updater.mark_back_data_red] ⚠️ {sheet_name}에서 테이블을 찾을 수 없습니다.")
+            continue
+        
+        for table in sheet_tables:
+            try:
+                start_row = table['start_row']
+                headers = table['headers']
+                
+                print(f"[file_updater.mark_back_data_red] 🔴 {sheet_name} 테이블 표시 중: {len(headers)}개 컬럼")
+                
+                # 헤더 다음 행부터 데이터 영역 표시
+                data_start_row = start_row + 1
+                
+                # 최대 1000행까지 스캔 (안전 제한), 일반 모드 시트는 마지막 행을 넘지 않음
+                # Why 마지막 행에서 멈추는가? 일반 모드로 열린 시트에서는 넘어간 행마다 빈 셀이 새로 만들어짐
+                scan_last_row = data_start_row + 999
+                if sheet_max_row is not None:
+                    scan_last_row = min(scan_last_row, sheet_max_row)
+                # Why iter_rows를 사용하는가?
+                # sheet.cell(row, col)은 호출할 때마다 좌표로 셀을 다시 찾으므로
+                # 행 단위로 값만 받아서 확인함 (칠하기는 호출한 쪽에서 따로)
+                # (헤더가 없으면 max_col=0이 시트 전체 열로 해석되므로 스캔하지 않음)
+                rows = sheet.iter_rows(min_row=data_start_row, max_row=scan_last_row,
+                                       min_col=1, max_col=len(headers), values_only=True) if headers else ()
+                # Why 지역 변수로 세는가?
+                # 함수 속성에 저장하면 다음 테이블/다음 호출까지 값이 남아서
+                # 새 테이블이 첫 빈 행에서 바로 끝나버리는 문제가 있었음
+                consecutive_empty = 0
+                for row, row_values in enumerate(rows, data_start_row):
+                    empty_count = 0
+                    row_has_data = False
+                    
+                    for col, value in enumerate(row_values, 1):
+                        # Why 문자열일 때만 strip()하는가? 숫자/날짜는 항상 값이 있으므로 str()로 바꿀 필요가 없음
+                        if value is not None and (not isinstance(value, str) or value.strip()):
+                            # 데이터가 있는 셀을 빨간색 표시 대상으로 기록
+                            # 주석 추가 안 함 (요구사항: 백데이터 시트에는 메모 추가하지 않음)
+                            
+                            red_cells_info[sheet_name].append({
+                                'row': row,
+                                'col': col,
+                                'value': value,
+                                'status': 'pending'  # pending, completed, failed
+                            })
+                            row_has_data = True
+                        else:
+                            empty_count += 1
+                    
+                    # 연속으로 5행이 비어있으면 데이터 끝으로 판단
+                    if empty_count >= len(headers) or not row_has_data:
+                        consecutive_empty += 1
+                        if consecutive_empty >= 5:
+                            break
+                    else:
+                        consecutive_empty = 0
+                
+                print(f"[file_updater.mark_back_data_red] ✅ {sheet_name}: {len(red_cells_info[sheet_name])}개 셀 표시 완료")
+                
+            except Exception as e:
+                print(f"[file_updater.mark_back_data_red] ❌ 테이블 처리 오류 ({sheet_name}): {e}")
+                continue
+    
+    return red_cells_info
+
+def mark_back_data_red(file_path, back_data_worksheets, tables_info, paint=True):
     """
     백데이터 워크시트의 테이블 영역을 빨간색으로 표시
     
@@ -732,106 +1401,50 @@ def mark_back_data_red(file_path, back_data_worksheets, tables_info):
         file_path (str): 전기 조서 파일 경로
         back_data_worksheets (list): 백데이터 워크시트 이름 리스트
         tables_info (list): 테이블 정보 리스트
+        paint (bool): False이면 표시할 셀만 찾고 파일은 저장하지 않음
         
     Returns:
         dict: 빨간색으로 표시된 셀 정보
+    
+    Why paint=False 옵션이 있는가?
+    바로 뒤에 update_rollforward_status를 부르는 흐름에서는 그 함수가 빨간색/초록색을
+    한 번에 칠하고 저장하므로, 여기서 칠하고 저장하면 같은 파일을 두 번 열고 저장하게 됨
+    표시 대상 셀은 데이터 복사 전 내용으로 정해야 하므로 찾기만 먼저 하고 칠하기는 뒤로 미룸
     """
     
     if not back_data_worksheets:
         print("[file_updater.mark_back_data_red] ℹ️ 백데이터 워크시트가 없습니다.")
         return {}
     
-    red_cells_info = {}  # 빨간색으로 표시된 셀들의 정보
-    
     try:
-        # 파일 권한 체크 및 해결
-        import os
-        import stat
+        # Why 읽기와 칠하기를 나눠서 두 번 여는가?
+        # 1차: 어떤 셀에 데이터가 있는지는 읽기 전용 모드로 시트 XML을 흘려 읽으며 찾고
+        #      (셀 객체를 전부 만들지 않아 메모리를 거의 쓰지 않음)
+        # 2차: 일반 모드로 다시 열어서 찾아둔 좌표에만 빨간색을 칠하고 저장
+        # Why data_only를 쓰지 않는가?
+        # 수식 셀도 기존처럼 데이터가 있는 셀로 보기 위해 (openpyxl로 저장된 파일은 계산 결과값이 비어 있음)
+        wb_ro = openpyxl.load_workbook(file_path, read_only=True)
         
-        # 파일이 읽기 전용인지 확인
-        if os.path.exists(file_path):
-            file_stat = os.stat(file_path)
-            if not (file_stat.st_mode & stat.S_IWRITE):
-                print(f"[file_updater.mark_back_data_red] 🔓 읽기 전용 파일 권한 해제: {file_path}")
-                os.chmod(file_path, stat.S_IWRITE | stat.S_IREAD)
-        
-        wb = openpyxl.load_workbook(file_path)
+        red_cells_info = _find_back_data_cells(wb_ro, back_data_worksheets, tables_info)
+        wb_ro.close()
         
-        print(f"[file_updater.mark_back_data_red] 🔴 백데이터 표시 시작: {len(back_data_worksheets)}개 워크시트")
+        total_cells = sum(len(cells) for cells in red_cells_info.values())
+        if not paint:
+            print(f"[file_updater.mark_back_data_red] 🎯 백데이터 대상 셀 확인 완료: 총 {total_cells}개 (색상은 상태 업데이트 때 표시)")
+            return red_cells_info
         
-        for sheet_name in back_data_worksheets:
-            if sheet_name not in wb.sheetnames:
-                print(f"[file_updater.mark_back_data_red] ⚠️ 워크시트를 찾을 수 없습니다: {sheet_name}")
-                continue
-            
+        # 2차: 찾아둔 좌표에만 빨간색 칠하기
+        wb = openpyxl.load_workbook(file_path)
+        painted_styles = {}
+        for sheet_name, cells_list in red_cells_info.items():
             sheet = wb[sheet_name]
-            red_cells_info[sheet_name] = []
-            
-            # 해당 워크시트의 테이블 찾기
-            sheet_tables = [table for table in tables_info if table['sheet'] == sheet_name]
-            
-            if not sheet_tables:
-                print(f"[file_updater.mark_back_data_red] ⚠️ {sheet_name}에서 테이블을 찾을 수 없습니다.")
-                continue
-            
-            for table in sheet_tables:
-                try:
-                    start_row = table['start_row']
-                    headers = table['headers']
-                    
-                    print(f"[file_updater.mark_back_data_red] 🔴 {sheet_name} 테이블 표시 중: {len(headers)}개 컬럼")
-                    
-                    # 헤더 다음 행부터 데이터 영역 표시
-                    data_start_row = start_row + 1
-                    
-                    # 최대 1000행까지 스캔 (안전 제한)
-                    for row in range(data_start_row, data_start_row + 1000):
-                        empty_count = 0
-                        row_has_data = False
-                        
-                        for col in range(1, len(headers) + 1):
-                            try:
-                                cell = sheet.cell(row, col)
-                                
-                                if cell.value is not None and str(cell.value).strip():
-                                    # 데이터가 있는 셀을 빨간색으로 표시
-                                    cell.fill = RED_FILL
-                                    
-                                    # 주석 추가 안 함 (요구사항: 백데이터 시트에는 메모 추가하지 않음)
-                                    
-                                    red_cells_info[sheet_name].append({
-                                        'row': row,
-                                        'col': col,
-                                        'value': cell.value,
-                                        'status': 'pending'  # pending, completed, failed
-                                    })
-                                    row_has_data = True
-                                else:
-                                    empty_count += 1
-                            except Exception as e:
-                                print(f"[file_updater.mark_back_data_red] ⚠️ 셀 처리 오류 ({row}, {col}): {e}")
-                                continue
-                        
-                        # 연속으로 5행이 비어있으면 데이터 끝으로 판단
-                        if empty_count >= len(headers) or not row_has_data:
-                            consecutive_empty = getattr(mark_back_data_red, f'empty_count_{sheet_name}', 0) + 1
-                            setattr(mark_back_data_red, f'empty_count_{sheet_name}', consecutive_empty)
-                            if consecutive_empty >= 5:
-                                break
-                        else:
-                            setattr(mark_back_data_red, f'empty_count_{sheet_name}', 0)
-                    
-                    print(f"[file_updater.mark_back_data_red] ✅ {sheet_name}: {len(red_cells_info[sheet_name])}개 셀 표시 완료")
-                    
-                except Exception as e:
-                    print(f"[file_updater.mark_back_data_red] ❌ 테이블 처리 오류 ({sheet_name}): {e}")
-                    continue
+            for cell_info in cells_list:
+                _fill_cell(sheet.cell(cell_info['row'], cell_info['col']), RED_FILL, painted_styles)
         
         # 파일 저장
         wb.save(file_path)
         wb.close()
         
-        total_cells = sum(len(cells) for cells in red_cells_info.values())
         print(f"[file_updater.mark_back_data_red] 🎯 백데이터 표시 완료: 총 {total_cells}개 셀이 빨간색으로 표시됨")
         
         return red_cells_info
@@ -840,6 +1453,83 @@ def mark_back_data_red(file_path, back_data_worksheets, tables_info):
         print(f"[file_updater.mark_back_data_red] ❌ 백데이터 표시 실패: {e}")
         return {}
 
+def _apply_rollforward_status(workbook, red_cells_info, successful_matches):
+    """
+    일반 모드로 열린 workbook에서 롤포워딩 결과 색상을 칠하고 결과를 반환 (저장은 호출한 쪽에서)
+    """
+    green_count = 0
+    remaining_red_count = 0
+    manual_adjustment_cells = []
+    
+    print("[file_updater.update_rollforward_status] 🎨 롤포워딩 결과 색상 업데이트 중...")
+    
+    update_lookup = _build_update_lookup(successful_matches)
+    painted_styles = {}  # 스타일 번호는 워크북 단위이므로 시트가 바뀌어도 같이 씀
+    
+    for sheet_name, cells_list in red_cells_info.items():
+        if sheet_name not in workbook.sheetnames:
+            continue
+        
+        sheet = workbook[sheet_name]
+        cell_error_count = 0
+        
+        for cell_info in cells_list:
+            row = cell_info['row']
+            col = cell_info['col']
+            
+            try:
+                cell = sheet.cell(row, col)
+                
+                # 이 셀이 성공적으로 롤포워딩되었는지 확인
+                was_updated = _check_if_cell_was_updated(cell_info, update_lookup, sheet_name)
+                
+                if was_updated:
+                    # 성공한 셀을 초록색으로 변경
+                    _fill_cell(cell, GREEN_FILL, painted_styles)
+                    
+                    # 주석 추가 안 함 (요구사항: 백데이터 시트에는 메모 추가하지 않음)
+                    
+                    green_count += 1
+                    cell_info['status'] = 'completed'
+                else:
+                    # 실패한 셀은 빨간색으로 표시하고 수기조정 목록에 추가
+                    _fill_cell(cell, RED_FILL, painted_styles)
+                    remaining_red_count += 1
+                    cell_info['status'] = 'failed'
+                    
+                    manual_adjustment_cells.append({
+                        'sheet': sheet_name,
+                        'row': row,
+                        'col': col,
+                        'cell_address': f"{sheet_name}!{cell.coordinate}",
+                        'value': cell.value
+                    })
+                    
+                    # 수기조정 필요 주석 추가
+                    # 수기조정 필요한 셀에도 메모 추가 안 함 (요구사항: 백데이터 시트에는 메모 추가하지 않음)
+            
+            except Exception as e:
+                cell_error_count += 1
+                logger.debug("[file_updater.update_rollforward_status] 셀 업데이트 오류 (%s, %s, %s): %s",
+                             sheet_name, row, col, e)
+                continue
+        
+        if cell_error_count:
+            print(f"[file_updater.update_rollforward_status] ⚠️ {sheet_name}: 셀 업데이트 오류 {cell_error_count}개")
+    
+    # 결과 리포트
+    result = {
+        'green_cells': green_count,
+        'red_cells': remaining_red_count, 
+        'manual_adjustment_needed': manual_adjustment_cells
+    }
+    
+    print(f"[file_updater.update_rollforward_status] ✅ 색상 업데이트 완료:")
+    print(f"[file_updater.update_rollforward_status]    🟢 초록색 (완료): {green_count}개")
+    print(f"[file_updater.update_rollforward_status]    🔴 빨간색 (수기조정 필요): {remaining_red_count}개")
+    
+    return result
+
 def update_rollforward_status(file_path, red_cells_info, successful_matches):
     """
     롤포워딩 완료된 셀을 초록색으로 변경하고 미완료 셀 추적
@@ -857,6 +1547,9 @@ def update_rollforward_status(file_path, red_cells_info, successful_matches):
         
     Returns:
         dict: 롤포워딩 결과 리포트
+    
+    실패한 셀도 빨간색을 다시 칠하므로, mark_back_data_red(paint=False)로 찾기만 한 셀도
+    이 함수 한 번의 열기/저장으로 최종 색상이 모두 표시됨
     """
     
     if not red_cells_info:
@@ -864,161 +1557,81 @@ def update_rollforward_status(file_path, red_cells_info, successful_matches):
         return {'green_cells': 0, 'red_cells': 0, 'manual_adjustment_needed': []}
     
     try:
-        # 파일 권한 체크 및 해결
-        import os
-        import stat
-        
-        # 파일이 읽기 전용인지 확인
-        if os.path.exists(file_path):
-            file_stat = os.stat(file_path)
-            if not (file_stat.st_mode & stat.S_IWRITE):
-                print(f"[file_updater.update_rollforward_status] 🔓 읽기 전용 파일 권한 해제: {file_path}")
-                os.chmod(file_path, stat.S_IWRITE | stat.S_IREAD)
-        
         wb = openpyxl.load_workbook(file_path)
-        
-        green_count = 0
-        remaining_red_count = 0
-        manual_adjustment_cells = []
-        
-        print("[file_updater.update_rollforward_status] 🎨 롤포워딩 결과 색상 업데이트 중...")
-        
-        for sheet_name, cells_list in red_cells_info.items():
-            if sheet_name not in wb.sheetnames:
-                continue
-            
-            sheet = wb[sheet_name]
-            
-            for cell_info in cells_list:
-                row = cell_info['row']
-                col = cell_info['col']
-                
-                try:
-                    cell = sheet.cell(row, col)
-                    
-                    # 이 셀이 성공적으로 롤포워딩되었는지 확인
-                    was_updated = _check_if_cell_was_updated(cell_info, successful_matches, sheet_name)
-                    
-                    if was_updated:
-                        # 성공한 셀을 초록색으로 변경
-                        cell.fill = GREEN_FILL
-                        
-                        # 주석 추가 안 함 (요구사항: 백데이터 시트에는 메모 추가하지 않음)
-                        
-                        green_count += 1
-                        cell_info['status'] = 'completed'
-                    else:
-                        # 실패한 셀은 빨간색 유지하고 수기조정 목록에 추가
-                        remaining_red_count += 1
-                        cell_info['status'] = 'failed'
-                        
-                        manual_adjustment_cells.append({
-                            'sheet': sheet_name,
-                            'row': row,
-                            'col': col,
-                            'cell_address': f"{sheet_name}!{cell.coordinate}",
-                            'value': cell.value
-                        })
-                        
-                        # 수기조정 필요 주석 추가
-                        # 수기조정 필요한 셀에도 메모 추가 안 함 (요구사항: 백데이터 시트에는 메모 추가하지 않음)
-                
-                except Exception as e:
-                    print(f"[file_updater.update_rollforward_status] ⚠️ 셀 업데이트 오류 ({row}, {col}): {e}")
-                    continue
-        
+        result = _apply_rollforward_status(wb, red_cells_info, successful_matches)
         wb.save(file_path)
         wb.close()
         
-        # 결과 리포트
-        result = {
-            'green_cells': green_count,
-            'red_cells': remaining_red_count, 
-            'manual_adjustment_needed': manual_adjustment_cells
-        }
-        
-        print(f"[file_updater.update_rollforward_status] ✅ 색상 업데이트 완료:")
-        print(f"[file_updater.update_rollforward_status]    🟢 초록색 (완료): {green_count}개")
-        print(f"[file_updater.update_rollforward_status]    🔴 빨간색 (수기조정 필요): {remaining_red_count}개")
-        
         return result
         
     except Exception as e:
         print(f"[file_updater.update_rollforward_status] ❌ 상태 업데이트 실패: {e}")
         return {'green_cells': 0, 'red_cells': 0, 'manual_adjustment_needed': []}
 
-def _check_if_cell_was_updated(cell_info, successful_matches, sheet_name):
+def _build_update_lookup(successful_matches):
+    """
+    성공한 매칭 목록을 셀 확인용 조회 구조로 한 번만 변환
+    
+    Why 미리 만들어두는가?
+    셀마다 successful_matches 전체를 두 번씩 훑으면 (빨간 셀 수 × 매칭 수)만큼 비교하게 되므로
+    좌표 집합과 시트별 최대 헤더 수를 먼저 만들어두고 셀마다 한 번씩만 찾아봄
+    
+    Returns:
+        tuple: ({(시트, 행, 열)}, {시트: 매칭된 테이블의 최대 헤더 수})
+    """
+    exact_cells = set()
+    max_cols_by_sheet = {}
+    for match in successful_matches:
+        exact_cells.add((match.get('from_sheet'), match.get('from_row'), match.get('from_col')))
+        
+        from_table = match.get('from_table', {})
+        if not isinstance(from_table, dict):
+            continue
+        try:
+            header_count = len(from_table.get('headers', []))
+        except TypeError:
+            continue
+        sheet = from_table.get('sheet')
+        if header_count > max_cols_by_sheet.get(sheet, 0):
+            max_cols_by_sheet[sheet] = header_count
+    return exact_cells, max_cols_by_sheet
+
+def _check_if_cell_was_updated(cell_info, update_lookup, sheet_name):
     """
     특정 셀이 성공적으로 롤포워딩되었는지 확인
     
     Parameters:
         cell_info (dict): 셀 정보
-        successful_matches (list): 성공한 매칭 정보
+        update_lookup (tuple): _build_update_lookup(successful_matches)의 결과
         sheet_name (str): 워크시트 이름
         
     Returns:
         bool: 업데이트 성공 여부
     """
+    exact_cells, max_cols_by_sheet = update_lookup
     
     # 성공한 매칭 정보를 바탕으로 해당 셀이 업데이트되었는지 확인
-    for match in successful_matches:
-        if (match.get('from_sheet') == sheet_name and 
-            match.get('from_row') == cell_info['row'] and
-            match.get('from_col') == cell_info['col']):
-            return True
+    if (sheet_name, cell_info['row'], cell_info['col']) in exact_cells:
+        return True
     
     # 간단한 휴리스틱: 매칭된 헤더가 있는 컬럼의 셀들은 성공으로 간주
     # (실제로는 더 정밀한 추적 시스템이 필요)
-    for match in successful_matches:
-        from_table = match.get('from_table', {})
-        if from_table.get('sheet') == sheet_name:
-            try:
-                from_headers = from_table.get('headers', [])
-                if cell_info['col'] <= len(from_headers):
-                    return True
-            except:
-                continue
-    
-    return False
+    return cell_info['col'] <= max_cols_by_sheet.get(sheet_name, 0)
 
-def generate_manual_adjustment_report(previous_file=None, red_cells_info=None, successful_matches=None):
+def generate_manual_adjustment_report(manual_adjustment_cells):
     """
     수기조정이 필요한 셀들의 상세 리포트 생성
     
     Parameters:
-        previous_file (str): 전기 조서 파일 경로 (신규 시그니처)
-        red_cells_info (dict): 빨간색으로 표시된 셀 정보 (신규 시그니처)
-        successful_matches (list): 성공한 매칭 정보 (신규 시그니처)
+        manual_adjustment_cells (list): update_rollforward_status 결과의 'manual_adjustment_needed'
         
     Returns:
         str: 리포트 텍스트
-    """
     
-    # 🔧 새로운 시그니처 지원: manual_adjustment_cells 생성
-    manual_adjustment_cells = []
-    
-    if red_cells_info and successful_matches:
-        # red_cells_info에서 실패한 셀들 추출
-        try:
-            wb = openpyxl.load_workbook(previous_file, data_only=True) if previous_file else None
-            
-            for sheet_name, cells_list in red_cells_info.items():
-                if wb and sheet_name in wb.sheetnames:
-                    sheet = wb[sheet_name]
-                    for cell_info in cells_list:
-                        if cell_info.get('status') == 'failed' or not _check_if_cell_was_updated(cell_info, successful_matches, sheet_name):
-                            cell = sheet.cell(cell_info['row'], cell_info['col'])
-                            manual_adjustment_cells.append({
-                                'sheet': sheet_name,
-                                'row': cell_info['row'],
-                                'col': cell_info['col'], 
-                                'cell_address': f"{sheet_name}!{cell.coordinate}",
-                                'value': cell_info.get('value', cell.value)
-                            })
-            if wb:
-                wb.close()
-        except Exception as e:
-            print(f"[file_updater.generate_manual_adjustment_report] ⚠️ 셀 분석 중 오류: {e}")
+    Why 셀 목록을 직접 받는가?
+    어떤 셀이 롤포워딩되지 않았는지는 update_rollforward_status가 색을 칠하면서 이미 판정하므로
+    같은 판정을 리포트에서 다시 돌리지 않고 그 결과를 그대로 받아서 정리만 함
+    """
     
     if not manual_adjustment_cells:
         return "🎉 모든 백데이터가 성공적으로 롤포워딩되었습니다!"
@@ -1031,12 +1644,9 @@ def generate_manual_adjustment_report(previous_file=None, red_cells_info=None, s
     ]
     
     # 워크시트별로 그룹핑
-    by_sheet = {}
+    by_sheet = defaultdict(list)
     for cell in manual_adjustment_cells:
-        sheet = cell['sheet']
-        if sheet not in by_sheet:
-            by_sheet[sheet] = []
-        by_sheet[sheet].append(cell)
+        by_sheet[cell['sheet']].append(cell)
     
     for sheet_name, cells in by_sheet.items():
         report_lines.append(f"\n🔶 워크시트: {sheet_name}")
@@ -1076,27 +1686,33 @@ def add_rollforward_complete_workflow(source_file, target_file, back_data_sheets
     try:
         print(f"[file_updater.add_rollforward_complete_workflow] 🚀 완전 워크플로우 시작...")
         
-        # 1단계: 백데이터 빨간색 표시
+        # 전기 조서는 이후 단계에서 여러 번 저장되므로 권한은 여기서 한 번만 확인
+        ensure_writable(source_file)
+        
+        # 1단계: 백데이터 대상 셀 확인 (읽기 전용으로 찾기만 하고, 색상은 3단계에서 한 번에 칠함)
+        # Why 전기 조서를 단계 사이에 열어두지 않는가?
+        # 2단계 update_file이 전기 조서(source_file)에 데이터를 복사해서 저장하므로,
+        # 그 전에 열어둔 워크북을 나중에 저장하면 복사된 데이터를 덮어써 버림 (main.py와 같은 순서)
         print(f"[file_updater.add_rollforward_complete_workflow] 🔴 1단계: 백데이터 마킹 시작...")
-        red_cells_info = mark_back_data_red(source_file, back_data_sheets, tables_info)
+        red_cells_info = mark_back_data_red(source_file, back_data_sheets, tables_info, paint=False) if back_data_sheets else {}
         
-        # 2단계: 데이터 롤포워딩 실행
+        # 2단계: 데이터 롤포워딩 실행 (대상 PBC → 전기 조서 백데이터 시트)
         print(f"[file_updater.add_rollforward_complete_workflow] 🟡 2단계: 데이터 복사 시작...")
-        update_result = update_file(target_file, matches)
+        update_result = update_file(matches, target_file, source_file)
         
-        # 3단계: 상태 업데이트 (성공 → 초록색)
+        # 3단계: 상태 업데이트 (성공 → 초록색, 실패 → 빨간색), 복사가 끝난 파일을 열어서 한 번만 저장
         print(f"[file_updater.add_rollforward_complete_workflow] 🟢 3단계: 상태 업데이트 시작...")
         status_result = update_rollforward_status(source_file, red_cells_info, matches)
         
         # 4단계: 수동 조정 리포트 생성
         print(f"[file_updater.add_rollforward_complete_workflow] 📋 4단계: 리포트 생성 시작...")
-        report = generate_manual_adjustment_report(source_file, red_cells_info, matches)
+        report = generate_manual_adjustment_report(status_result['manual_adjustment_needed'])
         
         # 결과 리턴
         result = {
             'success': True,
             'red_cells_marked': sum(len(cells) for cells in red_cells_info.values()) if red_cells_info else 0,
-            'data_updated': isinstance(update_result, dict) and update_result.get('success'),
+            'data_updated': bool(update_result),
             'status_updated': status_result,
             'report': report
         }
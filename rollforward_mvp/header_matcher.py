@@ -1,6 +1,6 @@
 """
 헤더 매칭 - MVP 버전  
-정확히 일치하는 것만 매칭 (유사도 매칭은 나중에)
+정확히 일치하는 것만 매칭 (대소문자/앞뒤 공백 차이는 무시, 유사도 매칭은 나중에)
 
 이 파일이 하는 일:
 - 전기 조서의 헤더(컬럼명)과 당기 파일의 헤더를 비교해서 매칭시키기
@@ -12,6 +12,27 @@
 - 실수 없이 정확한 매핑을 보장하기 위해
 """
 
+# 왜 파일 맨 위에서 import하는가?
+# table_finder는 이 모듈을 import하지 않아서 순환 import 걱정이 없고,
+# 함수 안에서 import하면 호출할 때마다 import 문을 다시 실행하게 됨
+from functools import lru_cache
+
+from table_finder import find_tables
+
+def _canonical_headers(headers):
+    """
+    헤더 목록을 {정규화된 이름: 원래 이름} 사전으로 변환
+    
+    왜 정규화하는가?
+    "매출 "과 "매출", "Amount"와 "amount"처럼 공백/대소문자만 다른 헤더도
+    같은 컬럼으로 매칭하기 위해 (같은 정규화 이름이 여러 개면 첫 번째 헤더 사용)
+    """
+    canonical = {}
+    for header in headers:
+        key = header.lower().strip() if isinstance(header, str) else header
+        canonical.setdefault(key, header)
+    return canonical
+
 def match_headers(previous_tables, current_file_path):
     """
     헤더 매칭 - 올바른 데이터 흐름 버전
@@ -33,30 +54,35 @@ def match_headers(previous_tables, current_file_path):
         list: 매칭된 헤더들의 정보 리스트 (from=당기PBC, to=백데이터)
     """
     
-    # 왜 여기서 import를 하는가?
-    # 함수 내부에서만 사용하는 것은 필요할 때만 import하는 것이 좋음
-    # 순환 import 문제를 피하기 위해서도 사용
-    from table_finder import find_tables
     current_tables = find_tables(current_file_path)  # 당기 파일에서도 테이블 찾기
     
     matches = []  # 매칭 결과를 저장할 리스트
     
+    # 왜 헤더를 {정규화된 이름: 원래 이름} 사전으로 바꿔두는가?
+    # 리스트에서 "in"으로 찾으면 헤더를 처음부터 하나씩 비교하므로
+    # 테이블 조합마다 (당기 헤더 수 × 전기 헤더 수)만큼 비교하게 됨
+    # 테이블마다 한 번만 정규화해두면 사전 조회 한 번으로 확인 가능
+    # (사전은 컬럼 순서를 유지하고, 같은 이름의 헤더는 첫 번째 것만 남음)
+    prev_canonical = [(prev_table, _canonical_headers(prev_table['headers'])) for prev_table in previous_tables]
+    curr_canonical = [(curr_table, _canonical_headers(curr_table['headers'])) for curr_table in current_tables]
+    
     # 왜 이중 반복문을 사용하는가?
     # 전기 조서의 모든 테이블과 당기 파일의 모든 테이블을 조합해서 비교하기 위해
     # 어떤 테이블끼리 매칭되는지 모르기 때문에 모든 경우를 확인
-    for prev_table in previous_tables:
-        for curr_table in current_tables:
+    for prev_table, prev_headers in prev_canonical:
+        for curr_table, curr_headers in curr_canonical:
             
             # 왜 헤더를 하나씩 확인하는가?
             # 테이블 내의 각 컬럼(헤더)별로 매칭을 찾아야 하기 때문
             # 한 테이블에 여러 컬럼이 있을 수 있음
             # 당기 PBC의 각 헤더를 백데이터 헤더와 매칭
-            for curr_header in curr_table['headers']:
+            for canonical, curr_header in curr_headers.items():
                 
-                # 당기 PBC 헤더가 백데이터에 있는지 확인
-                if curr_header in prev_table['headers']:
-                    # 백데이터에서 매칭되는 헤더 찾기 (MVP에서는 정확히 일치하는 것만)
-                    prev_header = curr_header  # 정확히 일치하므로 같은 이름
+                # 당기 PBC 헤더가 백데이터에 있는지 확인 (사전 조회라 헤더 수와 관계없이 한 번에 확인)
+                if canonical in prev_headers:
+                    # 백데이터에서 매칭되는 헤더 찾기 (MVP에서는 정규화한 이름이 정확히 일치하는 것만)
+                    # 실제 셀 위치를 찾을 때 쓰이므로 각 테이블의 원래 헤더 이름을 그대로 사용
+                    prev_header = prev_headers[canonical]
                     
                     # 올바른 데이터 흐름을 위한 매칭 정보 저장
                     # Current PBC (소스) → 백데이터 sheets (대상) 방향으로 수정
@@ -79,6 +105,18 @@ def match_headers(previous_tables, current_file_path):
     
     return matches  # 찾은 매칭들의 리스트 반환
 
+@lru_cache(maxsize=4096)
+def _normalized_header(header):
+    """
+    헤더를 (소문자+앞뒤 공백 제거한 문자열, 단어 집합)으로 변환
+    
+    왜 캐시하는가?
+    enhanced_match_headers는 (전기 헤더 수 × 당기 헤더 수)만큼 유사도를 계산하는데
+    같은 헤더를 매번 다시 lower/strip/split 하지 않기 위해
+    """
+    normalized = header.lower().strip()
+    return normalized, frozenset(normalized.split())
+
 def simple_similarity_match(header1, header2):
     """
     간단한 유사도 매칭 (Phase 1에서 사용 예정)
@@ -94,8 +132,9 @@ def simple_similarity_match(header1, header2):
     
     # 왜 lower()와 strip()을 사용하는가?
     # 대소문자와 공백 차이로 인한 매칭 실패를 방지하기 위해
-    h1 = header1.lower().strip()
-    h2 = header2.lower().strip()
+    # (정규화와 단어 분리 결과는 헤더별로 캐시해서 같은 헤더를 여러 번 비교해도 한 번만 계산)
+    h1, words1 = _normalized_header(header1)
+    h2, words2 = _normalized_header(header2)
     
     # 정확히 같으면 100% 일치
     if h1 == h2:
@@ -106,9 +145,7 @@ def simple_similarity_match(header1, header2):
         return 0.8  # 80% 유사도
     
     # 공통 단어 확인 (간단한 방법)
-    words1 = set(h1.split())  # 첫 번째 헤더를 단어로 분리
-    words2 = set(h2.split())  # 두 번째 헤더를 단어로 분리
-    common_words = words1.intersection(words2)  # 공통 단어 찾기
+    common_words = words1 & words2  # 공통 단어 찾기
     
     # 공통 단어가 있으면 비율로 유사도 계산
     if common_words:
@@ -119,7 +156,6 @@ def simple_similarity_match(header1, header2):
 def enhanced_match_headers(previous_tables, current_file_path, threshold=0.7):
     """향상된 헤더 매칭 (Phase 1에서 사용 예정)"""
     
-    from table_finder import find_tables
     current_tables = find_tables(current_file_path)
     
     matches = []
@@ -24,6 +24,8 @@ from file_selector import (                # 파일 선택 UI 기능들
     select_previous_file,                   # 전기 조서 파일 선택
     select_current_folder,                  # 당기 PBC 폴더 선택
     get_excel_files_in_folder,             # 폴더에서 Excel 파일 찾기
+    get_worksheet_names,                    # 파일의 워크시트 목록 추출 (캐시됨)
+    get_worksheet_names_batch,              # 여러 파일의 워크시트 목록 동시 추출
     show_selection_summary,                 # 선택 사항 요약 표시
     confirm_selection,                      # 사용자 확인 받기
     select_main_worksheets                  # 워크시트 분류 선택 (본 조서/백데이터)
@@ -31,11 +33,13 @@ from file_selector import (                # 파일 선택 UI 기능들
 from file_updater import (
     update_file,                            # 파일 업데이트 (기존)
     mark_back_data_red,                     # 백데이터 셀 빨간색 표시
+    ensure_writable,                        # 전기 조서 읽기 전용 해제 (한 번만)
     update_rollforward_status,              # 롤포워딩 상태 업데이트
     generate_manual_adjustment_report       # 수동 조정 리포트 생성
 )
 from memory_efficient_copy import (
     worksheet_full_replace,                 # 워크시트 전체 교체 (프로세스 A)
+    worksheets_full_replace,                # 여러 워크시트 일괄 교체 (프로세스 A)
     copy_worksheet_like_ctrl_cv             # Ctrl+C/V 방식 복사 (프로세스 A)
 )
 from rollforward_log import (
@@ -47,8 +51,41 @@ import sys
 import logging
 import shutil
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+# 선택 의존성: 설치되어 있으면 C로 구현된 rapidfuzz로 워크시트명 유사도를 계산 (없으면 difflib)
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:
+    fuzz = fuzz_process = None
+
+# 워크시트 이름 분류/매칭에 쓰는 정규표현식
+# Why 모듈 로드 시 한 번만 컴파일하는가?
+# 시트마다, 파일마다 반복해서 호출되므로 호출할 때마다 re 캐시를 조회하지 않도록 미리 만들어 둠
+
+# 백데이터 워크시트 패턴들 (감지 근거에 패턴 문자열을 남기므로 개별로 유지)
+_BACKDATA_RES = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'별도.*',           # '별도BS', '별도손익' 등
+    r'.*백.*데이터.*',   # '백데이터', '매출백데이터' 등
+    r'.*분석.*',         # '매출분석', '비용분석', '분석표' 등
+    r'.*명세.*',         # '자산명세', '부채명세' 등
+    r'.*내역.*',         # '매출내역', '비용내역' 등
+    r'.*상세.*',         # '상세내역', '상세분석' 등
+    r'.*조정.*',         # '조정사항', '조정내역' 등
+)]
+
+# 본 조서 패턴들 (제외 대상) - 하나라도 맞으면 되므로 한 정규표현식으로 합침
+_MAIN_SHEET_RE = re.compile(
+    r'^(?:BS|PL|CF|재무상태표|손익계산서|현금흐름표|대차대조표|포괄손익계산서)$',
+    re.IGNORECASE
+)
+
+_WHITESPACE_RE = re.compile(r'\s+')                 # find_matching_worksheet 공백 제거
+_WS_CLEAN_RE = re.compile(r'[\s\-_　]+')            # 워크시트명 공백/특수문자 제거
+_WS_PREFILTER_RE = re.compile(r'[\s\-_]+')          # 파일명 1차 필터용 워크시트명 정리
+_FN_CLEAN_RE = re.compile(r'[\s\-_\.xlsx]+')        # 파일명 정리
+
 # =================================================================
 # 로그 관리 및 파일 선택 기능
 # =================================================================
@@ -67,7 +104,9 @@ def create_single_backup(file_path):
     """
     
     try:
-        if not os.path.exists(file_path):
+        try:
+            source_stat = os.stat(file_path)
+        except FileNotFoundError:
             print(f"[create_single_backup] ❌ 백업 대상 파일이 존재하지 않습니다: {file_path}")
             return False
         
@@ -83,7 +122,11 @@ def create_single_backup(file_path):
         backup_path = os.path.join(backup_dir, backup_filename)
         
         # 백업 실행
-        shutil.copy2(file_path, backup_path)
+        # 왜 copy2 대신 copyfile + utime을 쓰는가?
+        # 백업에는 파일 내용과 수정 시각만 있으면 되므로 권한/확장 속성 복사에 드는 추가 호출을 생략
+        # (copyfile은 OS의 고속 복사 기능(sendfile, CopyFile2 등)을 자동으로 사용함)
+        shutil.copyfile(file_path, backup_path)
+        os.utime(backup_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
         
         print(f"[create_single_backup] ✅ 백업 생성 완료: {backup_path}")
         return True
@@ -135,55 +178,59 @@ def detect_backdata_worksheets(file_path):
     try:
         from openpyxl import load_workbook
         
-        # 백데이터 워크시트 패턴들 (정규표현식)
-        backdata_patterns = [
-            r'별도.*',           # '별도BS', '별도손익' 등
-            r'.*백.*데이터.*',   # '백데이터', '매출백데이터' 등
-            r'.*분석.*',         # '매출분석', '비용분석', '분석표' 등
-            r'.*명세.*',         # '자산명세', '부채명세' 등
-            r'.*내역.*',         # '매출내역', '비용내역' 등
-            r'.*상세.*',         # '상세내역', '상세분석' 등
-            r'.*조정.*',         # '조정사항', '조정내역' 등
-        ]
-        
-        # 본 조서 패턴들 (제외 대상)
-        main_patterns = [
-            r'^BS$', r'^PL$', r'^CF$',
-            r'^재무상태표$', r'^손익계산서$', r'^현금흐름표$',
-            r'^대차대조표$', r'^포괄손익계산서$'
-        ]
-        
         # 파일 접근 권한 체크
         if not os.access(file_path, os.R_OK):
             print(f"[detect_backdata_worksheets] 파일 읽기 권한 없음: {file_path}")
             return []
         
-        wb = load_workbook(file_path, read_only=True, data_only=True)
-        backdata_candidates = []
+        # 1단계: 본 조서인지 확인 (본 조서는 제외)
+        # Why 워크북을 열기 전에 이름으로 먼저 거르는가?
+        # 워크시트 이름은 zip 안의 workbook.xml만 읽어서 알 수 있으므로 (get_worksheet_names, 차트 시트 제외)
+        # 이름만으로 후보가 없는 파일은 워크북을 열지 않고 끝냄
+        # 내용 분석으로 받을 수 있는 최대 점수 (구조 최대 0.8 × 35% + 밀도 최대 0.9 × 25%)
+        max_content_score = 0.8 * 0.35 + 0.9 * 0.25
         
-        for ws in wb.worksheets:
-            ws_name = ws.title
-            
-            # 1단계: 본 조서인지 확인 (본 조서는 제외)
-            is_main_sheet = any(re.match(pattern, ws_name, re.IGNORECASE) for pattern in main_patterns)
-            if is_main_sheet:
+        candidates = []
+        for ws_name in get_worksheet_names(file_path):
+            if _MAIN_SHEET_RE.match(ws_name):
                 continue
-                
+            
             # 2단계: 백데이터 패턴 매칭 점수 계산 (40% 가중치)
             pattern_score = 0.0
             matched_patterns = []
             
-            for pattern in backdata_patterns:
-                if re.search(pattern, ws_name, re.IGNORECASE):
+            for pattern_re in _BACKDATA_RES:
+                if pattern_re.search(ws_name):
                     pattern_score = 0.4  # 패턴 매칭 시 40% 점수
-                    matched_patterns.append(pattern)
+                    matched_patterns.append(pattern_re.pattern)
                     break
             
-            # 3단계: 내용 구조 분석 (35% 가중치)
-            structure_score = analyze_worksheet_structure(ws)
+            # Why 내용 분석 전에 거르는가?
+            # 내용 점수를 최대로 받아도 70%에 못 미치는 시트(패턴이 맞지 않는 시트)는
+            # 셀을 읽어봐야 결과가 바뀌지 않으므로 분석하지 않음
+            if pattern_score + max_content_score < 0.7:
+                continue
+            candidates.append((ws_name, pattern_score, matched_patterns))
+        
+        if not candidates:
+            print(f"[detect_backdata_worksheets] 감지 완료: 0개 워크시트")
+            return []
+        
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        backdata_candidates = []
+        # Why wb.worksheets로 한 번 더 거르는가?
+        # 차트 시트는 셀이 없어 분석할 수 없는데, 이름만 보면 패턴 점수로 70%를 넘을 수 있음
+        # get_worksheet_names도 워크시트만 돌려주지만 wb[이름]은 차트 시트도 반환하므로 여기서 확실히 막음
+        worksheets = {ws.title: ws for ws in wb.worksheets}
+        
+        for ws_name, pattern_score, matched_patterns in candidates:
+            ws = worksheets.get(ws_name)
+            if ws is None:
+                continue
             
+            # 3단계: 내용 구조 분석 (35% 가중치)
             # 4단계: 데이터 밀도 분석 (25% 가중치)
-            density_score = analyze_data_density(ws)
+            structure_score, density_score = analyze_worksheet(ws)
             
             # 총 신뢰도 계산
             total_confidence = pattern_score + (structure_score * 0.35) + (density_score * 0.25)
@@ -213,69 +260,75 @@ def detect_backdata_worksheets(file_path):
         print(f"[detect_backdata_worksheets] 감지 실패: {e}")
         return []
 
-def analyze_worksheet_structure(ws):
-    """워크시트 구조 분석하여 백데이터 가능성 점수 반환"""
+def analyze_worksheet(ws):
+    """
+    워크시트 구조와 데이터 밀도를 분석하여 백데이터 가능성 점수 (구조 점수, 밀도 점수) 반환
+    
+    Why 한 함수에서 같이 구하는가?
+    두 점수 모두 같은 사용 범위(dimension)를 기준으로 하므로 범위 계산을 한 번만 함
+    """
     try:
-        # 간단한 구조 분석: 테이블 형태인지, 복잡한 레이아웃인지
         dimension = ws.calculate_dimension()
         if not dimension:
-            return 0.0
+            return 0.0, 0.0
             
         from openpyxl.utils import range_boundaries
         min_col, min_row, max_col, max_row = range_boundaries(dimension)
-        
-        # 데이터 범위가 적절한지 확인 (너무 작으면 제목이나 메모일 수 있음)
-        if max_row - min_row < 3 or max_col - min_col < 2:
-            return 0.3  # 낮은 점수
-            
-        # 적절한 크기의 구조화된 데이터로 판정
-        return 0.8
-        
     except Exception:
-        return 0.5  # 분석 실패 시 중간 점수
-
-def analyze_data_density(ws):
-    """워크시트 데이터 밀도 분석"""
+        return 0.5, 0.5  # 분석 실패 시 중간 점수
+    
+    # 구조 분석: 테이블 형태인지, 복잡한 레이아웃인지
+    # 데이터 범위가 적절한지 확인 (너무 작으면 제목이나 메모일 수 있음)
+    if max_row - min_row < 3 or max_col - min_col < 2:
+        structure_score = 0.3  # 낮은 점수
+    else:
+        structure_score = 0.8  # 적절한 크기의 구조화된 데이터로 판정
+    
+    # 데이터 밀도 분석
     try:
-        dimension = ws.calculate_dimension()
-        if not dimension:
-            return 0.0
-            
-        from openpyxl.utils import range_boundaries
-        min_col, min_row, max_col, max_row = range_boundaries(dimension)
-        
-        total_cells = (max_row - min_row + 1) * (max_col - min_col + 1)
+        # Why 위쪽 100행만 보는가?
+        # 읽기 전용 모드는 시트 XML을 앞에서부터 흘려 읽으므로 아래쪽 셀을 샘플링하려면
+        # 그 위의 행을 전부 파싱해야 함. 100행이면 표 형태를 판단하기에 충분하고 큰 시트도 읽는 양이 일정함
+        sample_max_row = min(max_row, min_row + 99)
+        width = max_col - min_col + 1
+        total_cells = (sample_max_row - min_row + 1) * width
         non_empty_cells = 0
         
         # 샘플링으로 밀도 확인 (성능 최적화)
+        # 샘플 위치는 0, step, 2×step, ... 으로 샘플 범위 전체에 고르게 퍼뜨림
+        # (예전에는 앞쪽 sample_size개 셀 안에서만 step 간격으로 세고 sample_size로 나눠서
+        #  밀도가 step배 낮게 나왔음)
         sample_size = min(100, total_cells)
         step = max(1, total_cells // sample_size)
+        last_sample = step * (sample_size - 1)
         
-        current_cell = 0
-        for row in ws.iter_rows(min_row=min_row, max_row=max_row, 
+        next_sample = 0
+        row_start = 0  # 현재 행 첫 셀의 위치 (범위 안에서 행 우선 순서)
+        for row in ws.iter_rows(min_row=min_row, max_row=min_row + last_sample // width,
                                min_col=min_col, max_col=max_col, values_only=True):
-            for cell_value in row:
-                current_cell += 1
-                if current_cell % step == 0:  # 샘플링
-                    if cell_value is not None and str(cell_value).strip():
-                        non_empty_cells += 1
-                if current_cell >= sample_size:
-                    break
-            if current_cell >= sample_size:
-                break
+            row_end = row_start + width
+            while next_sample < row_end and next_sample <= last_sample:
+                offset = next_sample - row_start
+                cell_value = row[offset] if offset < len(row) else None
+                if cell_value is not None and str(cell_value).strip():
+                    non_empty_cells += 1
+                next_sample += step
+            row_start = row_end
         
         density = non_empty_cells / sample_size if sample_size > 0 else 0
         
         # 밀도가 30-80% 사이면 백데이터에 적합한 구조
         if 0.3 <= density <= 0.8:
-            return 0.9
+            density_score = 0.9
         elif 0.1 <= density <= 0.9:
-            return 0.6
+            density_score = 0.6
         else:
-            return 0.2
+            density_score = 0.2
             
     except Exception:
-        return 0.5
+        density_score = 0.5
+    
+    return structure_score, density_score
 
 def find_matching_worksheet(worksheet_name, current_files):
     """
@@ -296,21 +349,20 @@ def find_matching_worksheet(worksheet_name, current_files):
     """
     
     try:
-        from openpyxl import load_workbook
-        
         best_match = None
         best_confidence = 0.0
         
+        # 찾는 워크시트명 정리는 파일/시트마다 다시 하지 않도록 한 번만
+        target_lower = worksheet_name.lower()
+        clean_target_lower = _WHITESPACE_RE.sub('', worksheet_name).lower()
+        
         for file_path in current_files:
             try:
-                wb = load_workbook(file_path, read_only=True)
-                
-                for ws in wb.worksheets:
-                    current_sheet_name = ws.title
-                    
+                # Why 워크북을 열지 않는가?
+                # 시트 이름만 비교하므로 zip 안의 workbook.xml만 읽는 get_worksheet_names(캐시됨)로 충분함
+                for current_sheet_name in get_worksheet_names(file_path):
                     # 1. 정확한 매칭
                     if worksheet_name == current_sheet_name:
-                        wb.close()
                         return {
                             "file_path": file_path,
                             "sheet_name": current_sheet_name,
@@ -318,7 +370,7 @@ def find_matching_worksheet(worksheet_name, current_files):
                         }
                     
                     # 2. 대소문자 무시 매칭
-                    if worksheet_name.lower() == current_sheet_name.lower():
+                    if target_lower == current_sheet_name.lower():
                         if 0.95 > best_confidence:
                             best_match = {
                                 "file_path": file_path,
@@ -328,9 +380,8 @@ def find_matching_worksheet(worksheet_name, current_files):
                             best_confidence = 0.95
                     
                     # 3. 공백 제거 매칭
-                    clean_target = re.sub(r'\s+', '', worksheet_name)
-                    clean_current = re.sub(r'\s+', '', current_sheet_name)
-                    if clean_target.lower() == clean_current.lower():
+                    clean_current = _WHITESPACE_RE.sub('', current_sheet_name)
+                    if clean_target_lower == clean_current.lower():
                         if 0.9 > best_confidence:
                             best_match = {
                                 "file_path": file_path,
@@ -339,8 +390,6 @@ def find_matching_worksheet(worksheet_name, current_files):
                             }
                             best_confidence = 0.9
                 
-                wb.close()
-                
             except Exception as e:
                 print(f"[find_matching_worksheet] 경고: 파일 처리 오류 ({file_path}): {e}")
                 continue
@@ -351,6 +400,31 @@ def find_matching_worksheet(worksheet_name, current_files):
         print(f"[find_matching_worksheet] ❌ 매칭 실패: {e}")
         return None
 
+@lru_cache(maxsize=256)
+def _sheet_name_index(sheet_names):
+    """
+    시트 이름 튜플로 매칭용 조회표를 만듦:
+    (이름 집합, {소문자: 이름}, {정리된 소문자: 이름}, (유사도 비교할 이름, ...), (그 이름의 정리된 소문자, ...))
+    유사도 비교 대상은 정리 후 3글자 이상인 이름만
+    
+    Why 조회표를 만드는가?
+    정확/대소문자 무시/공백 제거 매칭은 시트를 하나씩 비교하지 않고 dict 조회 한 번으로 끝나고,
+    같은 파일의 시트 목록은 백데이터 워크시트마다 반복해서 조회되므로 만든 결과를 캐시함
+    (같은 키에 여러 시트가 걸리면 기존처럼 먼저 나온 시트를 씀)
+    """
+    by_lower = {}
+    by_clean = {}
+    similar_names = []
+    similar_keys = []
+    for name in sheet_names:
+        clean = _WS_CLEAN_RE.sub('', name).lower()
+        by_lower.setdefault(name.lower(), name)
+        by_clean.setdefault(clean, name)
+        if len(clean) > 2:
+            similar_names.append(name)
+            similar_keys.append(clean)
+    return frozenset(sheet_names), by_lower, by_clean, tuple(similar_names), tuple(similar_keys)
+
 def find_matching_worksheet_optimized(worksheet_name, current_files):
     """
     ⚡ 성능 최적화된 매칭 함수
@@ -374,9 +448,6 @@ def find_matching_worksheet_optimized(worksheet_name, current_files):
         return None
     
     try:
-        from openpyxl import load_workbook
-        import difflib
-        
         print(f"[find_matching_worksheet_optimized] '{worksheet_name}' 매칭 시작...")
         
         best_match = None
@@ -386,93 +457,124 @@ def find_matching_worksheet_optimized(worksheet_name, current_files):
         prioritized_files = []
         other_files = []
         
-        worksheet_clean = re.sub(r'[\s\-_]+', '', worksheet_name.lower())
+        # 파일명은 필터링과 로그 출력에 여러 번 쓰므로 한 번만 구해둠
+        basenames = {file_path: os.path.basename(file_path) for file_path in current_files}
+        
+        worksheet_clean = _WS_PREFILTER_RE.sub('', worksheet_name.lower())
+        # 찾는 워크시트명 정리는 시트마다 다시 하지 않도록 한 번만
+        target_lower = worksheet_name.lower()
+        clean_target = _WS_CLEAN_RE.sub('', worksheet_name)
+        clean_target_lower = clean_target.lower()
         
         for file_path in current_files:
-            filename = os.path.basename(file_path).lower()
-            filename_clean = re.sub(r'[\s\-_\.xlsx]+', '', filename)
+            filename = basenames[file_path].lower()
+            filename_clean = _FN_CLEAN_RE.sub('', filename)
             
             # 파일맅에 워크시트명이 포함되어 있으면 우선 처리
             if worksheet_clean in filename_clean or filename_clean in worksheet_clean:
                 prioritized_files.append(file_path)
-                print(f"[find_matching_worksheet_optimized]    🎯 1차 우선 파일: {os.path.basename(file_path)}")
+                print(f"[find_matching_worksheet_optimized]    🎯 1차 우선 파일: {basenames[file_path]}")
             else:
                 other_files.append(file_path)
         
         # 우선 파일들을 먼저 처리
         files_to_process = prioritized_files + other_files
         
-        for file_path in files_to_process:
+        # Why 시트 목록을 그룹별로 미리 읽는가?
+        # 파일마다 시트 목록을 읽는 시간은 대부분 디스크/네트워크 대기라서 get_worksheet_names_batch로
+        # 여러 파일을 스레드로 겹쳐 읽어 캐시에 채워두면, 아래 반복은 캐시 조회와 문자열 비교만 함
+        # 우선 파일에서 조기 종료하면 나머지 파일은 읽지 않도록 나머지 그룹은 차례가 올 때 읽음
+        get_worksheet_names_batch([fp for fp in prioritized_files if os.path.exists(fp)])
+        
+        for position, file_path in enumerate(files_to_process):
+            if position == len(prioritized_files):
+                get_worksheet_names_batch([fp for fp in other_files if os.path.exists(fp)])
+            
             try:
-                print(f"[find_matching_worksheet_optimized]    파일 처리 중: {os.path.basename(file_path)}")
+                print(f"[find_matching_worksheet_optimized]    파일 처리 중: {basenames[file_path]}")
                 
                 # 파일 존재 여부만 체크 (os.access는 클라우드 동기화에서 부정확할 수 있음)
                 if not os.path.exists(file_path):
                     print(f"[find_matching_worksheet_optimized]    파일이 존재하지 않음: {file_path}")
                     continue
                 
-                # 파일 잠금 및 대기 시간 처리
-                try:
-                    wb = load_workbook(file_path, read_only=True)
-                except PermissionError:
-                    print(f"[find_matching_worksheet_optimized]    파일 잠김 (사용 중): {os.path.basename(file_path)}")
-                    continue
-                except Exception as file_error:
-                    print(f"[find_matching_worksheet_optimized]    파일 로드 오류: {os.path.basename(file_path)} - {file_error}")
+                # Why 워크북을 열지 않고 시트 목록만 가져오는가?
+                # 백데이터 워크시트마다 이 함수가 호출되므로 매번 파일을 열면 (워크시트 수 × 파일 수)만큼
+                # 파싱하게 됨. get_worksheet_names는 (경로, 수정 시각, 크기)로 캐시되어 파일당 한 번만 읽음
+                # (잠긴 파일 등 읽기 실패는 get_worksheet_names가 알리고 빈 목록을 반환)
+                sheet_names = get_worksheet_names(file_path)
+                if not sheet_names:
+                    print(f"[find_matching_worksheet_optimized]    시트 목록을 읽을 수 없음: {basenames[file_path]}")
                     continue
                 
-                for ws in wb.worksheets:
-                    current_sheet_name = ws.title
-                    
-                    # 1. 정확한 매칭 (100%)
-                    if worksheet_name == current_sheet_name:
-                        wb.close()
-                        print(f"[find_matching_worksheet_optimized]    🎆 정확한 매칭 발견: {current_sheet_name}")
-                        return {
-                            "file_path": file_path,
-                            "sheet_name": current_sheet_name,
-                            "confidence": 1.0
-                        }
-                    
-                    # 2. 대소문자 무시 매칭 (95%)
-                    if worksheet_name.lower() == current_sheet_name.lower():
-                        if 0.95 > best_confidence:
-                            best_match = {
-                                "file_path": file_path,
-                                "sheet_name": current_sheet_name,
-                                "confidence": 0.95
-                            }
-                            best_confidence = 0.95
-                            print(f"[find_matching_worksheet_optimized]    🔤 대소문자 무시 매칭: {current_sheet_name} (95%)")
+                exact_names, by_lower, by_clean, similar_names, similar_keys = _sheet_name_index(tuple(sheet_names))
+                
+                # 1. 정확한 매칭 (100%)
+                if worksheet_name in exact_names:
+                    print(f"[find_matching_worksheet_optimized]    🎆 정확한 매칭 발견: {worksheet_name}")
+                    return {
+                        "file_path": file_path,
+                        "sheet_name": worksheet_name,
+                        "confidence": 1.0
+                    }
+                
+                # 2. 대소문자 무시 매칭 (95%)
+                current_sheet_name = by_lower.get(target_lower)
+                if current_sheet_name is not None and 0.95 > best_confidence:
+                    best_match = {
+                        "file_path": file_path,
+                        "sheet_name": current_sheet_name,
+                        "confidence": 0.95
+                    }
+                    best_confidence = 0.95
+                    print(f"[find_matching_worksheet_optimized]    🔤 대소문자 무시 매칭: {current_sheet_name} (95%)")
+                
+                # 3. 공백/특수문자 제거 매칭 (90%)
+                current_sheet_name = by_clean.get(clean_target_lower)
+                if current_sheet_name is not None and 0.9 > best_confidence:
+                    best_match = {
+                        "file_path": file_path,
+                        "sheet_name": current_sheet_name,
+                        "confidence": 0.9
+                    }
+                    best_confidence = 0.9
+                    print(f"[find_matching_worksheet_optimized]    🧽 공백 제거 매칭: {current_sheet_name} (90%)")
+                
+                # 4. 유사도 기반 매칭 (85% 이상)
+                # Why 90% 이상이 이미 있으면 건너뛰는가? 유사도 점수는 최대 86%라서 결과를 바꿀 수 없음
+                if best_confidence < 0.9 and len(clean_target) > 2 and similar_keys:
+                    # 파일 안에서 가장 유사한 시트 하나만 찾음 (동점이면 먼저 나온 시트)
+                    if fuzz_process is not None:
+                        hit = fuzz_process.extractOne(clean_target_lower, similar_keys,
+                                                      scorer=fuzz.ratio, score_cutoff=85)
+                        best_similar = (hit[1] / 100, hit[2]) if hit else None
+                    else:
+                        import difflib
+                        best_similar = None
+                        target_len = len(clean_target_lower)
+                        for idx, clean_current in enumerate(similar_keys):
+                            # Why 길이부터 보는가? 길이 차이만큼은 반드시 어긋나므로 유사도는
+                            # 2 × 짧은 길이 / 두 길이 합을 넘을 수 없음 → 85%에 못 미치면 비교 생략
+                            # (rapidfuzz는 score_cutoff로 같은 걸러내기를 내부에서 함)
+                            current_len = len(clean_current)
+                            if 2 * min(target_len, current_len) < 0.85 * (target_len + current_len):
+                                continue
+                            similarity = difflib.SequenceMatcher(None, clean_target_lower, clean_current).ratio()
+                            if similarity >= 0.85 and (best_similar is None or similarity > best_similar[0]):
+                                best_similar = (similarity, idx)
                     
-                    # 3. 공백/특수문자 제거 매칭 (90%)
-                    clean_target = re.sub(r'[\s\-_　]+', '', worksheet_name)
-                    clean_current = re.sub(r'[\s\-_　]+', '', current_sheet_name)
-                    if clean_target.lower() == clean_current.lower():
-                        if 0.9 > best_confidence:
+                    if best_similar:
+                        similarity, idx = best_similar
+                        confidence_score = 0.8 + (similarity - 0.85) * 0.4  # 0.8-0.86 범위
+                        if confidence_score > best_confidence:
+                            current_sheet_name = similar_names[idx]
                             best_match = {
                                 "file_path": file_path,
                                 "sheet_name": current_sheet_name,
-                                "confidence": 0.9
+                                "confidence": confidence_score
                             }
-                            best_confidence = 0.9
-                            print(f"[find_matching_worksheet_optimized]    🧽 공백 제거 매칭: {current_sheet_name} (90%)")
-                    
-                    # 4. 유사도 기반 매칭 (85% 이상)
-                    if len(clean_target) > 2 and len(clean_current) > 2:
-                        similarity = difflib.SequenceMatcher(None, clean_target.lower(), clean_current.lower()).ratio()
-                        if similarity >= 0.85:
-                            confidence_score = 0.8 + (similarity - 0.85) * 0.4  # 0.8-0.84 범위
-                            if confidence_score > best_confidence:
-                                best_match = {
-                                    "file_path": file_path,
-                                    "sheet_name": current_sheet_name,
-                                    "confidence": confidence_score
-                                }
-                                best_confidence = confidence_score
-                                print(f"[find_matching_worksheet_optimized]    📊 유사도 매칭: {current_sheet_name} ({confidence_score:.1%})")
-                
-                wb.close()
+                            best_confidence = confidence_score
+                            print(f"[find_matching_worksheet_optimized]    📊 유사도 매칭: {current_sheet_name} ({confidence_score:.1%})")
                 
                 # 우선 파일에서 좋은 매칭을 찾았으면 조기 종료
                 if file_path in prioritized_files and best_confidence >= 0.9:
@@ -480,7 +582,7 @@ def find_matching_worksheet_optimized(worksheet_name, current_files):
                     break
                 
             except Exception as e:
-                print(f"[find_matching_worksheet_optimized]    파일 처리 오류 ({os.path.basename(file_path)}): {e}")
+                print(f"[find_matching_worksheet_optimized]    파일 처리 오류 ({basenames[file_path]}): {e}")
                 continue
         
         # 결과 반환
@@ -521,6 +623,12 @@ def copy_backdata_worksheets_corrected(backdata_worksheets, target_file, source_
     print(f"[copy_backdata_worksheets_corrected] 🎯 타곃: {target_file}")
     print(f"[copy_backdata_worksheets_corrected] 📁 소스: {len(source_files)}개 당기 PBC 파일")
     
+    # 소스 파일들의 시트 목록을 미리 동시에 읽어 캐시에 채워둠
+    # (워크시트별 매칭은 이후 캐시된 목록으로 문자열 비교만 함)
+    get_worksheet_names_batch(source_files)
+    
+    matched_worksheets = []  # [(전기 조서 워크시트명, 매칭 정보), ...]
+    
     for worksheet_info in backdata_worksheets:
         worksheet_name = worksheet_info['name']
         confidence = worksheet_info['confidence']
@@ -535,38 +643,43 @@ def copy_backdata_worksheets_corrected(backdata_worksheets, target_file, source_
             results["no_source"].append(worksheet_name)
             continue
         
-        source_file = source_match['file_path']
-        source_sheet = source_match['sheet_name']
-        match_confidence = source_match['confidence']
-        
-        print(f"[copy_backdata_worksheets_corrected]    🎯 매칭 발견: {source_sheet} (PBC: {os.path.basename(source_file)}, 신뢰도: {match_confidence:.1%})")
-        
-        # 2단계: 올바른 방향 복사 실행 (당기 PBC → 전기 조서)
+        print(f"[copy_backdata_worksheets_corrected]    🎯 매칭 발견: {source_match['sheet_name']} (PBC: {os.path.basename(source_match['file_path'])}, 신뢰도: {source_match['confidence']:.1%})")
+        matched_worksheets.append((worksheet_name, source_match))
+    
+    # 2단계: 올바른 방향 복사 실행 (당기 PBC → 전기 조서)
+    # Why 매칭을 모두 끝낸 뒤 한 번에 복사하는가?
+    # 워크시트마다 worksheet_full_replace를 부르면 전기 조서를 시트 수만큼 열고 저장하므로
+    # worksheets_full_replace로 전기 조서는 한 번만 열고 저장하며, 같은 PBC 파일도 한 번만 엶
+    if matched_worksheets:
         try:
-            success = worksheet_full_replace(
-                source_file=source_file,      # 당기 PBC 파일 (소스)
-                source_sheet=source_sheet,    # 당기 PBC 워크시트 (소스)
-                target_file=target_file,      # 전기 조서 파일 (타곃)
-                target_sheet=worksheet_name,  # 전기 조서 워크시트 (타곃)
-                preserve_formulas=False       # 값 복사 (수식 보존 안함)
+            replaced = worksheets_full_replace(
+                [(source_match['file_path'],        # 당기 PBC 파일 (소스)
+                  source_match['sheet_name'],       # 당기 PBC 워크시트 (소스)
+                  worksheet_name)                   # 전기 조서 워크시트 (타곃)
+                 for worksheet_name, source_match in matched_worksheets],
+                target_file=target_file,            # 전기 조서 파일 (타곃)
+                preserve_formulas=False             # 값 복사 (수식 보존 안함)
             )
+        except Exception as e:
+            print(f"[copy_backdata_worksheets_corrected]    ❌ 복사 중 오류: {e}")
+            replaced = {}
+        
+        for worksheet_name, source_match in matched_worksheets:
+            source_file = source_match['file_path']
+            source_sheet = source_match['sheet_name']
             
-            if success:
+            if replaced.get(worksheet_name):
                 print(f"[copy_backdata_worksheets_corrected]    ✅ 복사 성공: {source_sheet} ({os.path.basename(source_file)}) → {worksheet_name} (전기조서)")
                 results["success"].append({
                     "source": source_sheet,
                     "source_file": source_file,
                     "target": worksheet_name,
                     "target_file": target_file,
-                    "confidence": match_confidence
+                    "confidence": source_match['confidence']
                 })
             else:
                 print(f"[copy_backdata_worksheets_corrected]    ❌ 복사 실패: {worksheet_name}")
                 results["failed"].append(worksheet_name)
-                
-        except Exception as e:
-            print(f"[copy_backdata_worksheets_corrected]    ❌ 복사 중 오류: {worksheet_name} - {e}")
-            results["failed"].append(worksheet_name)
     
     # 결과 요약
     success_count = len(results["success"])
@@ -824,6 +937,10 @@ def main():
             print("다른 폴더를 선택해주세요.")
             return
         
+        # 왜 UI를 띄우기 전에 워크시트 목록을 미리 읽는가?
+        # 파일 수가 많으면 하나씩 여는 동안 대부분 I/O 대기이므로 한 번에 병렬로 읽어 캐시에 올려둠
+        get_worksheet_names_batch(current_files)
+        
         # 3단계: 선택 사항 요약 및 Roll-Forwarding 확인
         show_selection_summary(previous_file, current_folder, current_files)
         
@@ -973,7 +1090,11 @@ def main():
             print("[main.main]    💡 프로세스 B 대상 테이블의 모든 셀을 빨간색으로 표시합니다")
             print("[main.main]    💡 이후 롤포워딩 성공시 초록색으로, 실패시 빨간색 유지됩니다")
             
-            red_cells_info = mark_back_data_red(previous_file, remaining_back_data_worksheets, previous_tables)
+            # 대상 셀만 먼저 확인하고, 색상은 5단계 상태 업데이트에서 한 번에 칠해서 저장
+            # (여기서 칠하고 저장하면 전기 조서를 한 번 더 열고 저장하게 됨)
+            # 이후 단계(데이터 복사, 상태 업데이트)가 같은 파일을 저장하므로 권한은 여기서 한 번만 확인
+            ensure_writable(previous_file)
+            red_cells_info = mark_back_data_red(previous_file, remaining_back_data_worksheets, previous_tables, paint=False)
             total_marked_cells = sum(len(cells) for cells in red_cells_info.values())
             print(f"[main.main]    ✅ 롤포워딩 대상으로 표시된 셀 수: {total_marked_cells:,}개")
             
@@ -1008,9 +1129,9 @@ def main():
             # 전기 조서의 "매출액" 컬럼이 당기 파일의 어느 컬럼에 해당하는지 알아야
             # 정확한 위치에 데이터를 복사할 수 있기 때문
             
-            # current_folder + current_file은 문자열을 합치는 것
-            # 예: "test_files/current_folder/" + "workpaper1.xlsx" = "test_files/current_folder/workpaper1.xlsx"
-            matches = match_headers(previous_tables, current_folder + current_file)
+            # current_file은 get_excel_files_in_folder()가 돌려준 전체 경로
+            # 예: "test_files/current_folder/workpaper1.xlsx"
+            matches = match_headers(previous_tables, current_file)
             
             # =================================================================
             # 4단계: 실제 파일 업데이트 (데이터 복사)
@@ -1023,7 +1144,7 @@ def main():
                 # 올바른 데이터 흐름: Current PBC → 백데이터 sheets
                 # current_pbc_path: 당기 PBC 파일 (소스)
                 # previous_file: 전기 조서 파일 (백데이터 시트가 있는 대상)
-                current_pbc_path = current_folder + current_file
+                current_pbc_path = current_file
                 success = update_file(matches, current_pbc_path, previous_file)
                 
                 # 왜 삼항 연산자를 사용하는가?
@@ -1056,7 +1177,7 @@ def main():
             failed_table_matches = []  # 테이블 매칭 실패 정보 수집
             
             for current_file in current_files:
-                matches = match_headers(previous_tables, current_folder + current_file)
+                matches = match_headers(previous_tables, current_file)
                 if matches:
                     successful_matches.extend(matches)
                     print(f"[main.main]    ✅ 테이블 매칭 성공: {os.path.basename(current_file)} ({len(matches)}개)")
@@ -1067,13 +1188,13 @@ def main():
             print(f"[main.main]    📊 총 성공한 헤더 매칭: {len(successful_matches)}개")
             
             # 상태 업데이트: 성공 → 초록색, 실패 → 빨간색 유지
-            update_rollforward_status(previous_file, red_cells_info, successful_matches)
+            status_result = update_rollforward_status(previous_file, red_cells_info, successful_matches)
             
             # 지능형 수동 조정 리포트 생성
             print("[main.main] 📋 수동 조정 리포트 생성 중...")
             print("[main.main]    💡 실패 원인 분석 및 해결 가이드 제공")
             
-            report = generate_manual_adjustment_report(previous_file, red_cells_info, successful_matches)
+            report = generate_manual_adjustment_report(status_result['manual_adjustment_needed'])
             
             if report:
                 print("\n" + "="*70)
@@ -1156,7 +1277,7 @@ def main():
                     log_data['table_results'].append({
                         'target_worksheet': match.get('from_table', {}).get('sheet', 'N/A'),
                         'target_table_range': f"Row {match.get('from_table', {}).get('start_row', 'N/A')}",
-                        'source_file': os.path.basename(current_folder + match.get('to_table', {}).get('file', 'N/A')),
+                        'source_file': os.path.basename(match.get('to_table', {}).get('file', 'N/A')),
                         'source_worksheet': match.get('to_table', {}).get('sheet', 'N/A'),
                         'source_table_range': f"Row {match.get('to_table', {}).get('start_row', 'N/A')}",
                         'matched_headers': f"{match.get('from_header', 'N/A')} ↔ {match.get('to_header', 'N/A')}",
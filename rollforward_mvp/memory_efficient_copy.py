@@ -49,7 +49,10 @@ def simple_values_only_copy(source_file, source_sheet, target_file, target_sheet
         target_ws = target_wb[target_sheet]
         
         # 기존 내용 모두 삭제
-        target_ws.delete_rows(1, target_ws.max_row)
+        # 왜 delete_rows가 아닌가? 시트 전체 교체라 셀을 한 칸씩 옮길 필요가 없다
+        # (append가 1행부터 쓰도록 시작 행도 함께 초기화)
+        target_ws._cells.clear()
+        target_ws._current_row = 0
         
         # 값만 간단하게 복사 (가장 빠른 방식)
         for row in source_ws.values:
@@ -62,6 +65,122 @@ def simple_values_only_copy(source_file, source_sheet, target_file, target_sheet
         logger.error(f"Values only copy 실패: {str(e)}")
         return False
 
+def _copy_worksheet_contents(source_ws, target_ws):
+    """
+    target_ws의 내용을 source_ws로 완전히 교체 (값, 서식, 병합, 행/열 크기, 시트 속성)
+    
+    셀 복사 중 오류는 그대로 올라가므로 호출한 쪽에서 원래 셀을 복구해야 함
+    (부가 속성 복사 실패는 경고만 남기고 계속 진행)
+    """
+    # 완전한 워크시트 복사 (Ctrl+A, Ctrl+C, Ctrl+V와 동일)
+    logger.info(f"🎯 전체 워크시트 복사 시작...")
+    
+    # 기존 타겟 워크시트 내용 완전 삭제
+    # 왜 _cells를 비우는가? 시트 전체 교체에서 delete_rows/delete_cols는 셀을 하나씩 옮기기만 한다
+    # (append가 1행부터 쓰도록 시작 행도 함께 초기화)
+    target_ws._cells.clear()
+    target_ws._current_row = 0
+    
+    # 값은 행 단위 append로 복사 (셀별 좌표 조회/할당보다 빠름)
+    logger.info(f"📋 행 단위 데이터 복사 중...")
+    for row_values in source_ws.values:
+        target_ws.append(row_values)
+    
+    # 서식/하이퍼링크/주석은 실제로 가진 셀만 복사 (완전한 서식 보존)
+    # 왜 _cells인가? 사용 범위 전체를 iter_rows로 돌면 빈 셀까지 양쪽 시트에 생성된다
+    logger.info(f"🎨 셀 서식 복사 중...")
+    for (row_idx, col_idx), source_cell in list(source_ws._cells.items()):
+        if not (source_cell.has_style or source_cell.hyperlink or source_cell.comment):
+            continue
+        target_cell = target_ws.cell(row=row_idx, column=col_idx)
+    
+        # 셀 서식 완전 복사
+        if source_cell.has_style:
+            # 숫자 형식 (날짜, 비율, 통화 등)
+            target_cell.number_format = source_cell.number_format
+    
+            # 폰트 서식
+            target_cell.font = copy(source_cell.font)
+    
+            # 테두리 서식
+            target_cell.border = copy(source_cell.border)
+    
+            # 채우기/배경색 서식
+            target_cell.fill = copy(source_cell.fill)
+    
+            # 정렬 서식
+            target_cell.alignment = copy(source_cell.alignment)
+    
+            # 보호 설정
+            target_cell.protection = copy(source_cell.protection)
+    
+        # 하이퍼링크 복사
+        if source_cell.hyperlink:
+            target_cell.hyperlink = copy(source_cell.hyperlink)
+    
+        # 주석/메모 복사
+        if source_cell.comment:
+            target_cell.comment = copy(source_cell.comment)
+    
+    # 행/열 차원 정보 복사
+    target_ws.column_dimensions = source_ws.column_dimensions.copy()
+    target_ws.row_dimensions = source_ws.row_dimensions.copy()
+    
+    # 병합된 셀 복사
+    target_ws.merged_cells.ranges = list(source_ws.merged_cells.ranges)
+    
+    # 추가 속성 복사 (모든 서식 보존)
+    try:
+        # 조건부 서식
+        if hasattr(source_ws, 'conditional_formatting'):
+            target_ws.conditional_formatting = copy(source_ws.conditional_formatting)
+    
+        # 데이터 유효성 검사
+        if hasattr(source_ws, 'data_validations'):
+            target_ws.data_validations = copy(source_ws.data_validations)
+    
+        # 워크시트 보호
+        if hasattr(source_ws, 'protection'):
+            target_ws.protection = copy(source_ws.protection)
+    
+        # 페이지 설정
+        if hasattr(source_ws, 'page_setup'):
+            target_ws.page_setup = copy(source_ws.page_setup)
+        if hasattr(source_ws, 'page_margins'):
+            target_ws.page_margins = copy(source_ws.page_margins)
+        if hasattr(source_ws, 'print_options'):
+            target_ws.print_options = copy(source_ws.print_options)
+    
+        # 워크시트 뷰 설정 (읽기 전용 속성들은 스킵)
+        try:
+            if hasattr(source_ws, 'sheet_view') and hasattr(target_ws.__class__, 'sheet_view') and hasattr(target_ws.__class__.sheet_view, 'fset'):
+                target_ws.sheet_view = copy(source_ws.sheet_view)
+        except (AttributeError, TypeError):
+            pass  # 읽기 전용 속성
+    
+        try:
+            if hasattr(source_ws, 'views'):
+                target_ws.views = copy(source_ws.views)
+        except (AttributeError, TypeError):
+            pass  # 읽기 전용 속성
+    
+        # 기타 워크시트 속성
+        if hasattr(source_ws, 'sheet_format'):
+            target_ws.sheet_format = copy(source_ws.sheet_format)
+        if hasattr(source_ws, 'sheet_properties'):
+            target_ws.sheet_properties = copy(source_ws.sheet_properties)
+        if hasattr(source_ws, 'auto_filter'):
+            target_ws.auto_filter = copy(source_ws.auto_filter)
+        if hasattr(source_ws, 'freeze_panes'):
+            target_ws.freeze_panes = source_ws.freeze_panes
+    
+        logger.info(f"✅ 모든 서식 속성 복사 완료")
+    
+    except Exception as attr_error:
+        logger.warning(f"⚠️ 일부 속성 복사 실패 (계속 진행): {attr_error}")
+    
+    logger.info(f"✅ 워크시트 내용 교체 완료")
+
 def worksheet_full_replace(source_file, source_sheet, target_file, target_sheet, preserve_formulas=True):
     """
     ✅ 강화된 워크시트 교체 함수
@@ -142,7 +261,8 @@ def worksheet_full_replace(source_file, source_sheet, target_file, target_sheet,
         try:
             # 임시 백업 (복구용) - 작업 실패 시 즉시 복원용
             temp_backup = target_file + ".temp_backup_" + str(int(time.time()))
-            shutil.copy2(target_file, temp_backup)
+            # 복구에는 파일 내용만 필요하므로 메타데이터 복사 없이 내용만 복사
+            shutil.copyfile(target_file, temp_backup)
             
             logger.info(f"🔄 작업용 임시 백업 생성: {temp_backup}")
             backup_file = temp_backup
@@ -198,113 +318,7 @@ def worksheet_full_replace(source_file, source_sheet, target_file, target_sheet,
         original_cells = target_ws._cells.copy()
         
         try:
-            # 완전한 워크시트 복사 (Ctrl+A, Ctrl+C, Ctrl+V와 동일)
-            logger.info(f"🎯 전체 워크시트 복사 시작...")
-            
-            # 기존 타겟 워크시트 내용 완전 삭제
-            target_ws.delete_rows(1, target_ws.max_row or 1)
-            target_ws.delete_cols(1, target_ws.max_column or 1)
-            
-            # 모든 셀 데이터와 서식을 개별적으로 복사 (완전한 서식 보존)
-            logger.info(f"📋 셀별 데이터 및 서식 복사 중...")
-            
-            # 소스 워크시트의 사용된 범위 확인
-            if source_ws.max_row and source_ws.max_column:
-                for row in source_ws.iter_rows(min_row=1, max_row=source_ws.max_row, 
-                                             min_col=1, max_col=source_ws.max_column):
-                    for source_cell in row:
-                        if source_cell.coordinate:
-                            target_cell = target_ws[source_cell.coordinate]
-                            
-                            # 셀 값 복사
-                            target_cell.value = source_cell.value
-                            
-                            # 셀 서식 완전 복사
-                            if source_cell.has_style:
-                                # 숫자 형식 (날짜, 비율, 통화 등)
-                                target_cell.number_format = source_cell.number_format
-                                
-                                # 폰트 서식
-                                target_cell.font = copy(source_cell.font)
-                                
-                                # 테두리 서식
-                                target_cell.border = copy(source_cell.border)
-                                
-                                # 채우기/배경색 서식
-                                target_cell.fill = copy(source_cell.fill)
-                                
-                                # 정렬 서식
-                                target_cell.alignment = copy(source_cell.alignment)
-                                
-                                # 보호 설정
-                                target_cell.protection = copy(source_cell.protection)
-                            
-                            # 하이퍼링크 복사
-                            if source_cell.hyperlink:
-                                target_cell.hyperlink = copy(source_cell.hyperlink)
-                            
-                            # 주석/메모 복사
-                            if source_cell.comment:
-                                target_cell.comment = copy(source_cell.comment)
-            
-            # 행/열 차원 정보 복사
-            target_ws.column_dimensions = source_ws.column_dimensions.copy()
-            target_ws.row_dimensions = source_ws.row_dimensions.copy()
-            
-            # 병합된 셀 복사
-            target_ws.merged_cells.ranges = list(source_ws.merged_cells.ranges)
-            
-            # 추가 속성 복사 (모든 서식 보존)
-            try:
-                # 조건부 서식
-                if hasattr(source_ws, 'conditional_formatting'):
-                    target_ws.conditional_formatting = copy(source_ws.conditional_formatting)
-                
-                # 데이터 유효성 검사
-                if hasattr(source_ws, 'data_validations'):
-                    target_ws.data_validations = copy(source_ws.data_validations)
-                
-                # 워크시트 보호
-                if hasattr(source_ws, 'protection'):
-                    target_ws.protection = copy(source_ws.protection)
-                
-                # 페이지 설정
-                if hasattr(source_ws, 'page_setup'):
-                    target_ws.page_setup = copy(source_ws.page_setup)
-                if hasattr(source_ws, 'page_margins'):
-                    target_ws.page_margins = copy(source_ws.page_margins)
-                if hasattr(source_ws, 'print_options'):
-                    target_ws.print_options = copy(source_ws.print_options)
-                
-                # 워크시트 뷰 설정 (읽기 전용 속성들은 스킵)
-                try:
-                    if hasattr(source_ws, 'sheet_view') and hasattr(target_ws.__class__, 'sheet_view') and hasattr(target_ws.__class__.sheet_view, 'fset'):
-                        target_ws.sheet_view = copy(source_ws.sheet_view)
-                except (AttributeError, TypeError):
-                    pass  # 읽기 전용 속성
-                    
-                try:
-                    if hasattr(source_ws, 'views'):
-                        target_ws.views = copy(source_ws.views)
-                except (AttributeError, TypeError):
-                    pass  # 읽기 전용 속성
-                
-                # 기타 워크시트 속성
-                if hasattr(source_ws, 'sheet_format'):
-                    target_ws.sheet_format = copy(source_ws.sheet_format)
-                if hasattr(source_ws, 'sheet_properties'):
-                    target_ws.sheet_properties = copy(source_ws.sheet_properties)
-                if hasattr(source_ws, 'auto_filter'):
-                    target_ws.auto_filter = copy(source_ws.auto_filter)
-                if hasattr(source_ws, 'freeze_panes'):
-                    target_ws.freeze_panes = source_ws.freeze_panes
-                    
-                logger.info(f"✅ 모든 서식 속성 복사 완료")
-                    
-            except Exception as attr_error:
-                logger.warning(f"⚠️ 일부 속성 복사 실패 (계속 진행): {attr_error}")
-            
-            logger.info(f"✅ 워크시트 내용 교체 완료")
+            _copy_worksheet_contents(source_ws, target_ws)
             
         except Exception as copy_error:
             logger.error(f"❌ 워크시트 내용 복사 실패: {copy_error}")
@@ -365,7 +379,7 @@ def worksheet_full_replace(source_file, source_sheet, target_file, target_sheet,
         # 백업 파일로 복구 시도
         if backup_file and os.path.exists(backup_file):
             try:
-                shutil.copy2(backup_file, target_file)
+                shutil.copyfile(backup_file, target_file)
                 logger.info(f"🔄 백업 파일로 복구 완료")
                 os.remove(backup_file)
             except Exception as recovery_error:
@@ -381,4 +395,176 @@ def worksheet_full_replace(source_file, source_sheet, target_file, target_sheet,
             if 'target_wb' in locals() and target_wb:
                 target_wb.close()
         except Exception:
-            pass
\ No newline at end of file
+            pass
+
+
+def worksheets_full_replace(replacements, target_file, preserve_formulas=True):
+    """
+    여러 워크시트를 한 타겟 파일에 한 번에 교체 (worksheet_full_replace의 일괄 버전)
+    
+    Why 일괄 버전이 필요한가?
+    worksheet_full_replace는 시트 하나마다 타겟 파일 전체를 열고 저장하므로,
+    백데이터 시트가 N개면 같은 전기 조서를 N번 읽고 N번 저장하게 됨
+    여기서는 타겟을 한 번 열어 모든 시트를 교체하고 한 번만 저장하며,
+    같은 소스 파일에서 여러 시트를 가져오면 소스 워크북도 한 번만 엶
+    
+    Args:
+        replacements: [(소스 파일 경로, 소스 시트명, 타겟 시트명), ...]
+        target_file: 타겟 파일 경로
+        preserve_formulas: 수식 보존 여부 (기본값 True)
+        
+    Returns:
+        dict: {타겟 시트명: 성공 여부}
+    """
+    from pathlib import Path
+    
+    results = {target_sheet: False for _, _, target_sheet in replacements}
+    if not replacements:
+        return results
+    
+    source_wbs = {}
+    target_wb = None
+    backup_file = None
+    
+    def restore_from_backup():
+        # 저장 도중 실패하면 타겟 파일이 깨졌을 수 있으므로 임시 백업으로 되돌림
+        # 복구에 실패하면 임시 백업을 지우지 않고 남겨서 수동으로 되돌릴 수 있게 함
+        nonlocal backup_file
+        if backup_file and os.path.exists(backup_file):
+            try:
+                shutil.copyfile(backup_file, target_file)
+                logger.info(f"🔄 백업 파일로 복구 완료")
+            except Exception as recovery_error:
+                logger.error(f"❌ 백업 복구도 실패: {recovery_error} (임시 백업 보존: {backup_file})")
+                backup_file = None
+    
+    try:
+        # 임시 백업 (복구용) - 작업 실패 시 즉시 복원용 (worksheet_full_replace와 동일)
+        try:
+            temp_backup = target_file + ".temp_backup_" + str(int(time.time()))
+            shutil.copyfile(target_file, temp_backup)
+            logger.info(f"🔄 작업용 임시 백업 생성: {temp_backup}")
+            backup_file = temp_backup
+        except Exception as backup_error:
+            logger.warning(f"⚠️ 임시 백업 파일 생성 실패 (계속 진행): {backup_error}")
+        
+        try:
+            target_wb = load_workbook(target_file, data_only=False)
+            logger.info(f"📝 타겟 파일 로드 완료: {Path(target_file).name}")
+        except PermissionError as perm_error:
+            logger.error(f"❌ 파일 접근 권한 오류: {perm_error}")
+            logger.error("💡 해결방법: Excel에서 해당 파일들을 모두 닫고 다시 시도하세요")
+            return results
+        except Exception as load_error:
+            logger.error(f"❌ 파일 로드 오류: {load_error}")
+            return results
+        
+        replaced_any = False
+        for source_file, source_sheet, target_sheet in replacements:
+            logger.info(f"🔄 워크시트 교체: {source_sheet} ({Path(source_file).name}) → {target_sheet}")
+            
+            source_wb = source_wbs.get(source_file)
+            if source_wb is None:
+                try:
+                    source_wb = load_workbook(source_file, read_only=False, data_only=not preserve_formulas)
+                except Exception as load_error:
+                    logger.error(f"❌ 소스 파일 로드 오류: {source_file} - {load_error}")
+                    continue
+                source_wbs[source_file] = source_wb
+            
+            if source_sheet not in source_wb.sheetnames:
+                logger.error(f"❌ 소스 시트가 존재하지 않음: '{source_sheet}' (사용 가능: {source_wb.sheetnames})")
+                continue
+            if target_sheet not in target_wb.sheetnames:
+                logger.error(f"❌ 타겟 시트가 존재하지 않음: '{target_sheet}' (사용 가능: {target_wb.sheetnames})")
+                continue
+            
+            # Why 시트 종류를 확인하는가?
+            # 차트 시트는 셀(_cells)이 없어 내용을 복사하거나 되돌릴 수 없음
+            source_ws = source_wb[source_sheet]
+            target_ws = target_wb[target_sheet]
+            if not isinstance(source_ws, Worksheet):
+                logger.error(f"❌ 소스 시트가 워크시트가 아님 (차트 시트 등): '{source_sheet}'")
+                continue
+            if not isinstance(target_ws, Worksheet):
+                logger.error(f"❌ 타겟 시트가 워크시트가 아님 (차트 시트 등): '{target_sheet}'")
+                continue
+            
+            original_cells = None
+            try:
+                # 기존 내용 백업을 위한 임시 저장
+                original_cells = target_ws._cells.copy()
+                _copy_worksheet_contents(source_ws, target_ws)
+            except Exception as copy_error:
+                logger.error(f"❌ 워크시트 내용 복사 실패: {copy_error}")
+                # 원래 내용 복구 (다른 시트의 교체 결과는 유지)
+                if original_cells is not None:
+                    target_ws._cells = original_cells
+                continue
+            
+            results[target_sheet] = True
+            replaced_any = True
+        
+        if not replaced_any:
+            return results
+        
+        # 모든 교체가 끝난 뒤 한 번만 저장 (실패하면 이번 교체는 모두 실패로 처리)
+        try:
+            logger.info(f"💾 파일 저장 중...")
+            target_wb.save(target_file)
+            logger.info(f"✅ 파일 저장 완료: {Path(target_file).name}")
+        except PermissionError as perm_error:
+            logger.error(f"❌ 파일 저장 권한 오류: {perm_error}")
+            
+            # 권한 문제 해결 시도
+            try:
+                import stat
+                logger.warning(f"⚠️ 파일 저장 권한 문제 해결 시도: {target_file}")
+                
+                # 읽기 전용 속성 제거
+                os.chmod(target_file, stat.S_IWRITE | stat.S_IREAD)
+                
+                # 다시 저장 시도
+                target_wb.save(target_file)
+                logger.info(f"✅ 권한 문제 해결 후 파일 저장 완료: {Path(target_file).name}")
+                
+            except Exception as chmod_error:
+                logger.error(f"❌ 권한 문제 해결 실패: {chmod_error}")
+                logger.error("💡 해결방법:")
+                logger.error("   1. Excel에서 해당 파일을 닫고 다시 시도")
+                logger.error("   2. 파일 속성에서 '읽기 전용' 해제")
+                logger.error("   3. 파일이 있는 폴더의 쓰기 권한 확인")
+                restore_from_backup()
+                return {target_sheet: False for target_sheet in results}
+                
+        except Exception as save_error:
+            logger.error(f"❌ 파일 저장 실패: {save_error}")
+            logger.error("💡 해결방법: Excel에서 해당 파일을 닫고 다시 시도하세요")
+            restore_from_backup()
+            return {target_sheet: False for target_sheet in results}
+        
+        return results
+        
+    except Exception as e:
+        logger.error(f"❌ 워크시트 일괄 교체 중 예상치 못한 오류: {str(e)}")
+        
+        # 백업 파일로 복구 시도
+        restore_from_backup()
+        return {target_sheet: False for target_sheet in results}
+    
+    finally:
+        # 임시 백업 파일 정리 (영구 백업은 보존)
+        # 실패한 경우에도 타겟은 위에서 이미 복구되었거나 수정되지 않았으므로 지워도 됨
+        # (복구에 실패한 경우는 restore_from_backup이 backup_file을 비워 보존함)
+        if backup_file and os.path.exists(backup_file):
+            try:
+                os.remove(backup_file)
+                logger.info(f"🗑️ 임시 백업 파일 정리 완료")
+            except Exception:
+                logger.warning(f"⚠️ 임시 백업 파일 정리 실패: {backup_file}")
+        
+        # 리소스 정리
+        for source_wb in source_wbs.values():
+            source_wb.close()
+        if target_wb is not None:
+            target_wb.close()
@@ -12,6 +12,12 @@ from openpyxl.utils import get_column_letter
 
 logger = logging.getLogger(__name__)
 
+# 셀마다 새로 만들지 않고 공유하는 스타일 (스타일 표에서 하나로 합쳐지고 생성 비용도 한 번만 듦)
+LABEL_FONT = Font(bold=True)
+LABEL_FILL = PatternFill(start_color="FFE7E6E6", end_color="FFE7E6E6", fill_type="solid")    # 회색 (항목명)
+SUCCESS_FILL = PatternFill(start_color="FFC6EFCE", end_color="FFC6EFCE", fill_type="solid")  # 연두색 (성공)
+FAILURE_FILL = PatternFill(start_color="FFFFC7CE", end_color="FFFFC7CE", fill_type="solid")  # 연분홍색 (실패)
+
 def create_rollforward_log_worksheet(target_file, log_data):
     """
     롤포워딩 완료 후 로그 워크시트를 대상 조서에 생성
@@ -61,7 +67,7 @@ def create_rollforward_log_worksheet(target_file, log_data):
         log_sheet_name = f"RF_Log_{timestamp}"
         
         # 기존 로그 시트가 있으면 제거 (최신 로그만 유지)
-        existing_logs = [ws.title for ws in wb.worksheets if ws.title.startswith("RF_Log")]
+        existing_logs = [name for name in wb.sheetnames if name.startswith("RF_Log")]
         for old_log in existing_logs:
             if old_log in wb.sheetnames:
                 wb.remove(wb[old_log])
@@ -132,8 +138,8 @@ def _create_summary_section(ws, log_data, header_font, header_fill, border, cent
         ws.cell(row=current_row, column=2, value=row_data[1])
         
         # 스타일 적용
-        ws.cell(row=current_row, column=1).font = Font(bold=True)
-        ws.cell(row=current_row, column=1).fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
+        ws.cell(row=current_row, column=1).font = LABEL_FONT
+        ws.cell(row=current_row, column=1).fill = LABEL_FILL
         
         for col in range(1, 3):
             ws.cell(row=current_row, column=col).border = border
@@ -182,9 +188,9 @@ def _create_backdata_section(ws, log_data, header_font, header_fill, border, cen
             # 성공/실패 색상 적용
             if col == 6:  # 처리 결과 컬럼
                 if "성공" in str(data):
-                    cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+                    cell.fill = SUCCESS_FILL
                 else:
-                    cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+                    cell.fill = FAILURE_FILL
         
         current_row += 1
     
@@ -231,9 +237,9 @@ def _create_table_section(ws, log_data, header_font, header_fill, border, center
             # 성공/실패 색상 적용
             if col == 7:  # 처리 결과 컬럼
                 if "성공" in str(data):
-                    cell.fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+                    cell.fill = SUCCESS_FILL
                 else:
-                    cell.fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+                    cell.fill = FAILURE_FILL
         
         current_row += 1
     
@@ -265,7 +271,7 @@ def _create_details_section(ws, log_data, header_font, header_fill, border, cent
     current_row += 1
     stats = log_data.get('statistics', {})
     ws.cell(row=current_row, column=1, value="처리 통계:")
-    ws.cell(row=current_row, column=1).font = Font(bold=True)
+    ws.cell(row=current_row, column=1).font = LABEL_FONT
     current_row += 1
     
     stats_data = [